@@ -9,6 +9,11 @@ class Settings(BaseSettings):
     debug: bool = False
     mongo_uri: str = "mongodb://localhost:27017"
     mongo_db: str = "ai_assessment"
+    # Connection pool (per process; the DSA module keeps its own pool)
+    mongo_max_pool_size: int = 100
+    mongo_min_pool_size: int = 20  # Warm connections so bursts don't pay the TCP/TLS handshake
+    mongo_wait_queue_timeout_ms: int = 5000
+    mongo_compressors: str = "zstd,zlib"  # Wire compression; zstd needs the zstandard package
     jwt_secret: str = "change-me"
     jwt_algorithm: str = "HS256"  # Options: "HS256" or "RS256"
     jwt_exp_minutes: int = 60  # 1 hour (reduced from 7 days for security)
@@ -43,8 +48,19 @@ class Settings(BaseSettings):
     # Email provider selection: "sendgrid", "azure", or "aws"
     email_provider: str = "sendgrid"
     openai_api_key: str | None = None
+    openai_model: str = "gpt-4o-mini"  # Topic, classifier and Easy-only question calls
+    openai_question_model: str = "gpt-4o"  # Question generation with any Medium/Hard question
+    openai_grading_model: str = "gpt-3.5-turbo"  # Answer evaluation and time/score suggestions; changing it shifts scores
+    # Shared keep-alive pool for all OpenAI calls in this process
+    openai_max_connections: int = 200
+    openai_max_keepalive_connections: int = 100
+    openai_http2: bool = True  # Multiplex concurrent calls over one connection; needs the h2 package
+    openai_max_concurrency: int = 16  # In-flight chat completions per process; excess calls queue
+    openai_max_retries: int = 3  # SDK retries on 429/5xx, honoring Retry-After with jittered backoff
     otp_ttl_minutes: int = 5
     email_verification_code_ttl_minutes: int = 1
+    # Seconds a resolved user document is reused across requests (0 disables)
+    user_cache_ttl_seconds: int = 60
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
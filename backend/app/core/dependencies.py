@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Optional
+import copy
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from bson import ObjectId
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 
+from ..core.config import get_settings
 from ..core.security import TokenError, decode_token
 from ..db.mongo import get_db
 from ..utils.mongo import serialize_document
@@ -19,8 +22,30 @@ def _oauth_scheme(auto_error: bool) -> OAuth2PasswordBearer:
 oauth2_scheme = _oauth_scheme(auto_error=True)
 optional_oauth2_scheme = _oauth_scheme(auto_error=False)
 
+# user_id -> (expires_at, serialized user). FastAPI already resolves
+# get_current_user once per request; this avoids repeating the same
+# users.find_one across the many requests a dashboard refresh fires.
+# The cache is per worker process: every users write calls
+# invalidate_cached_user, which only clears this worker, so a role change
+# or deletion reaches other workers within user_cache_ttl_seconds. Set it
+# to 0 where that window is not acceptable.
+_user_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_USER_CACHE_MAX_ENTRIES = 10000
+
+
+def invalidate_cached_user(user_id: str) -> None:
+    """Drop a cached user so role/profile changes apply on the next request."""
+    _user_cache.pop(user_id, None)
+
+
+async def _fetch_user(db: AsyncDatabase, user_id: str) -> Dict[str, Any]:
+    ttl = get_settings().user_cache_ttl_seconds
+    now = time.monotonic()
+    cached = _user_cache.get(user_id)
+    if cached and cached[0] > now:
+        # Deep copy so callers can't mutate the shared entry's nested fields
+        return copy.deepcopy(cached[1])
 
-async def _fetch_user(db: AsyncIOMotorDatabase, user_id: str) -> Dict[str, Any]:
     try:
         oid = ObjectId(user_id)
     except Exception as exc:  # pragma: no cover - invalid ObjectId
@@ -32,12 +57,16 @@ async def _fetch_user(db: AsyncIOMotorDatabase, user_id: str) -> Dict[str, Any]:
     serialized = serialize_document(user)
     if not serialized:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    if ttl > 0:
+        if len(_user_cache) >= _USER_CACHE_MAX_ENTRIES:
+            _user_cache.clear()
+        _user_cache[user_id] = (now + ttl, copy.deepcopy(serialized))
     return serialized
 
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ) -> Dict[str, Any]:
     try:
         payload = decode_token(token)
@@ -54,7 +83,7 @@ async def get_current_user(
 
 async def get_optional_user(
     token: Optional[str] = Depends(optional_oauth2_scheme),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ) -> Optional[Dict[str, Any]]:
     if not token:
         return None
@@ -2,48 +2,69 @@ from __future__ import annotations
 
 from typing import AsyncGenerator
 
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
 
 from ..core.config import get_settings
 
 
-_client: AsyncIOMotorClient | None = None
-_db: AsyncIOMotorDatabase | None = None
+# $getField/$setField/$unsetField (candidate submit) and $lookup with both
+# localField/foreignField and a pipeline (org-admin listing) need MongoDB 5.0
+MIN_SERVER_VERSION = (5, 0)
+
+_client: AsyncMongoClient | None = None
+_db: AsyncDatabase | None = None
+_server_version: tuple[int, ...] = ()
 
 
 async def connect_to_mongo() -> None:
-    global _client, _db
+    global _client, _db, _server_version
     settings = get_settings()
     if _client is None:
         # Add connection timeout and server selection timeout to prevent hanging
-        # Configure connection pooling for high-volume requests (100k+)
-        _client = AsyncIOMotorClient(
+        # Pool size is tuned per deployment via MONGO_MAX_POOL_SIZE / MONGO_MIN_POOL_SIZE
+        _client = AsyncMongoClient(
             settings.mongo_uri,
             serverSelectionTimeoutMS=5000,  # 5 seconds to find a server
             connectTimeoutMS=10000,  # 10 seconds to connect
             socketTimeoutMS=30000,  # 30 seconds for socket operations
-            maxPoolSize=1000,  # Maximum number of connections in the pool (supports 100k+ requests)
-            minPoolSize=10,  # Minimum number of connections to maintain
-            maxIdleTimeMS=30000,  # Close connections idle for 30 seconds
-            waitQueueTimeoutMS=5000,  # Wait up to 5 seconds for a connection from the pool
+            maxPoolSize=settings.mongo_max_pool_size,  # Maximum number of connections in the pool
+            minPoolSize=settings.mongo_min_pool_size,  # Minimum number of connections to keep warm
+            maxIdleTimeMS=300000,  # Close connections idle for 5 minutes
+            waitQueueTimeoutMS=settings.mongo_wait_queue_timeout_ms,  # Max wait for a pooled connection
+            compressors=settings.mongo_compressors,  # Compress wire traffic (large answer/log documents)
         )
         _db = _client[settings.mongo_db]
         # Test the connection
         await _client.admin.command("ping")
+        build_info = await _client.admin.command("buildInfo")
+        _server_version = tuple(build_info["versionArray"][:2])
+        if _server_version < MIN_SERVER_VERSION:
+            raise RuntimeError(
+                f"MongoDB {build_info['version']} is not supported; "
+                f"{'.'.join(map(str, MIN_SERVER_VERSION))} or newer is required."
+            )
 
 
 async def close_mongo_connection() -> None:
     global _client
     if _client is not None:
-        _client.close()
+        await _client.close()
         _client = None
 
 
-def get_database() -> AsyncIOMotorDatabase:
+def get_server_version() -> tuple[int, ...]:
+    """(major, minor) of the connected MongoDB server."""
+    if not _server_version:
+        raise RuntimeError("MongoDB has not been initialized. Call connect_to_mongo() on startup.")
+    return _server_version
+
+
+def get_database() -> AsyncDatabase:
     if _db is None:
         raise RuntimeError("MongoDB has not been initialized. Call connect_to_mongo() on startup.")
     return _db
 
 
-async def get_db() -> AsyncGenerator[AsyncIOMotorDatabase, None]:
+async def get_db() -> AsyncGenerator[AsyncDatabase, None]:
     yield get_database()
@@ -15,6 +15,11 @@ class DSASettings(BaseSettings):
     # MongoDB Configuration (reads from .env)
     mongo_uri: str = "mongodb://localhost:27017"
     mongo_db: str = "ai_assessment"
+    # Connection pool (MONGO_MAX_POOL_SIZE etc., shared with the main app's .env)
+    mongo_max_pool_size: int = 100
+    mongo_min_pool_size: int = 20
+    mongo_wait_queue_timeout_ms: int = 5000
+    mongo_compressors: str = "zstd,zlib"
     
     # Judge0 Configuration
     # These fields will automatically read from environment variables:
@@ -3,12 +3,13 @@ DSA Module Database Adapter
 Uses MongoDB connection configured directly from .env file
 Reads MONGO_URI and MONGO_DB from environment variables
 """
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
 from app.dsa.config import get_dsa_settings
 from typing import Optional
 
-_dsa_client: Optional[AsyncIOMotorClient] = None
-_dsa_db: Optional[AsyncIOMotorDatabase] = None
+_dsa_client: Optional[AsyncMongoClient] = None
+_dsa_db: Optional[AsyncDatabase] = None
 
 
 async def connect_to_dsa_mongo() -> None:
@@ -18,15 +19,16 @@ async def connect_to_dsa_mongo() -> None:
     settings = get_dsa_settings()
     
     if _dsa_client is None:
-        _dsa_client = AsyncIOMotorClient(
+        _dsa_client = AsyncMongoClient(
             settings.mongo_uri,
             serverSelectionTimeoutMS=5000,
             connectTimeoutMS=10000,
             socketTimeoutMS=30000,
-            maxPoolSize=1000,
-            minPoolSize=10,
-            maxIdleTimeMS=30000,
-            waitQueueTimeoutMS=5000,
+            maxPoolSize=settings.mongo_max_pool_size,
+            minPoolSize=settings.mongo_min_pool_size,
+            maxIdleTimeMS=300000,
+            waitQueueTimeoutMS=settings.mongo_wait_queue_timeout_ms,
+            compressors=settings.mongo_compressors,
         )
         _dsa_db = _dsa_client[settings.mongo_db]
         # Test the connection
@@ -37,12 +39,12 @@ async def close_dsa_mongo_connection() -> None:
     """Close DSA MongoDB connection"""
     global _dsa_client, _dsa_db
     if _dsa_client is not None:
-        _dsa_client.close()
+        await _dsa_client.close()
         _dsa_client = None
         _dsa_db = None
 
 
-def get_dsa_database() -> AsyncIOMotorDatabase:
+def get_dsa_database() -> AsyncDatabase:
     """
     Get DSA database instance
     Reads MONGO_URI and MONGO_DB from .env file
@@ -92,8 +92,8 @@ async def diagnose_user_isolation():
         {"$sort": {"count": -1}},
         {"$limit": 10}
     ]
-    test_created_by_stats = await db.tests.aggregate(pipeline).to_list(length=10)
-    question_created_by_stats = await db.questions.aggregate(pipeline).to_list(length=10)
+    test_created_by_stats = await (await db.tests.aggregate(pipeline)).to_list(length=10)
+    question_created_by_stats = await (await db.questions.aggregate(pipeline)).to_list(length=10)
     
     print("\nTop 10 created_by values in tests:")
     for stat in test_created_by_stats:
@@ -220,9 +220,10 @@ async def get_tests(
     ]
     
     if active_only:
+        now = datetime.utcnow()
         base_conditions.append({"is_active": True})
-        base_conditions.append({"start_time": {"$lte": datetime.utcnow()}})
-        base_conditions.append({"end_time": {"$gte": datetime.utcnow()}})
+        base_conditions.append({"start_time": {"$lte": now}})
+        base_conditions.append({"end_time": {"$gte": now}})
     
     query = {"$and": base_conditions}
     
@@ -876,9 +877,10 @@ async def final_submit_test(
             total_score += score
     
     # Update test submission with final data
+    submitted_at = datetime.utcnow()
     update_data = {
         "is_completed": True,
-        "submitted_at": datetime.utcnow(),
+        "submitted_at": submitted_at,
         "submissions": final_submissions,
         "score": total_score,
         "activity_logs": request.activity_logs,
@@ -891,7 +893,7 @@ async def final_submit_test(
                 }
                 for q_sub in request.question_submissions
             ],
-            "submitted_at": datetime.utcnow().isoformat(),
+            "submitted_at": submitted_at.isoformat(),
         }
     }
     
@@ -10,6 +10,7 @@ Creates LeetCode-style questions with 3 parts:
 The admin specifies which languages to generate starter code for.
 """
 
+import asyncio
 import os
 import json
 import logging
@@ -148,7 +149,9 @@ IMPORTANT: Return ONLY valid JSON. No markdown code blocks, no explanations, jus
 
     try:
         client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        response = client.chat.completions.create(
+        # Sync client: run the call in a worker thread so it does not block the event loop
+        response = await asyncio.to_thread(
+            client.chat.completions.create,
             model="gpt-4",
             messages=[
                 {
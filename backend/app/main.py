@@ -12,8 +12,10 @@ from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
 from .core.config import get_settings
-from .db.mongo import close_mongo_connection, connect_to_mongo, get_database
+from .db.mongo import close_mongo_connection, connect_to_mongo, get_database, get_server_version
 from .routers import assessments, auth, candidate, proctor, users
+from .services.ai import close_ai_client, warm_ai_client
+from .utils.snapshots import SNAPSHOT_RETENTION_SECONDS
 
 settings = get_settings()
 logger = logging.getLogger("uvicorn.error")
@@ -194,6 +196,14 @@ async def startup() -> None:
     await db.assessments.create_index([("organization", 1), ("status", 1)])  # Query by org and status
     await db.assessments.create_index([("createdBy", 1), ("status", 1)])  # Query by creator and status
     await db.assessments.create_index([("organization", 1), ("createdBy", 1)])  # Query by org and creator
+    # Org-admin listing joins assessments by creator and by organization; these cover the
+    # projected list fields so the joins never fetch full assessment documents
+    await db.assessments.create_index(
+        [("createdBy", 1), ("createdAt", -1), ("title", 1), ("status", 1), ("updatedAt", 1), ("_id", 1)]
+    )
+    await db.assessments.create_index(
+        [("organization", 1), ("createdAt", -1), ("title", 1), ("status", 1), ("updatedAt", 1), ("_id", 1)]
+    )
     
     # Proctor events collection indexes
     await db.proctor_events.create_index("userId")  # Query by user
@@ -201,13 +211,51 @@ async def startup() -> None:
     await db.proctor_events.create_index("eventType")  # Query by event type
     await db.proctor_events.create_index([("assessmentId", 1), ("userId", 1)])  # Compound for user in assessment
     await db.proctor_events.create_index([("assessmentId", 1), ("userId", 1), ("eventType", 1)])  # Full compound
-    
+    await db.proctor_events.create_index([("assessmentId", 1), ("userId", 1), ("timestamp", -1)])  # Summary/logs sorted by time
+    await db.proctor_events.create_index([("assessmentId", 1), ("timestamp", 1)])  # All events for an assessment sorted by time
+
+    # Assessment sessions: active candidates = started but not submitted, per assessment
+    await db.assessment_sessions.create_index([("assessmentId", 1), ("submittedAt", 1), ("startedAt", 1)])
+
+    # Proctor sessions: live-session queries filter by assessment (and candidate) plus a live
+    # status; indexing only live sessions keeps the index O(active candidates) as ended ones pile up.
+    # $in in a partial filter needs MongoDB 6.0; older servers index every session instead.
+    if get_server_version() >= (6, 0):
+        live_session_filter = {"partialFilterExpression": {"status": {"$in": proctor.LIVE_SESSION_STATUSES}}}
+    else:
+        live_session_filter = {}
+        logger.warning("MongoDB < 6.0: active_proctor_sessions indexes all sessions, not only live ones")
+    await db.proctor_sessions.create_index(
+        [("assessmentId", 1), ("candidateId", 1)],
+        name="active_proctor_sessions",
+        **live_session_filter,
+    )
+
+    # Live proctor sessions: one "current" slot per candidate makes session creation an atomic upsert
+    await db.proctor_sessions.create_index(
+        [("assessmentId", 1), ("candidateId", 1), ("slot", 1)],
+        unique=True,
+        partialFilterExpression={"slot": "current"},
+        name="current_session_slot",
+    )
+    await db.proctor_sessions.create_index("sessionId")  # Signalling endpoints look sessions up by id
+    await db.proctor_session_history.create_index("sessionId")  # Fallback lookup for replaced sessions
+    # Ended live sessions are purged after 7 days (TTL only applies to BSON dates, not legacy ISO strings)
+    await db.proctor_sessions.create_index("endedAt", expireAfterSeconds=604800)
+    await db.proctor_session_history.create_index("endedAt", expireAfterSeconds=604800)
+
+    # Snapshot images are kept apart from proctor_events and expire after 90 days
+    await db.proctor_snapshots.create_index("createdAt", expireAfterSeconds=SNAPSHOT_RETENTION_SECONDS)
+
     logger.info("MongoDB connected and indexes ensured")
 
+    await warm_ai_client()
+
 
 @app.on_event("shutdown")
 async def shutdown() -> None:
     await close_mongo_connection()
+    await close_ai_client()
     # Close DSA MongoDB connection
     from app.dsa.database import close_dsa_mongo_connection
     await close_dsa_mongo_connection()
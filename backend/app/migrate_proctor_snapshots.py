@@ -0,0 +1,95 @@
+"""
+Script to move inline proctoring snapshots into the proctor_snapshots collection.
+
+Events recorded before snapshots moved out of proctor_events store the image as a base64
+string (snapshotBase64) inside the event document. This script decodes each one once,
+stores the bytes in proctor_snapshots (dated by the event's receivedAt) and replaces the
+inline string with snapshotId/snapshotContentType, so reads stop re-decoding base64 on
+every view.
+
+Snapshots older than the retention window would be deleted by the TTL index as soon as
+they were moved, so they are left inline and reported instead. Snapshots that are not
+valid base64 are also left inline and reported.
+
+Run with: python -m app.migrate_proctor_snapshots [--execute]
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from app.db.mongo import close_mongo_connection, connect_to_mongo, get_database
+from app.utils.snapshots import SNAPSHOT_RETENTION_SECONDS, store_snapshot
+
+
+def _parse_received_at(value):
+    """Parse an event's ISO receivedAt so migrated snapshots keep their original age."""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+async def migrate_proctor_snapshots(dry_run=True, batch_size=100):
+    """Move inline snapshotBase64 strings into the snapshot collection."""
+    await connect_to_mongo()
+    db = get_database()
+
+    print("=" * 60)
+    print("Proctor Snapshot Migration (inline base64 -> proctor_snapshots)")
+    print(f"Mode: {'DRY RUN (no changes)' if dry_run else 'LIVE (will move snapshots)'}")
+    print("=" * 60)
+
+    query = {"snapshotBase64": {"$type": "string"}, "snapshotId": {"$exists": False}}
+    retention_cutoff = datetime.now(timezone.utc) - timedelta(seconds=SNAPSHOT_RETENTION_SECONDS)
+
+    moved = 0
+    expired = 0
+    skipped = 0
+    projection = {"receivedAt": 1} if dry_run else {"snapshotBase64": 1, "receivedAt": 1}
+    cursor = db.proctor_events.find(query, projection).batch_size(batch_size)
+    async for event in cursor:
+        created_at = _parse_received_at(event.get("receivedAt"))
+        if created_at is not None and created_at < retention_cutoff:
+            # Moving it would hand it straight to the TTL index; keep the evidence inline
+            expired += 1
+            print(f"  - Kept inline event {event['_id']}: received {event.get('receivedAt')}, past snapshot retention")
+            continue
+        if dry_run:
+            moved += 1
+            continue
+        fields = await store_snapshot(db, event["_id"], event["snapshotBase64"], created_at)
+        if "snapshotId" not in fields:
+            skipped += 1
+            print(f"  - Skipped event {event['_id']}: snapshot is not valid base64")
+            continue
+        await db.proctor_events.update_one(
+            {"_id": event["_id"]},
+            {"$set": fields, "$unset": {"snapshotBase64": ""}},
+        )
+        moved += 1
+
+    if dry_run:
+        print(f"\nWould move {moved} snapshots to proctor_snapshots")
+        print(f"Would keep {expired} snapshots inline because they are past the {SNAPSHOT_RETENTION_SECONDS // 86400}-day retention")
+        print("\n⚠️  DRY RUN - No snapshots were moved")
+        print("Run with --execute to actually move these snapshots")
+        print("=" * 60)
+        await close_mongo_connection()
+        return
+
+    print(f"\nMoved {moved} snapshots to proctor_snapshots, skipped {skipped}")
+    print(f"Kept {expired} snapshots inline because they are past the {SNAPSHOT_RETENTION_SECONDS // 86400}-day retention")
+    print("\n✅ Migration complete!")
+    print("=" * 60)
+    await close_mongo_connection()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Move inline proctoring snapshots into proctor_snapshots")
+    parser.add_argument("--execute", action="store_true", help="Actually move snapshots (default is dry run)")
+    args = parser.parse_args()
+
+    asyncio.run(migrate_proctor_snapshots(dry_run=not args.execute))
@@ -1,13 +1,12 @@
-USER_ROLES = {
+USER_ROLES = frozenset({
     "super_admin",
     "org_admin",
     "editor",
     "viewer",
     "candidate",
     "pending",
-}
+})
 
-TIER_LEVELS = {"Free", "Basic", "Pro", "Enterprise"}
+TIER_LEVELS = frozenset({"Free", "Basic", "Pro", "Enterprise"})
 
-QUESTION_TYPES = ["MCQ", "Subjective", "Pseudo Code", "Descriptive", "Aptitude", "Reasoning"]
-DIFFICULTY_LEVELS = ["Easy", "Medium", "Hard"]
+# Question types and difficulty levels are defined once, as Literal types, in app.schemas.assessment
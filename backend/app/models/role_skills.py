@@ -0,0 +1,180 @@
+"""
+Common Job Designation Skills
+Static topic cards for frequently requested job designations, so the topic-card
+endpoint can answer them without an AI call.
+
+Each role maps to (core, progression):
+- core: the role's primary technologies, always included
+- progression: 12 related technologies ordered from fundamentals to advanced;
+  the experience level selects a window of 7 from it
+Keys are lower-case designations without seniority prefixes.
+"""
+
+ROLE_SKILLS = {
+    "java developer": (
+        ("Java", "Spring Boot", "SQL"),
+        ("OOP", "Collections Framework", "Maven", "JUnit", "Hibernate", "REST APIs", "Spring MVC",
+         "Multithreading", "Spring Security", "Microservices", "Kafka", "Docker"),
+    ),
+    "python developer": (
+        ("Python", "SQL", "Git"),
+        ("OOP", "pip", "pytest", "Flask", "Django", "REST APIs", "FastAPI",
+         "SQLAlchemy", "asyncio", "Celery", "Docker", "AWS"),
+    ),
+    "frontend developer": (
+        ("JavaScript", "HTML", "CSS"),
+        ("DOM", "Responsive Design", "Git", "React", "TypeScript", "Redux", "Webpack",
+         "Jest", "Next.js", "Web Performance", "Accessibility", "Micro Frontends"),
+    ),
+    "backend developer": (
+        ("SQL", "REST APIs", "Git"),
+        ("Node.js", "Python", "Java", "Express", "PostgreSQL", "MongoDB", "Redis",
+         "Authentication", "Docker", "Microservices", "Kafka", "Kubernetes"),
+    ),
+    "full stack developer": (
+        ("JavaScript", "SQL", "Git"),
+        ("HTML", "CSS", "React", "Node.js", "Express", "REST APIs", "MongoDB",
+         "TypeScript", "Docker", "Next.js", "GraphQL", "AWS"),
+    ),
+    "react developer": (
+        ("React", "JavaScript", "CSS"),
+        ("HTML", "JSX", "React Hooks", "Git", "Redux", "TypeScript", "React Router",
+         "Jest", "React Testing Library", "Next.js", "Webpack", "Web Performance"),
+    ),
+    "angular developer": (
+        ("Angular", "TypeScript", "CSS"),
+        ("HTML", "JavaScript", "Angular CLI", "Git", "RxJS", "Angular Router", "NgRx",
+         "Jasmine", "Karma", "Angular Material", "Web Performance", "Micro Frontends"),
+    ),
+    "node.js developer": (
+        ("Node.js", "JavaScript", "SQL"),
+        ("npm", "Express", "Git", "REST APIs", "MongoDB", "TypeScript", "Jest",
+         "Redis", "Authentication", "Docker", "Microservices", "Kafka"),
+    ),
+    ".net developer": (
+        ("C#", ".NET", "SQL Server"),
+        ("OOP", "LINQ", "Git", "ASP.NET Core", "Entity Framework", "REST APIs", "xUnit",
+         "Dependency Injection", "Azure", "Microservices", "Docker", "Kubernetes"),
+    ),
+    "php developer": (
+        ("PHP", "MySQL", "HTML"),
+        ("OOP", "Composer", "Git", "Laravel", "REST APIs", "JavaScript", "PHPUnit",
+         "Symfony", "Redis", "Docker", "Microservices", "AWS"),
+    ),
+    "android developer": (
+        ("Kotlin", "Android SDK", "Java"),
+        ("Android Studio", "Gradle", "Git", "Jetpack Compose", "Room", "Retrofit", "Coroutines",
+         "MVVM", "Dagger Hilt", "JUnit", "Firebase", "CI/CD"),
+    ),
+    "ios developer": (
+        ("Swift", "iOS SDK", "Xcode"),
+        ("UIKit", "Auto Layout", "Git", "SwiftUI", "Core Data", "URLSession", "Combine",
+         "MVVM", "XCTest", "Swift Concurrency", "Firebase", "CI/CD"),
+    ),
+    "flutter developer": (
+        ("Flutter", "Dart", "Git"),
+        ("Widgets", "Material Design", "Android Studio", "Provider", "REST APIs", "Firebase", "Bloc",
+         "Riverpod", "Flutter Testing", "Platform Channels", "CI/CD", "App Performance"),
+    ),
+    "devops engineer": (
+        ("Linux", "Docker", "Git"),
+        ("Bash", "Networking", "Jenkins", "CI/CD", "Kubernetes", "AWS", "Terraform",
+         "Ansible", "Prometheus", "Grafana", "Helm", "Site Reliability Engineering"),
+    ),
+    "cloud engineer": (
+        ("AWS", "Linux", "Networking"),
+        ("IAM", "EC2", "S3", "VPC", "Docker", "Terraform", "Kubernetes",
+         "CloudFormation", "Azure", "Serverless", "Cloud Security", "Multi-Cloud Architecture"),
+    ),
+    "data analyst": (
+        ("SQL", "Excel", "Python"),
+        ("Statistics", "Data Cleaning", "Pandas", "Data Visualization", "Power BI", "Tableau", "NumPy",
+         "A/B Testing", "Data Modeling", "ETL", "Snowflake", "Predictive Analytics"),
+    ),
+    "data scientist": (
+        ("Python", "SQL", "Statistics"),
+        ("NumPy", "Pandas", "Data Visualization", "Scikit-learn", "Machine Learning", "Feature Engineering", "Jupyter",
+         "Deep Learning", "TensorFlow", "PyTorch", "MLOps", "Spark"),
+    ),
+    "data engineer": (
+        ("SQL", "Python", "ETL"),
+        ("Data Modeling", "PostgreSQL", "Git", "Airflow", "Spark", "Kafka", "AWS",
+         "Snowflake", "dbt", "Databricks", "Data Lakes", "Kubernetes"),
+    ),
+    "machine learning engineer": (
+        ("Python", "Machine Learning", "SQL"),
+        ("NumPy", "Pandas", "Scikit-learn", "Feature Engineering", "TensorFlow", "PyTorch", "Deep Learning",
+         "Docker", "MLOps", "Model Deployment", "Kubernetes", "Distributed Training"),
+    ),
+    "qa engineer": (
+        ("Manual Testing", "Test Cases", "SQL"),
+        ("SDLC", "Bug Tracking", "JIRA", "Selenium", "API Testing", "Postman", "Java",
+         "TestNG", "Cypress", "Performance Testing", "JMeter", "CI/CD"),
+    ),
+    "automation test engineer": (
+        ("Selenium", "Java", "Test Automation"),
+        ("Test Cases", "Git", "Maven", "TestNG", "Page Object Model", "API Testing", "Rest Assured",
+         "Cucumber", "Jenkins", "Cypress", "Playwright", "Performance Testing"),
+    ),
+    "ui/ux designer": (
+        ("Figma", "UI Design", "UX Research"),
+        ("Wireframing", "Typography", "Color Theory", "Prototyping", "User Personas", "Design Systems", "Usability Testing",
+         "Adobe XD", "Accessibility", "Interaction Design", "Information Architecture", "Design Strategy"),
+    ),
+    "database administrator": (
+        ("SQL", "MySQL", "PostgreSQL"),
+        ("Database Design", "Normalization", "Linux", "Indexing", "Backup & Recovery", "Query Optimization", "Oracle",
+         "Replication", "High Availability", "Database Security", "MongoDB", "Cloud Databases"),
+    ),
+    "salesforce developer": (
+        ("Salesforce", "Apex", "SOQL"),
+        ("Salesforce Admin", "Visualforce", "Git", "Lightning Web Components", "Triggers", "Flows", "REST APIs",
+         "Salesforce DX", "Integration Patterns", "CI/CD", "Security Model", "Platform Events"),
+    ),
+    "golang developer": (
+        ("Go", "SQL", "Git"),
+        ("Go Modules", "Goroutines", "Channels", "REST APIs", "gRPC", "PostgreSQL", "Go Testing",
+         "Docker", "Redis", "Microservices", "Kubernetes", "Kafka"),
+    ),
+    "cyber security analyst": (
+        ("Network Security", "Linux", "Security Fundamentals"),
+        ("TCP/IP", "Firewalls", "Wireshark", "SIEM", "Vulnerability Assessment", "Nmap", "Incident Response",
+         "Penetration Testing", "OWASP Top 10", "Threat Intelligence", "Cloud Security", "Digital Forensics"),
+    ),
+}
+
+# Common alternate spellings of the designations above
+ROLE_ALIASES = {
+    "java engineer": "java developer",
+    "python engineer": "python developer",
+    "frontend engineer": "frontend developer",
+    "front end developer": "frontend developer",
+    "front-end developer": "frontend developer",
+    "backend engineer": "backend developer",
+    "back end developer": "backend developer",
+    "back-end developer": "backend developer",
+    "full stack engineer": "full stack developer",
+    "fullstack developer": "full stack developer",
+    "full-stack developer": "full stack developer",
+    "react.js developer": "react developer",
+    "reactjs developer": "react developer",
+    "node developer": "node.js developer",
+    "nodejs developer": "node.js developer",
+    "dotnet developer": ".net developer",
+    "c# developer": ".net developer",
+    "android engineer": "android developer",
+    "ios engineer": "ios developer",
+    "go developer": "golang developer",
+    "ml engineer": "machine learning engineer",
+    "software tester": "qa engineer",
+    "test engineer": "qa engineer",
+    "qa analyst": "qa engineer",
+    "automation engineer": "automation test engineer",
+    "ui/ux developer": "ui/ux designer",
+    "ux designer": "ui/ux designer",
+    "ui designer": "ui/ux designer",
+    "dba": "database administrator",
+    "security analyst": "cyber security analyst",
+    "cybersecurity analyst": "cyber security analyst",
+    "site reliability engineer": "devops engineer",
+}
@@ -7,12 +7,13 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 
 from ..core.dependencies import require_editor
 from ..core.security import sanitize_input, sanitize_text_field
 from ..db.mongo import get_db
 from ..schemas.assessment import (
+    QUESTION_LIST_ADAPTER,
     AddCustomTopicsRequest,
     AddNewQuestionRequest,
     CreateAssessmentFromJobDesignationRequest,
@@ -36,6 +37,7 @@ from ..schemas.assessment import (
 )
 from ..services.ai import (
     determine_topic_coding_support,
+    determine_topic_coding_support_many,
     generate_questions_for_topic_safe,
     generate_topics_from_input,
     generate_topics_from_skill,
@@ -46,7 +48,7 @@ from ..services.ai import (
     get_relevant_question_types_from_domain,
     suggest_time_and_score,
 )
-from ..utils.mongo import convert_object_ids, serialize_document, to_object_id
+from ..utils.mongo import build_candidate_key, convert_object_ids, legacy_candidate_key, serialize_document, to_object_id
 from ..utils.responses import success_response
 from ..models.aptitude_topics import (
     APTITUDE_MAIN_TOPICS,
@@ -98,7 +100,7 @@ def _check_assessment_access(assessment: Dict[str, Any], current_user: Dict[str,
     )
 
 
-async def _get_assessment(db: AsyncIOMotorDatabase, assessment_id: str) -> Dict[str, Any]:
+async def _get_assessment(db: AsyncDatabase, assessment_id: str) -> Dict[str, Any]:
     try:
         oid = to_object_id(assessment_id)
     except ValueError as exc:
@@ -110,7 +112,7 @@ async def _get_assessment(db: AsyncIOMotorDatabase, assessment_id: str) -> Dict[
     return assessment
 
 
-async def _save_assessment(db: AsyncIOMotorDatabase, assessment: Dict[str, Any]) -> None:
+async def _save_assessment(db: AsyncDatabase, assessment: Dict[str, Any]) -> None:
     assessment_id = assessment.get("_id")
     if not assessment_id:
         raise RuntimeError("Assessment document missing _id")
@@ -125,6 +127,19 @@ def _ensure_topic_structure(topic: Dict[str, Any]) -> Dict[str, Any]:
     return topic
 
 
+async def _apply_time_and_score(questions: List[Dict[str, Any]]) -> None:
+    """Fill in AI-suggested time/score for each question, with all suggestions requested concurrently."""
+    suggestions = await asyncio.gather(*(suggest_time_and_score(q) for q in questions), return_exceptions=True)
+    for question, time_score in zip(questions, suggestions):
+        if isinstance(time_score, Exception):
+            logger.warning(f"Failed to generate time/score for question, using defaults: {time_score}")
+            question["time"] = question.get("time", 10)
+            question["score"] = question.get("score", 5)
+        else:
+            question["time"] = time_score.get("time", 10)
+            question["score"] = time_score.get("score", 5)
+
+
 def _is_aptitude_skill(skill: str) -> bool:
     """Check if a skill is aptitude-related."""
     skill_lower = skill.lower().strip()
@@ -187,7 +202,7 @@ def _separate_skills(selected_skills: List[str]) -> tuple[List[str], List[str]]:
 async def generate_topics(
     payload: GenerateTopicsRequest,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     # Validate assessment type
     valid_types = {"aptitude", "technical"}
@@ -219,12 +234,7 @@ async def generate_topics(
             )
         # Check if at least one aptitude category is enabled
         apt_config = payload.aptitudeConfig
-        has_enabled = (
-            (apt_config.quantitative and apt_config.quantitative.enabled)
-            or (apt_config.logicalReasoning and apt_config.logicalReasoning.enabled)
-            or (apt_config.verbalAbility and apt_config.verbalAbility.enabled)
-            or (apt_config.numericalReasoning and apt_config.numericalReasoning.enabled)
-        )
+        has_enabled = any(category and category.enabled for category in apt_config.values())
         if not has_enabled:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -247,7 +257,7 @@ async def generate_topics(
         }
 
         for key, category_name in aptitude_category_map.items():
-            category_config = getattr(apt_config, key, None)
+            category_config = apt_config.get(key)
             if category_config and category_config.enabled:
                 # Aptitude topics don't support coding
                 coding_supported = await determine_topic_coding_support(category_name)
@@ -277,10 +287,10 @@ async def generate_topics(
         topics = await generate_topics_from_input(sanitized_job_role, payload.experience, sanitized_skills, payload.numTopics)
         # Sanitize generated topics
         sanitized_topics = [sanitize_text_field(topic) for topic in topics]
-        # Determine coding support for each topic
+        # Determine coding support for all topics (ambiguous ones share one AI call)
+        coding_support = await determine_topic_coding_support_many(sanitized_topics)
         technical_topic_docs = []
-        for t in sanitized_topics:
-            coding_supported = await determine_topic_coding_support(t)
+        for t, coding_supported in zip(sanitized_topics, coding_support):
             technical_topic_docs.append({
                 "topic": t,
                 "numQuestions": 0,
@@ -334,16 +344,9 @@ async def generate_topics(
         }
 
     if "aptitude" in assessment_types and payload.aptitudeConfig:
-        apt_config_dict: Dict[str, Any] = {}
-        if payload.aptitudeConfig.quantitative:
-            apt_config_dict["quantitative"] = payload.aptitudeConfig.quantitative.model_dump()
-        if payload.aptitudeConfig.logicalReasoning:
-            apt_config_dict["logicalReasoning"] = payload.aptitudeConfig.logicalReasoning.model_dump()
-        if payload.aptitudeConfig.verbalAbility:
-            apt_config_dict["verbalAbility"] = payload.aptitudeConfig.verbalAbility.model_dump()
-        if payload.aptitudeConfig.numericalReasoning:
-            apt_config_dict["numericalReasoning"] = payload.aptitudeConfig.numericalReasoning.model_dump()
-        assessment_doc["aptitudeConfig"] = apt_config_dict
+        assessment_doc["aptitudeConfig"] = {
+            key: category.model_dump() for key, category in payload.aptitudeConfig.items() if category
+        }
 
     result = await db.assessments.insert_one(assessment_doc)
     assessment_doc["_id"] = result.inserted_id
@@ -354,7 +357,7 @@ async def generate_topics(
 async def update_topic_settings(
     payload: UpdateTopicSettingsRequest,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     if not payload.updatedTopics:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid input")
@@ -402,7 +405,7 @@ async def update_topic_settings(
 async def add_custom_topics(
     payload: AddCustomTopicsRequest,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     if not payload.newTopics:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid input")
@@ -413,14 +416,22 @@ async def add_custom_topics(
     topics = assessment.get("topics", [])
     custom_topics = set(assessment.get("customTopics", []))
 
+    # Automatically determine if each new plain-named topic supports coding, in one batch
+    existing_names = {t.get("topic") for t in topics}
+    plain_topic_names = [
+        name
+        for name in (sanitize_text_field(t) for t in payload.newTopics if isinstance(t, str))
+        if name not in existing_names
+    ]
+    coding_support = dict(zip(plain_topic_names, await determine_topic_coding_support_many(plain_topic_names)))
+
     for topic_data in payload.newTopics:
         if isinstance(topic_data, str):
             # Sanitize topic name
             topic_name = sanitize_text_field(topic_data)
             exists = any(t.get("topic") == topic_name for t in topics)
             if not exists:
-                # Automatically determine if topic supports coding
-                coding_supported = await determine_topic_coding_support(topic_name)
+                coding_supported = coding_support[topic_name]
                 topics.append(
                     {
                         "topic": topic_name,
@@ -466,7 +477,7 @@ async def add_custom_topics(
 async def remove_custom_topics(
     payload: RemoveCustomTopicsRequest,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     if not payload.topicsToRemove:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid input")
@@ -543,7 +554,7 @@ async def generate_topic_cards_endpoint(
 async def generate_topics_from_skill_endpoint(
     payload: GenerateTopicsFromSkillRequest,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Generate topics from skill(s) input. Handles both single skill and comma-separated multiple skills."""
     try:
@@ -657,7 +668,7 @@ async def validate_question_type_endpoint(
 async def regenerate_single_topic_endpoint(
     payload: RegenerateSingleTopicRequest,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Regenerate a new topic name based on skills, update question type and coding support, delete its questions."""
     try:
@@ -778,7 +789,7 @@ async def regenerate_single_topic_endpoint(
 async def delete_topic_questions(
     payload: DeleteTopicQuestionsRequest,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Delete questions for a specific topic or all topics."""
     try:
@@ -829,7 +840,7 @@ async def delete_topic_questions(
 async def create_assessment_from_job_designation(
     payload: CreateAssessmentFromJobDesignationRequest,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Create a new assessment with topics from job designation and selected skills, or update existing if assessmentId is provided."""
     try:
@@ -899,40 +910,31 @@ async def create_assessment_from_job_designation(
                 payload.experienceMax
             )
             
-            # Process topics in parallel to determine question types and coding support (optimized)
-            topic_processing_tasks = []
-            for topic in technical_topics:
-                sanitized_topic = sanitize_text_field(topic)
-                # Create tasks for parallel processing
-                topic_processing_tasks.append({
-                    "topic": sanitized_topic,
-                    "question_type_task": get_question_type_for_topic(sanitized_topic),
-                    "coding_support_task": determine_topic_coding_support(sanitized_topic),
-                })
+            # Determine question types and coding support in parallel; coding support is checked
+            # for all topics at once so ambiguous topics share a single AI call
+            sanitized_topics = [sanitize_text_field(topic) for topic in technical_topics]
+            question_types, coding_support = await asyncio.gather(
+                asyncio.gather(*(get_question_type_for_topic(t) for t in sanitized_topics), return_exceptions=True),
+                determine_topic_coding_support_many(sanitized_topics),
+                return_exceptions=True,
+            )
+            if isinstance(coding_support, Exception):
+                logger.warning(f"Failed to determine coding support for topics {sanitized_topics}: {coding_support}")
+                coding_support = [False] * len(sanitized_topics)  # Safe fallback
             
-            # Execute all tasks in parallel for better performance
-            for task_info in topic_processing_tasks:
-                question_type, coding_supported = await asyncio.gather(
-                    task_info["question_type_task"],
-                    task_info["coding_support_task"],
-                    return_exceptions=True
-                )
-                
+            for sanitized_topic, question_type, coding_supported in zip(sanitized_topics, question_types, coding_support):
                 # Handle exceptions gracefully
                 if isinstance(question_type, Exception):
-                    logger.warning(f"Failed to determine question type for topic '{task_info['topic']}': {question_type}")
+                    logger.warning(f"Failed to determine question type for topic '{sanitized_topic}': {question_type}")
                     question_type = "MCQ"  # Safe fallback
-                if isinstance(coding_supported, Exception):
-                    logger.warning(f"Failed to determine coding support for topic '{task_info['topic']}': {coding_supported}")
-                    coding_supported = False  # Safe fallback
                 
                 # If question type is "coding" but topic doesn't support coding, change to a safe default
                 if question_type == "coding" and not coding_supported:
-                    logger.warning(f"Topic '{task_info['topic']}' was assigned 'coding' but doesn't support coding. Changing to 'Subjective'.")
+                    logger.warning(f"Topic '{sanitized_topic}' was assigned 'coding' but doesn't support coding. Changing to 'Subjective'.")
                     question_type = "Subjective"  # Safe fallback for non-coding topics
                 
                 topic_doc = {
-                    "topic": task_info["topic"],
+                    "topic": sanitized_topic,
                     "numQuestions": 0,
                     "questionTypes": [question_type],  # Topic-specific question type
                     "difficulty": "Medium",  # Default difficulty
@@ -944,7 +946,7 @@ async def create_assessment_from_job_designation(
                     "coding_supported": coding_supported,
                 }
                 topic_docs.append(topic_doc)
-                custom_topics.append(task_info["topic"])
+                custom_topics.append(sanitized_topic)
                 
                 # Add question type to all_question_types (avoid duplicates)
                 if question_type not in all_question_types:
@@ -1049,7 +1051,7 @@ async def create_assessment_from_job_designation(
 async def create_assessment_from_skill(
     payload: GenerateTopicsFromSkillRequest,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Create a new assessment with topics from skill input."""
     try:
@@ -1128,7 +1130,7 @@ async def suggest_time_score(
 async def generate_questions_from_config(
     payload: GenerateQuestionsFromConfigRequest,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Generate questions based on topic configuration."""
     assessment = await _get_assessment(db, payload.assessmentId)
@@ -1228,7 +1230,6 @@ async def generate_questions_from_config(
         try:
             questions = await generate_questions_for_topic_safe(topic_for_generation, config)
             if questions:
-                # Auto-generate time and score for each question
                 for q in questions:
                     q["topic"] = topic_config.topic
                     # Ensure coding-specific fields are set for coding questions
@@ -1251,14 +1252,8 @@ async def generate_questions_from_config(
                                 q["starter_code"] = coding_data["starter_code"]
                             if "function_signature" in coding_data:
                                 q["function_signature"] = coding_data["function_signature"]
-                    try:
-                        time_score = await suggest_time_and_score(q)
-                        q["time"] = time_score.get("time", 10)
-                        q["score"] = time_score.get("score", 5)
-                    except Exception as exc:
-                        logger.warning(f"Failed to generate time/score for question, using defaults: {exc}")
-                        q["time"] = 10
-                        q["score"] = 5
+                # Auto-generate time and score for each question
+                await _apply_time_and_score(questions)
                 topic_obj["questions"] = questions
                 all_questions.extend(questions)
             else:
@@ -1312,7 +1307,7 @@ def _build_generation_config(topic_obj: Dict[str, Any]) -> Dict[str, Any]:
 async def generate_questions(
     payload: GenerateQuestionsRequest,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     assessment = await _get_assessment(db, payload.assessmentId)
     _check_assessment_access(assessment, current_user)
@@ -1370,19 +1365,10 @@ async def generate_questions(
                     merged.update(new_question)
                 else:
                     merged = new_question
-                
-                # Auto-generate time and score if not already set
-                if "time" not in merged or "score" not in merged:
-                    try:
-                        time_score = await suggest_time_and_score(merged)
-                        merged["time"] = time_score.get("time", 10)
-                        merged["score"] = time_score.get("score", 5)
-                    except Exception as exc:
-                        logger.warning(f"Failed to generate time/score for question, using defaults: {exc}")
-                        merged["time"] = merged.get("time", 10)
-                        merged["score"] = merged.get("score", 5)
-                
                 merged_questions.append(merged)
+            
+            # Auto-generate time and score where not already set
+            await _apply_time_and_score([q for q in merged_questions if "time" not in q or "score" not in q])
             topic["questions"] = merged_questions
             results.append({"topic": topic.get("topic"), "questions": merged_questions, "expected": expected_count, "generated": len(merged_questions)})
         else:
@@ -1420,7 +1406,7 @@ async def generate_questions(
 async def update_questions(
     payload: UpdateQuestionsRequest,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     assessment = await _get_assessment(db, payload.assessmentId)
     _check_assessment_access(assessment, current_user)
@@ -1429,8 +1415,11 @@ async def update_questions(
     if not topic:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Topic not found in assessment")
 
-    # Update questions, preserving all properties including time and score
-    topic["questions"] = [q.model_dump(exclude_unset=True) for q in payload.updatedQuestions]
+    # Update questions, preserving all properties including time and score. Null optional
+    # fields (e.g. options/correctAnswer on subjective questions) are not stored or echoed back.
+    topic["questions"] = QUESTION_LIST_ADAPTER.dump_python(
+        payload.updatedQuestions, exclude_unset=True, exclude_none=True
+    )
     assessment["status"] = "draft"
     await _save_assessment(db, assessment)
     return success_response(
@@ -1447,7 +1436,7 @@ async def update_questions(
 async def update_single_question(
     payload: UpdateSingleQuestionRequest,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     assessment = await _get_assessment(db, payload.assessmentId)
     _check_assessment_access(assessment, current_user)
@@ -1479,7 +1468,7 @@ async def update_single_question(
 async def add_new_question(
     payload: AddNewQuestionRequest,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     assessment = await _get_assessment(db, payload.assessmentId)
     _check_assessment_access(assessment, current_user)
@@ -1489,7 +1478,7 @@ async def add_new_question(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Topic not found in assessment")
 
     topic = _ensure_topic_structure(topic)
-    question = payload.newQuestion.model_dump(exclude_unset=True)
+    question = payload.newQuestion.model_dump(exclude_unset=True, exclude_none=True)
     question["createdAt"] = _now_utc()
     question["updatedAt"] = _now_utc()
     topic["questions"].append(question)
@@ -1510,7 +1499,7 @@ async def add_new_question(
 async def delete_question(
     payload: DeleteQuestionRequest,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     assessment = await _get_assessment(db, payload.assessmentId)
     _check_assessment_access(assessment, current_user)
@@ -1540,7 +1529,7 @@ async def delete_question(
 async def finalize_assessment(
     payload: FinalizeAssessmentRequest,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     try:
         assessment = await _get_assessment(db, payload.assessmentId)
@@ -1589,7 +1578,7 @@ async def get_questions_by_topic(
     assessmentId: str = Query(..., alias="assessmentId"),
     topic: str = Query(...),
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     assessment = await _get_assessment(db, assessmentId)
     _check_assessment_access(assessment, current_user)
@@ -1604,7 +1593,7 @@ async def get_questions_by_topic(
 async def get_assessment_header(
     assessment_id: str,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     assessment = await _get_assessment(db, assessment_id)
     _check_assessment_access(assessment, current_user)
@@ -1622,7 +1611,7 @@ async def get_assessment_header(
 async def get_assessment_schedule(
     assessment_id: str,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     assessment = await _get_assessment(db, assessment_id)
     _check_assessment_access(assessment, current_user)
@@ -1640,7 +1629,7 @@ async def get_assessment_schedule(
 async def update_assessment_draft(
     payload: UpdateAssessmentDraftRequest,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Update assessment draft data (preserves placeholder data)."""
     assessment = await _get_assessment(db, payload.assessmentId)
@@ -1758,7 +1747,7 @@ async def update_assessment_draft(
 async def update_schedule_and_candidates(
     payload: Dict[str, Any],
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Update assessment schedule and candidates."""
     assessment_id = payload.get("assessmentId")
@@ -1809,7 +1798,7 @@ async def update_assessment_schedule(
     assessment_id: str,
     payload: ScheduleUpdateRequest,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     assessment = await _get_assessment(db, assessment_id)
     _check_assessment_access(assessment, current_user)
@@ -1864,7 +1853,7 @@ async def update_assessment_schedule(
 async def get_topics(
     assessment_id: str,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     assessment = await _get_assessment(db, assessment_id)
     _check_assessment_access(assessment, current_user)
@@ -1877,17 +1866,16 @@ async def get_answer_logs(
     candidateEmail: str = Query(...),
     candidateName: str = Query(...),
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Get answer logs for a specific candidate."""
     try:
         assessment = await _get_assessment(db, assessment_id)
         _check_assessment_access(assessment, current_user)
 
-        # Match the format used in log-answer endpoint: email_lowercase_name_stripped
-        # Format: email.strip().lower() + "_" + name.strip()
-        # CRITICAL: Must match EXACTLY the format in log-answer endpoint
-        candidate_key = f"{candidateEmail.strip().lower()}_{candidateName.strip()}"
+        # Same key as the log-answer endpoint; build_candidate_key normalizes email and name
+        candidate_key = build_candidate_key(candidateEmail, candidateName)
+        legacy_key = legacy_candidate_key(candidateEmail, candidateName)
         logger.info(f"Fetching answer logs for candidate key: '{candidate_key}' (email='{candidateEmail}', name='{candidateName}')")
         
         answer_logs = assessment.get("answerLogs")
@@ -1900,17 +1888,11 @@ async def get_answer_logs(
         logger.info(f"Answer logs keys in database: {list(answer_logs.keys())}")
         logger.info(f"Looking for candidate key: '{candidate_key}'")
         
-        # Try exact match first
-        candidate_logs = answer_logs.get(candidate_key, {})
+        # Try exact match first (older documents are keyed by the legacy email_name key)
+        candidate_logs = answer_logs.get(candidate_key) or answer_logs.get(legacy_key, {})
         
-        # If not found, try to find a similar key (for debugging)
         if not candidate_logs or not isinstance(candidate_logs, dict):
-            logger.warning(f"No logs found for candidate key '{candidate_key}'. Available keys: {list(answer_logs.keys())}")
-            # Try to find a key that's close (for debugging)
-            if answer_logs:
-                for key in answer_logs.keys():
-                    if candidate_key.lower() in key.lower() or key.lower() in candidate_key.lower():
-                        logger.info(f"Found similar key: '{key}' (searching for '{candidate_key}')")
+            logger.warning(f"No logs found for candidate key '{candidate_key}'")
             # Don't return early - continue to process questions from candidateResponses (especially MCQs)
             candidate_logs = {}
         
@@ -1932,7 +1914,7 @@ async def get_answer_logs(
         ai_evaluation = {}
         submitted_answers = {}  # {questionIndex: answer}
         if isinstance(candidate_responses, dict):
-            candidate_response = candidate_responses.get(candidate_key, {})
+            candidate_response = candidate_responses.get(candidate_key) or candidate_responses.get(legacy_key, {})
             if isinstance(candidate_response, dict):
                 ai_evaluation = candidate_response.get("aiEvaluation", {})
                 # Get submitted answers
@@ -2016,7 +1998,7 @@ async def get_answer_logs(
         # Get submission time from candidate response
         submission_time = None
         if isinstance(candidate_responses, dict):
-            candidate_response = candidate_responses.get(candidate_key, {})
+            candidate_response = candidate_responses.get(candidate_key) or candidate_responses.get(legacy_key, {})
             if isinstance(candidate_response, dict):
                 submitted_at = candidate_response.get("submittedAt")
                 if submitted_at:
@@ -2096,7 +2078,7 @@ async def get_answer_logs(
 async def get_candidate_results(
     assessment_id: str,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Get candidate results for an assessment."""
     assessment = await _get_assessment(db, assessment_id)
@@ -2130,7 +2112,7 @@ async def get_candidate_results(
 async def get_all_questions(
     assessment_id: str,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     logger.info(f"[get_all_questions] GET /api/assessments/{assessment_id}/questions - Request received")
     print(f"[get_all_questions] GET /api/assessments/{assessment_id}/questions - Request received")
@@ -2209,7 +2191,7 @@ async def get_all_questions(
 @router.get("")
 async def get_all_assessments_with_schedule(
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     try:
         query: Dict[str, Any] = {}
@@ -2297,7 +2279,7 @@ async def get_all_assessments_with_schedule(
 async def delete_assessment(
     assessment_id: str,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Delete an assessment. Only users with access to the assessment can delete it."""
     try:
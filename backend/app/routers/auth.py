@@ -9,12 +9,13 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request,
 from fastapi.responses import JSONResponse
 from google.auth.transport import requests as google_requests
 from google.oauth2 import id_token
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
 from ..core.config import get_settings
+from ..core.dependencies import invalidate_cached_user
 from ..core.security import create_access_token, create_refresh_token, get_password_hash, verify_password, sanitize_text_field
 from ..db.mongo import get_db
 from ..schemas.auth import (
@@ -61,7 +62,7 @@ def _generate_verification_code() -> str:
 
 
 async def _store_verification_code(
-    db: AsyncIOMotorDatabase,
+    db: AsyncDatabase,
     email: str,
     code: str,
     expires_at: datetime,
@@ -88,7 +89,7 @@ async def _store_verification_code(
 
 
 async def _send_verification_email(
-    db: AsyncIOMotorDatabase,
+    db: AsyncDatabase,
     email: str,
     user_name: str | None = None,
     pending_signup_data: dict | None = None,
@@ -133,7 +134,7 @@ async def _send_verification_email(
 
 
 async def _send_verification_email_async(
-    db: AsyncIOMotorDatabase,
+    db: AsyncDatabase,
     email: str,
     user_name: str | None,
     code: str,
@@ -168,7 +169,7 @@ async def _send_verification_email_async(
         logger.error("Failed to send verification email to %s: %s", email, exc)
 
 
-async def _verify_code(db: AsyncIOMotorDatabase, email: str, code: str) -> bool:
+async def _verify_code(db: AsyncDatabase, email: str, code: str) -> bool:
     """Verify the code and mark email as verified if valid."""
     normalized = _normalize_email(email)
     verification = await db.email_verifications.find_one({"email": normalized})
@@ -231,6 +232,7 @@ async def _verify_code(db: AsyncIOMotorDatabase, email: str, code: str) -> bool:
                 {"_id": user["_id"]},
                 {"$set": {"emailVerified": True, "emailVerifiedAt": now}},
             )
+            invalidate_cached_user(str(user["_id"]))
 
     # Delete the verification code
     await db.email_verifications.delete_one({"email": normalized})
@@ -238,7 +240,7 @@ async def _verify_code(db: AsyncIOMotorDatabase, email: str, code: str) -> bool:
 
 
 async def _check_and_cleanup_expired_verification(
-    db: AsyncIOMotorDatabase,
+    db: AsyncDatabase,
     email: str,
 ) -> bool:
     """Check if verification code exists and is expired. Clean up if expired. Returns True if expired or doesn't exist."""
@@ -267,7 +269,7 @@ async def _check_and_cleanup_expired_verification(
     return False  # Code exists and is still valid
 
 
-async def _find_user_by_email(db: AsyncIOMotorDatabase, email: str) -> dict | None:
+async def _find_user_by_email(db: AsyncDatabase, email: str) -> dict | None:
     normalized = _normalize_email(email)
     pattern = re.compile(f"^{re.escape(normalized)}$", re.IGNORECASE)
 
@@ -287,6 +289,7 @@ async def _find_user_by_email(db: AsyncIOMotorDatabase, email: str) -> dict | No
 
     if preferred.get("email") != normalized:
         await db.users.update_one({"_id": preferred["_id"]}, {"$set": {"email": normalized}})
+        invalidate_cached_user(str(preferred["_id"]))
         preferred["email"] = normalized
 
     return preferred
@@ -295,7 +298,7 @@ async def _find_user_by_email(db: AsyncIOMotorDatabase, email: str) -> dict | No
 @router.post("/superadmin-signup")
 async def super_admin_signup(
     payload: SuperAdminSignupRequest,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     email = _normalize_email(payload.email)
     existing = await _find_user_by_email(db, email)
@@ -338,7 +341,7 @@ async def super_admin_signup(
 @router.post("/org-signup")
 async def org_signup_google(
     payload: GoogleSignupRequest,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     settings = get_settings()
     if not settings.google_client_id:
@@ -385,7 +388,7 @@ async def org_signup_google(
     )
 
 
-async def _check_account_lockout(db: AsyncIOMotorDatabase, email: str) -> tuple[bool, str | None]:
+async def _check_account_lockout(db: AsyncDatabase, email: str) -> tuple[bool, str | None]:
     """Check if account is locked. Returns (is_locked, lockout_message)."""
     settings = get_settings()
     normalized = _normalize_email(email)
@@ -413,8 +416,9 @@ async def _check_account_lockout(db: AsyncIOMotorDatabase, email: str) -> tuple[
         if lockout_time.tzinfo is None:
             lockout_time = lockout_time.replace(tzinfo=timezone.utc)
         
-        if datetime.now(timezone.utc) < lockout_time:
-            remaining_minutes = int((lockout_time - datetime.now(timezone.utc)).total_seconds() / 60)
+        now = datetime.now(timezone.utc)
+        if now < lockout_time:
+            remaining_minutes = int((lockout_time - now).total_seconds() / 60)
             return True, f"Account is temporarily locked due to too many failed login attempts. Please try again in {remaining_minutes} minutes."
         else:
             # Lockout expired, clear it
@@ -422,6 +426,7 @@ async def _check_account_lockout(db: AsyncIOMotorDatabase, email: str) -> tuple[
                 {"_id": user["_id"]},
                 {"$unset": {"lockoutUntil": "", "failedLoginAttempts": 0}}
             )
+            invalidate_cached_user(str(user["_id"]))
     
     if failed_attempts >= settings.max_failed_attempts:
         # Lock account
@@ -430,12 +435,13 @@ async def _check_account_lockout(db: AsyncIOMotorDatabase, email: str) -> tuple[
             {"_id": user["_id"]},
             {"$set": {"lockoutUntil": lockout_until}}
         )
+        invalidate_cached_user(str(user["_id"]))
         return True, f"Account is temporarily locked due to too many failed login attempts. Please try again in {settings.lockout_duration_minutes} minutes."
     
     return False, None
 
 
-async def _increment_failed_attempts(db: AsyncIOMotorDatabase, email: str) -> None:
+async def _increment_failed_attempts(db: AsyncDatabase, email: str) -> None:
     """Increment failed login attempts for a user."""
     normalized = _normalize_email(email)
     user = await _find_user_by_email(db, normalized)
@@ -444,9 +450,10 @@ async def _increment_failed_attempts(db: AsyncIOMotorDatabase, email: str) -> No
             {"_id": user["_id"]},
             {"$inc": {"failedLoginAttempts": 1}}
         )
+        invalidate_cached_user(str(user["_id"]))
 
 
-async def _clear_failed_attempts(db: AsyncIOMotorDatabase, email: str) -> None:
+async def _clear_failed_attempts(db: AsyncDatabase, email: str) -> None:
     """Clear failed login attempts on successful login."""
     normalized = _normalize_email(email)
     user = await _find_user_by_email(db, normalized)
@@ -455,6 +462,7 @@ async def _clear_failed_attempts(db: AsyncIOMotorDatabase, email: str) -> None:
             {"_id": user["_id"]},
             {"$unset": {"failedLoginAttempts": "", "lockoutUntil": ""}}
         )
+        invalidate_cached_user(str(user["_id"]))
 
 
 def _build_login_success_response(user: dict) -> JSONResponse:
@@ -485,7 +493,7 @@ def _build_login_success_response(user: dict) -> JSONResponse:
 @router.post("/send-verification-code")
 async def send_verification_code(
     payload: SendVerificationCodeRequest,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Send email verification code to user. Handles both existing users and pending signups."""
     email = _normalize_email(payload.email)
@@ -557,7 +565,7 @@ async def send_verification_code(
 async def verify_email_code(
     request: Request,
     payload: VerifyEmailCodeRequest,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Verify email verification code. Creates account if this is a pending signup."""
     email = _normalize_email(payload.email)
@@ -624,7 +632,7 @@ async def verify_email_code(
 async def email_login(
     request: Request,
     payload: LoginRequest,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """User login with rate limiting, account lockout, and generic error messages."""
     settings = get_settings()
@@ -677,7 +685,7 @@ async def email_login(
 async def org_signup_email(
     background_tasks: BackgroundTasks,
     payload: OrgSignupRequest,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     email = _normalize_email(payload.email)
     if await _find_user_by_email(db, email):
@@ -722,7 +730,7 @@ async def org_signup_email(
 async def oauth_login(
     request: Request,
     payload: OAuthLoginRequest,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """OAuth login with rate limiting."""
     try:
@@ -764,6 +772,7 @@ async def oauth_login(
 
             if updates:
                 await db.users.update_one({"_id": user["_id"]}, {"$set": updates})
+                invalidate_cached_user(str(user["_id"]))
                 user = await db.users.find_one({"_id": user["_id"]})
 
         if not user:
@@ -783,7 +792,7 @@ async def oauth_login(
 @router.post("/refresh-token")
 async def refresh_token(
     payload: dict,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Refresh access token using refresh token."""
     from ..core.security import decode_token, create_access_token, create_refresh_token
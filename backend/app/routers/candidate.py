@@ -1,18 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import html
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
 from dateutil import parser
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 
 from ..db.mongo import get_db
 from ..schemas.assessment import LogAnswerRequest
 from ..services.ai import evaluate_answer_with_ai
-from ..utils.mongo import to_object_id
+from ..utils.mongo import build_candidate_key, legacy_candidate_key, to_object_id
 from ..utils.responses import success_response
 from ..dsa.utils.judge0 import submit_to_judge0, run_all_test_cases
 
@@ -21,16 +23,87 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/assessment", tags=["candidate"])
 
 
-def _check_assessment_time_window(assessment: Dict[str, Any], allow_before_start: bool = False) -> None:
+def _normalize_datetime_str(dt_str: str) -> str:
+    """Normalize datetime string to full ISO format."""
+    if not dt_str:
+        return dt_str
+    
+    # Extract timezone info
+    has_timezone = "+" in dt_str or dt_str.endswith("Z")
+    timezone_part = ""
+    if "+" in dt_str:
+        timezone_part = "+" + dt_str.split("+", 1)[1]
+        dt_clean = dt_str.split("+")[0]
+    elif dt_str.endswith("Z"):
+        timezone_part = "Z"
+        dt_clean = dt_str[:-1]  # Remove Z
+    else:
+        dt_clean = dt_str
+    
+    # Check if seconds are missing (format: YYYY-MM-DDTHH:MM)
+    if "T" in dt_clean and dt_clean.count(":") == 1:
+        dt_clean = dt_clean + ":00"  # Add seconds
+    
+    # Add timezone if missing
+    if not has_timezone:
+        dt_clean = dt_clean + "Z"
+    else:
+        dt_clean = dt_clean + timezone_part
+    
+    return dt_clean
+
+
+@lru_cache(maxsize=1024)
+def _parse_schedule_window(start_time_str: str, end_time_str: str) -> Tuple[datetime, datetime]:
+    """
+    Parse an assessment schedule into timezone-aware (start, end) datetimes.
+    
+    Cached on the raw schedule strings: every candidate request for an assessment
+    re-checks the same window, and editing the schedule produces a new cache key.
+    
+    Raises:
+        ValueError: If the strings cannot be parsed
+    """
+    try:
+        # Try parsing with fromisoformat first
+        start_time = datetime.fromisoformat(_normalize_datetime_str(start_time_str).replace("Z", "+00:00"))
+        end_time = datetime.fromisoformat(_normalize_datetime_str(end_time_str).replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        # Fallback: try parsing with dateutil parser (handles more formats)
+        try:
+            start_time = parser.parse(start_time_str)  # Use parse instead of isoparse for more flexibility
+            end_time = parser.parse(end_time_str)
+        except (ValueError, AttributeError, TypeError, OverflowError) as parse_error:
+            logger.warning(f"Both fromisoformat and parser.parse failed: {parse_error}. startTime={start_time_str}, endTime={end_time_str}")
+            raise ValueError(f"Unable to parse date strings: {start_time_str}, {end_time_str}") from parse_error
+    
+    # Ensure timezone-aware comparison
+    if start_time.tzinfo is None:
+        start_time = start_time.replace(tzinfo=timezone.utc)
+    if end_time.tzinfo is None:
+        end_time = end_time.replace(tzinfo=timezone.utc)
+    
+    return start_time, end_time
+
+
+def _check_assessment_time_window(
+    assessment: Dict[str, Any],
+    allow_before_start: bool = False,
+    grace_period_seconds: int = 0,
+    enforce: bool = False,
+) -> None:
     """
     Check if current time is within the assessment's allowed time window.
     
     Args:
         assessment: The assessment document from database
         allow_before_start: If True, allow access before startTime (e.g., for checking schedule)
+        grace_period_seconds: Seconds past endTime that are still accepted (e.g., for auto-submissions)
+        enforce: If True, raise when outside the window; otherwise only log it (the long-standing
+            behaviour of the verify/schedule/start/questions/log-answer endpoints)
     
     Raises:
-        HTTPException: If current time is outside the allowed window
+        HTTPException: If enforce is True and current time is outside the allowed window
     """
     schedule = assessment.get("schedule", {})
     start_time_str = schedule.get("startTime")
@@ -41,63 +114,7 @@ def _check_assessment_time_window(assessment: Dict[str, Any], allow_before_start
         return
     
     try:
-        # Parse ISO format datetime strings - handle multiple formats
-        start_time = None
-        end_time = None
-        
-        # Normalize date strings - add missing parts if needed
-        def normalize_datetime_str(dt_str: str) -> str:
-            """Normalize datetime string to full ISO format."""
-            if not dt_str:
-                return dt_str
-            
-            # Extract timezone info
-            has_timezone = "+" in dt_str or dt_str.endswith("Z")
-            timezone_part = ""
-            if "+" in dt_str:
-                timezone_part = "+" + dt_str.split("+", 1)[1]
-                dt_clean = dt_str.split("+")[0]
-            elif dt_str.endswith("Z"):
-                timezone_part = "Z"
-                dt_clean = dt_str[:-1]  # Remove Z
-            else:
-                dt_clean = dt_str
-            
-            # Check if seconds are missing (format: YYYY-MM-DDTHH:MM)
-            if "T" in dt_clean and dt_clean.count(":") == 1:
-                dt_clean = dt_clean + ":00"  # Add seconds
-            
-            # Add timezone if missing
-            if not has_timezone:
-                dt_clean = dt_clean + "Z"
-            else:
-                dt_clean = dt_clean + timezone_part
-            
-            return dt_clean
-        
-        start_time_str_normalized = normalize_datetime_str(start_time_str)
-        end_time_str_normalized = normalize_datetime_str(end_time_str)
-        
-        # Try parsing with fromisoformat first
-        try:
-            start_time_str_clean = start_time_str_normalized.replace("Z", "+00:00")
-            end_time_str_clean = end_time_str_normalized.replace("Z", "+00:00")
-            start_time = datetime.fromisoformat(start_time_str_clean)
-            end_time = datetime.fromisoformat(end_time_str_clean)
-        except (ValueError, AttributeError):
-            # Fallback: try parsing with dateutil parser (handles more formats)
-            try:
-                start_time = parser.parse(start_time_str)  # Use parse instead of isoparse for more flexibility
-                end_time = parser.parse(end_time_str)
-            except (ValueError, AttributeError, TypeError) as parse_error:
-                logger.warning(f"Both fromisoformat and parser.parse failed: {parse_error}. startTime={start_time_str}, endTime={end_time_str}")
-                raise ValueError(f"Unable to parse date strings: {start_time_str}, {end_time_str}") from parse_error
-        
-        # Ensure timezone-aware comparison
-        if start_time.tzinfo is None:
-            start_time = start_time.replace(tzinfo=timezone.utc)
-        if end_time.tzinfo is None:
-            end_time = end_time.replace(tzinfo=timezone.utc)
+        start_time, end_time = _parse_schedule_window(start_time_str, end_time_str)
         
         now = datetime.now(timezone.utc)
         
@@ -113,15 +130,20 @@ def _check_assessment_time_window(assessment: Dict[str, Any], allow_before_start
             )
         
         # Check if after end time
-        if now > end_time:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Assessment has ended. It ended at {end_time_str}"
-            )
+        if now > end_time and (now - end_time).total_seconds() > grace_period_seconds:
+            detail = f"Assessment has ended. It ended at {end_time_str}"
+            if grace_period_seconds:
+                detail += ". Submission deadline has passed."
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
     except (ValueError, AttributeError, TypeError) as exc:
         # If date parsing fails, log warning but don't block access (backward compatibility)
         logger.warning(f"Failed to parse assessment schedule times: {exc}. startTime={start_time_str}, endTime={end_time_str}")
         return
+    except HTTPException as time_error:
+        if enforce:
+            raise
+        logger.warning(f"Assessment time window check failed (not enforced): {time_error.detail}")
+        return
     except Exception as exc:
         # Catch any other unexpected errors in date parsing
         logger.warning(f"Unexpected error parsing assessment schedule times: {exc}. startTime={start_time_str}, endTime={end_time_str}")
@@ -131,7 +153,7 @@ def _check_assessment_time_window(assessment: Dict[str, Any], allow_before_start
 @router.post("/verify-candidate")
 async def verify_candidate(
     payload: Dict[str, Any],
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Verify candidate email and name against assessment candidates list."""
     try:
@@ -167,13 +189,7 @@ async def verify_candidate(
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Email and name combination not found in candidate list")
 
         # Check time window (allow before start so candidates can verify and see schedule)
-        try:
-            _check_assessment_time_window(assessment, allow_before_start=True)
-        except HTTPException:
-            raise
-        except Exception as time_exc:
-            # If time check fails due to parsing error, log but don't block verification
-            logger.warning(f"Time window check error (non-blocking) for assessment {assessment_id}: {time_exc}")
+        _check_assessment_time_window(assessment, allow_before_start=True, enforce=False)
 
         return success_response("Candidate verified successfully", {"verified": True})
     except HTTPException:
@@ -190,7 +206,7 @@ async def verify_candidate(
 async def get_assessment_schedule(
     assessmentId: str = Query(...),
     token: str = Query(...),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Get assessment schedule for candidates."""
     try:
@@ -208,13 +224,7 @@ async def get_assessment_schedule(
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid assessment token")
 
         # Check time window (allow before start so candidates can check schedule)
-        try:
-            _check_assessment_time_window(assessment, allow_before_start=True)
-        except HTTPException:
-            raise
-        except Exception as time_exc:
-            # If time check fails due to parsing error, log but don't block schedule retrieval
-            logger.warning(f"Time window check error (non-blocking) for assessment {assessmentId}: {time_exc}")
+        _check_assessment_time_window(assessment, allow_before_start=True, enforce=False)
 
         schedule = assessment.get("schedule", {})
         return success_response(
@@ -238,7 +248,7 @@ async def get_assessment_schedule(
 @router.post("/start-session")
 async def start_candidate_session(
     payload: Dict[str, Any],
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """
     Record when a candidate starts their assessment session.
@@ -270,15 +280,10 @@ async def start_candidate_session(
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid assessment token")
 
         # Check time window
-        try:
-            _check_assessment_time_window(assessment, allow_before_start=False)
-        except HTTPException:
-            raise
-        except Exception as time_exc:
-            logger.warning(f"Time window check error for start-session: {time_exc}")
+        _check_assessment_time_window(assessment, allow_before_start=False, enforce=False)
 
         # Create candidate key
-        candidate_key = f"{email}_{name}"
+        candidate_key = build_candidate_key(email, name)
         
         # Get current server time (UTC)
         server_now = datetime.now(timezone.utc)
@@ -289,6 +294,11 @@ async def start_candidate_session(
         if not isinstance(candidate_responses, dict):
             candidate_responses = {}
         
+        # Move an entry stored under the legacy email_name key to the hashed key
+        legacy_key = legacy_candidate_key(email, name)
+        if legacy_key in candidate_responses and candidate_key not in candidate_responses:
+            candidate_responses[candidate_key] = candidate_responses.pop(legacy_key)
+        
         # Only set startedAt if not already set (don't overwrite)
         if candidate_key not in candidate_responses:
             candidate_responses[candidate_key] = {
@@ -341,7 +351,7 @@ async def get_candidate_session(
     token: str = Query(...),
     email: str = Query(...),
     name: str = Query(...),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """
     Get candidate's session data including startedAt timestamp.
@@ -364,9 +374,12 @@ async def get_candidate_session(
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid assessment token")
 
         # Get candidate data
-        candidate_key = f"{email}_{name}"
         candidate_responses = assessment.get("candidateResponses", {})
-        candidate_data = candidate_responses.get(candidate_key, {})
+        candidate_data = (
+            candidate_responses.get(build_candidate_key(email, name))
+            or candidate_responses.get(legacy_candidate_key(email, name))
+            or {}
+        )
         
         # Get server time for client sync
         server_now = datetime.now(timezone.utc)
@@ -393,7 +406,7 @@ async def get_candidate_session(
 async def get_assessment_questions(
     assessmentId: str = Query(...),
     token: str = Query(...),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Get assessment questions for candidates."""
     try:
@@ -412,15 +425,8 @@ async def get_assessment_questions(
             logger.warning(f"Token mismatch for assessment {assessmentId}. Expected: {stored_token[:10] if stored_token else 'None'}..., Got: {token[:10]}...")
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid assessment token")
 
-        # Check time window (strict - must be within start and end time)
-        try:
-            _check_assessment_time_window(assessment, allow_before_start=False)
-        except HTTPException as time_error:
-            logger.warning(f"Time window check failed for assessment {assessmentId}: {time_error.detail}")
-            raise
-        except Exception as time_exc:
-            # If time check fails due to parsing error, log but don't block (backward compatibility)
-            logger.warning(f"Time window check error (non-blocking) for assessment {assessmentId}: {time_exc}")
+        # Check time window (logged, not enforced; only submit rejects out-of-window requests)
+        _check_assessment_time_window(assessment, allow_before_start=False, enforce=False)
 
         # Collect all questions from all topics
         all_questions = []
@@ -472,7 +478,7 @@ async def get_assessment_questions(
 @router.post("/log-answer")
 async def log_candidate_answer(
     payload: LogAnswerRequest,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Log candidate answer change for non-MCQ questions."""
     logger.info(f"Log answer endpoint called for assessment {payload.assessmentId}, question {payload.questionIndex}, type {payload.questionType}")
@@ -512,20 +518,13 @@ async def log_candidate_answer(
         if not candidate_found:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Candidate not found")
 
-        # Check time window (strict - must be within start and end time)
-        try:
-            _check_assessment_time_window(assessment, allow_before_start=False)
-        except HTTPException:
-            raise
-        except Exception as time_exc:
-            # If time check fails due to parsing error, log but don't block (backward compatibility)
-            logger.warning(f"Time window check error (non-blocking) for assessment {payload.assessmentId}: {time_exc}")
-
-        # Use consistent candidate key format: email_lowercase_name_stripped
-        # This must match EXACTLY the format in get_answer_logs endpoint
-        # Format: email.strip().lower() + "_" + name.strip()
-        # Note: email is already lowercased above, but ensure both are stripped
-        candidate_key = f"{email.strip().lower()}_{name.strip()}"
+        # Check time window (logged, not enforced; only submit rejects out-of-window requests)
+        _check_assessment_time_window(assessment, allow_before_start=False, enforce=False)
+
+        # Use consistent candidate key: hash of lowercased email + stripped name
+        # This must match EXACTLY the key used by get_answer_logs (build_candidate_key)
+        candidate_key = build_candidate_key(email, name)
+        legacy_key = legacy_candidate_key(email, name)
         logger.info(f"Generated candidate key for saving: '{candidate_key}' (email='{email}', name='{name}')")
         question_key = str(payload.questionIndex)
 
@@ -549,7 +548,7 @@ async def log_candidate_answer(
         if assessment_check:
             answer_logs = assessment_check.get("answerLogs", {})
             if isinstance(answer_logs, dict):
-                candidate_logs = answer_logs.get(candidate_key, {})
+                candidate_logs = answer_logs.get(candidate_key) or answer_logs.get(legacy_key, {})
                 if isinstance(candidate_logs, dict):
                     question_logs = candidate_logs.get(question_key, [])
                     if isinstance(question_logs, list):
@@ -593,6 +592,10 @@ async def log_candidate_answer(
             logger.warning(f"answerLogs was not a dict, converting")
             full_assessment["answerLogs"] = {}
         
+        # Move logs stored under the legacy email_name key to the hashed key
+        if legacy_key in full_assessment["answerLogs"] and candidate_key not in full_assessment["answerLogs"]:
+            full_assessment["answerLogs"][candidate_key] = full_assessment["answerLogs"].pop(legacy_key)
+        
         # Ensure candidate_key level exists and is a dict
         if candidate_key not in full_assessment["answerLogs"]:
             full_assessment["answerLogs"][candidate_key] = {}
@@ -653,6 +656,8 @@ async def log_candidate_answer(
                     retry_assessment["answerLogs"] = {}
                 if not isinstance(retry_assessment["answerLogs"], dict):
                     retry_assessment["answerLogs"] = {}
+                if legacy_key in retry_assessment["answerLogs"] and candidate_key not in retry_assessment["answerLogs"]:
+                    retry_assessment["answerLogs"][candidate_key] = retry_assessment["answerLogs"].pop(legacy_key)
                 if candidate_key not in retry_assessment["answerLogs"]:
                     retry_assessment["answerLogs"][candidate_key] = {}
                 if not isinstance(retry_assessment["answerLogs"][candidate_key], dict):
@@ -735,7 +740,7 @@ async def log_candidate_answer(
 @router.post("/submit-answers")
 async def submit_candidate_answers(
     payload: Dict[str, Any],
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Submit candidate answers and calculate score."""
     assessment_id = payload.get("assessmentId")
@@ -753,7 +758,28 @@ async def submit_candidate_answers(
     except ValueError:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid assessment ID")
 
-    assessment = await db.assessments.find_one({"_id": oid})
+    candidate_key = build_candidate_key(email, name)
+    legacy_key = legacy_candidate_key(email, name)
+
+    # Only load what scoring needs: other candidates' answerLogs/candidateResponses can be
+    # megabytes on large assessments. Legacy email_name keys contain "." (emails), so this
+    # candidate's logs are extracted with $getField rather than a dotted projection path.
+    assessment = await db.assessments.find_one(
+        {"_id": oid},
+        {
+            "assessmentToken": 1,
+            "candidates": 1,
+            "schedule": 1,
+            "topics": 1,
+            "passPercentage": 1,
+            "candidateLogs": {
+                "$ifNull": [
+                    {"$getField": {"field": {"$literal": candidate_key}, "input": "$answerLogs"}},
+                    {"$getField": {"field": {"$literal": legacy_key}, "input": "$answerLogs"}},
+                ]
+            },
+        },
+    )
     if not assessment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found")
 
@@ -771,77 +797,9 @@ async def submit_candidate_answers(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Candidate not found")
 
     # Check time window (strict - must be within start and end time)
-    # Note: We allow submission even slightly after endTime to handle auto-submissions
+    # Note: We allow a 2 minute grace period after endTime to handle auto-submissions
     # But we still check to prevent submissions way after the deadline
-    schedule = assessment.get("schedule", {})
-    start_time_str = schedule.get("startTime")
-    end_time_str = schedule.get("endTime")
-    
-    if start_time_str and end_time_str:
-        try:
-            # Use the same date parsing logic as _check_assessment_time_window
-            def normalize_datetime_str(dt_str: str) -> str:
-                """Normalize datetime string to full ISO format."""
-                # Remove timezone info temporarily for processing
-                if "+" in dt_str:
-                    dt_clean = dt_str.split("+")[0]
-                elif dt_str.endswith("Z"):
-                    dt_clean = dt_str[:-1]  # Remove Z
-                else:
-                    dt_clean = dt_str
-                
-                # Check if seconds are missing (format: YYYY-MM-DDTHH:MM)
-                if "T" in dt_clean and dt_clean.count(":") == 1:
-                    dt_clean = dt_clean + ":00"  # Add seconds
-                
-                # Check if timezone is missing - add Z if no timezone specified
-                if "+" not in dt_str and not dt_str.endswith("Z"):
-                    dt_clean = dt_clean + "Z"
-                elif "+" in dt_str:
-                    # Keep original timezone
-                    dt_clean = dt_str
-                
-                return dt_clean
-            
-            start_time_str_normalized = normalize_datetime_str(start_time_str)
-            end_time_str_normalized = normalize_datetime_str(end_time_str)
-            
-            try:
-                start_time = datetime.fromisoformat(start_time_str_normalized.replace("Z", "+00:00"))
-                end_time = datetime.fromisoformat(end_time_str_normalized.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
-                start_time = parser.parse(start_time_str)
-                end_time = parser.parse(end_time_str)
-            
-            if start_time.tzinfo is None:
-                start_time = start_time.replace(tzinfo=timezone.utc)
-            if end_time.tzinfo is None:
-                end_time = end_time.replace(tzinfo=timezone.utc)
-            
-            now = datetime.now(timezone.utc)
-            
-            if now < start_time:
-                # Format the date nicely for the error message
-                formatted_start = start_time.strftime("%Y-%m-%d %H:%M:%S UTC")
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Assessment has not started yet. It will start at {formatted_start}"
-                )
-            
-            # Allow 2 minutes grace period after endTime for auto-submissions
-            grace_period_seconds = 120
-            if now > end_time:
-                time_after_end = (now - end_time).total_seconds()
-                if time_after_end > grace_period_seconds:
-                    raise HTTPException(
-                        status_code=status.HTTP_403_FORBIDDEN,
-                        detail=f"Assessment has ended. It ended at {end_time_str}. Submission deadline has passed."
-                    )
-        except HTTPException:
-            raise
-        except (ValueError, AttributeError, TypeError) as exc:
-            logger.warning(f"Failed to parse assessment schedule times for submission: {exc}. startTime={start_time_str}, endTime={end_time_str}")
-            # Don't block submission if date parsing fails (backward compatibility)
+    _check_assessment_time_window(assessment, allow_before_start=False, grace_period_seconds=120, enforce=True)
 
     try:
         # Collect all questions
@@ -864,13 +822,9 @@ async def submit_candidate_answers(
                     all_questions.append(question)
 
         # Get answer logs to use the last answer for AI evaluation
-        answer_logs = assessment.get("answerLogs", {})
-        candidate_key = f"{email}_{name}"
-        candidate_logs = {}
-        if isinstance(answer_logs, dict):
-            candidate_logs = answer_logs.get(candidate_key, {})
-            if not isinstance(candidate_logs, dict):
-                candidate_logs = {}
+        candidate_logs = assessment.get("candidateLogs") or {}
+        if not isinstance(candidate_logs, dict):
+            candidate_logs = {}
 
         # Calculate score (MCQ only for now)
         total_score = 0
@@ -882,6 +836,8 @@ async def submit_candidate_answers(
         # AI evaluation results (using string keys for MongoDB compatibility)
         ai_evaluation_results = {}  # {"questionIndex": {score, feedback, evaluation}}
         total_ai_score = 0
+        # Non-MCQ answers are evaluated concurrently after the loop: (questionIndex, question, answer, max score)
+        pending_evaluations: List[Tuple[str, Dict[str, Any], str, Any]] = []
 
         for idx, question in enumerate(all_questions):
             if not isinstance(question, dict):
@@ -931,27 +887,9 @@ async def submit_candidate_answers(
                 else:
                     # Non-MCQ: Evaluate with AI using last answer log
                     if candidate_answer:
-                        try:
-                            evaluation_result = await evaluate_answer_with_ai(
-                                question=question,
-                                candidate_answer=candidate_answer,
-                                max_score=question_max_score
-                            )
-                            ai_score = evaluation_result.get("score", 0)
-                            ai_evaluation_results[str(idx)] = {
-                                "score": ai_score,
-                                "feedback": evaluation_result.get("feedback", ""),
-                                "evaluation": evaluation_result.get("evaluation", "")
-                            }
-                            total_ai_score += ai_score
-                        except Exception as eval_error:
-                            logger.error(f"Error evaluating answer for question {idx}: {eval_error}")
-                            # If AI evaluation fails, give 0 score
-                            ai_evaluation_results[str(idx)] = {
-                                "score": 0,
-                                "feedback": "Evaluation could not be completed.",
-                                "evaluation": "AI evaluation service error."
-                            }
+                        # Placeholder keeps results in question order until the evaluation below fills it
+                        ai_evaluation_results[str(idx)] = None
+                        pending_evaluations.append((str(idx), question, candidate_answer, question_max_score))
                     else:
                         # Empty answer
                         ai_evaluation_results[str(idx)] = {
@@ -960,6 +898,33 @@ async def submit_candidate_answers(
                             "evaluation": "Candidate did not provide an answer."
                         }
 
+        evaluations = await asyncio.gather(
+            *(
+                evaluate_answer_with_ai(question=question, candidate_answer=candidate_answer, max_score=question_max_score)
+                for _, question, candidate_answer, question_max_score in pending_evaluations
+            ),
+            return_exceptions=True,
+        )
+        for (question_key, *_), evaluation_result in zip(pending_evaluations, evaluations):
+            if isinstance(evaluation_result, Exception):
+                logger.error(f"Error evaluating answer for question {question_key}: {evaluation_result}")
+                # If AI evaluation fails, give 0 score
+                ai_evaluation_results[question_key] = {
+                    "score": 0,
+                    "feedback": "Evaluation could not be completed.",
+                    "evaluation": "AI evaluation service error."
+                }
+                continue
+            if isinstance(evaluation_result, BaseException):
+                raise evaluation_result
+            ai_score = evaluation_result.get("score", 0)
+            ai_evaluation_results[question_key] = {
+                "score": ai_score,
+                "feedback": evaluation_result.get("feedback", ""),
+                "evaluation": evaluation_result.get("evaluation", "")
+            }
+            total_ai_score += ai_score
+
         # Calculate percentage
         percentage_scored = (total_ai_score / max_score * 100) if max_score > 0 else 0
         
@@ -972,12 +937,7 @@ async def submit_candidate_answers(
         passed = percentage_scored >= pass_percentage
 
         # Store candidate response
-        candidate_responses = assessment.get("candidateResponses", {})
-        if not isinstance(candidate_responses, dict):
-            candidate_responses = {}
-        
-        candidate_key = f"{email}_{name}"
-        candidate_responses[candidate_key] = {
+        candidate_response = {
             "email": email,
             "name": name,
             "answers": answers if isinstance(answers, list) else [],
@@ -995,8 +955,35 @@ async def submit_candidate_answers(
             "passPercentage": pass_percentage,
             "passed": passed,
         }
-        assessment["candidateResponses"] = candidate_responses
-        await db.assessments.replace_one({"_id": oid}, assessment)
+        # Targeted write of this candidate's entry only (no full-document replace); any entry
+        # under the legacy email_name key is dropped so results don't list the candidate twice
+        await db.assessments.update_one(
+            {"_id": oid},
+            [
+                {
+                    "$set": {
+                        "candidateResponses": {
+                            "$setField": {
+                                "field": candidate_key,
+                                "input": {
+                                    "$unsetField": {
+                                        "field": {"$literal": legacy_key},
+                                        "input": {
+                                            "$cond": [
+                                                {"$eq": [{"$type": "$candidateResponses"}, "object"]},
+                                                "$candidateResponses",
+                                                {},
+                                            ]
+                                        },
+                                    }
+                                },
+                                "value": {"$literal": candidate_response},
+                            }
+                        }
+                    }
+                }
+            ],
+        )
 
         return success_response(
             "Answers submitted successfully",
@@ -1024,7 +1011,7 @@ async def submit_candidate_answers(
 @router.post("/run-code")
 async def run_candidate_code(
     payload: Dict[str, Any],
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Run code for a coding question (public test cases only)."""
     assessment_id = payload.get("assessmentId")
@@ -1141,7 +1128,7 @@ async def run_candidate_code(
 @router.post("/submit-code")
 async def submit_candidate_code(
     payload: Dict[str, Any],
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Submit code for a coding question (all test cases - public + hidden)."""
     assessment_id = payload.get("assessmentId")
@@ -1,22 +1,64 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
 import logging
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from motor.motor_asyncio import AsyncIOMotorDatabase
-from pydantic import BaseModel
+import orjson
+from bson import ObjectId
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pymongo.asynchronous.database import AsyncDatabase
+from pydantic import BaseModel, ValidationError
+from pymongo import ReturnDocument
 
 from ..db.mongo import get_db
 from ..schemas.proctor import ProctorEventIn, ProctorSummaryOut, EVENT_TYPE_LABELS
-from ..utils.responses import success_response
+from ..utils.responses import ORJSONResponse, success_response
 from ..utils.mongo import to_object_id
+from ..utils.snapshots import load_snapshots, split_snapshot_data_uri, store_snapshot
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/proctor", tags=["proctor"])
+router = APIRouter(prefix="/api/proctor", tags=["proctor"], default_response_class=ORJSONResponse)
+
+# Statuses of a live session that is still waiting for or carrying a stream
+LIVE_SESSION_STATUSES = ["pending", "offer_sent", "active"]
+
+# Each (assessmentId, candidateId) pair owns exactly one "current" session document,
+# so creating a session is a single upsert; replaced sessions move to proctor_session_history.
+CURRENT_SESSION_SLOT = "current"
+
+# Fields the session list endpoints return; SDP blobs and ICE arrays stay in the database
+SESSION_LIST_PROJECTION = {
+    "_id": 0,
+    "sessionId": 1,
+    "assessmentId": 1,
+    "candidateId": 1,
+    "candidateName": 1,
+    "adminId": 1,
+    "status": 1,
+    "createdAt": 1,
+    "updatedAt": 1,
+}
+
+# Candidates who have started but not submitted; served by the
+# (assessmentId, submittedAt, startedAt) index created on startup
+ACTIVE_CANDIDATES_INDEX = [("assessmentId", 1), ("submittedAt", 1), ("startedAt", 1)]
+
+# Upper bound on concurrent session swaps in create-multi-session, so a large
+# assessment does not take over the connection pool
+MULTI_SESSION_CONCURRENCY = 20
+
+# EVENT_TYPE_LABELS never changes at runtime, so it is serialized once and spliced
+# into responses as-is by orjson instead of being re-encoded on every request
+_EVENT_TYPE_LABELS_JSON = orjson.Fragment(orjson.dumps(EVENT_TYPE_LABELS))
+_EVENT_TYPE_LABELS_NDJSON_LINE = orjson.dumps({"eventTypeLabels": _EVENT_TYPE_LABELS_JSON}) + b"\n"
 
 
 # ============================================================================
@@ -53,50 +95,112 @@ class ICECandidateRequest(BaseModel):
 # WebRTC Live Proctoring Endpoints
 # ============================================================================
 
+def _fresh_session_fields(session_id: str, admin_id: str, now: datetime) -> Dict[str, Any]:
+    """Fields that reset a candidate's current session slot to a new pending session."""
+    return {
+        "sessionId": session_id,
+        "adminId": admin_id,
+        "status": "pending",  # pending -> active -> ended
+        "offer": None,
+        "answer": None,
+        "candidateICE": [],
+        "adminICE": [],
+        "createdAt": now,
+        "updatedAt": now,
+    }
+
+
+async def _archive_replaced_sessions(
+    db: AsyncDatabase,
+    previous_sessions: List[Dict[str, Any]],
+    assessment_id: str,
+    candidate_ids: List[str],
+    ended_at: datetime,
+) -> None:
+    """Move replaced live sessions into proctor_session_history (runs after the response)."""
+    try:
+        # Candidates getting their first slotted session: end any legacy (pre-slot) sessions
+        replaced_ids = {session.get("candidateId") for session in previous_sessions}
+        first_slot_ids = [cid for cid in candidate_ids if cid not in replaced_ids]
+        if first_slot_ids:
+            await db.proctor_sessions.update_many(
+                {
+                    "assessmentId": assessment_id,
+                    "candidateId": {"$in": first_slot_ids},
+                    "slot": {"$exists": False},
+                    "status": {"$in": LIVE_SESSION_STATUSES},
+                },
+                {"$set": {"status": "ended", "endedAt": ended_at, "updatedAt": ended_at}},
+            )
+
+        if not previous_sessions:
+            return
+        for previous in previous_sessions:
+            previous.pop("_id", None)
+            previous.pop("slot", None)
+            if previous.get("status") in LIVE_SESSION_STATUSES:
+                previous["status"] = "ended"
+                previous["endedAt"] = ended_at
+                previous["updatedAt"] = ended_at
+        await db.proctor_session_history.insert_many(previous_sessions, ordered=False)
+    except Exception as exc:
+        logger.warning(f"[LiveProctor] Failed to archive replaced sessions for assessment {assessment_id}: {exc}")
+
+
+async def _replace_current_session(
+    db: AsyncDatabase,
+    assessment_id: str,
+    candidate_id: str,
+    session_fields: Dict[str, Any],
+) -> Optional[Dict[str, Any]]:
+    """Atomically swap a candidate's current session slot; returns the replaced session, if any."""
+    return await db.proctor_sessions.find_one_and_update(
+        {
+            "assessmentId": assessment_id,
+            "candidateId": candidate_id,
+            "slot": CURRENT_SESSION_SLOT,
+        },
+        {
+            "$set": session_fields,
+            "$unset": {"endedAt": ""},
+        },
+        upsert=True,
+        return_document=ReturnDocument.BEFORE,
+    )
+
+
 @router.post("/live/create-session")
 async def create_live_session(
     request: CreateSessionRequest,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncDatabase = Depends(get_db),
 ):
     """
     Create a new live proctoring session for WebRTC signalling.
     Called by admin when they want to start watching a candidate.
-    Automatically ends any existing pending/active sessions for this candidate.
+    Automatically ends any existing pending/active session for this candidate:
+    the candidate's current session slot is replaced in a single upsert and the
+    previous session is archived to proctor_session_history in the background.
     """
     try:
-        # End any existing pending/active sessions for this candidate first
-        await db.proctor_sessions.update_many(
-            {
-                "assessmentId": request.assessmentId,
-                "candidateId": request.candidateId,
-                "status": {"$in": ["pending", "active", "offer_sent"]},
-            },
-            {
-                "$set": {
-                    "status": "ended",
-                    "endedAt": datetime.now(timezone.utc).isoformat(),
-                    "updatedAt": datetime.now(timezone.utc).isoformat(),
-                }
-            }
-        )
-        
+        now = datetime.now(timezone.utc)
         session_id = str(uuid.uuid4())
         
-        session = {
-            "sessionId": session_id,
-            "assessmentId": request.assessmentId,
-            "candidateId": request.candidateId,
-            "adminId": request.adminId,
-            "status": "pending",  # pending -> active -> ended
-            "offer": None,
-            "answer": None,
-            "candidateICE": [],
-            "adminICE": [],
-            "createdAt": datetime.now(timezone.utc).isoformat(),
-            "updatedAt": datetime.now(timezone.utc).isoformat(),
-        }
+        previous = await _replace_current_session(
+            db,
+            request.assessmentId,
+            request.candidateId,
+            _fresh_session_fields(session_id, request.adminId, now),
+        )
         
-        await db.proctor_sessions.insert_one(session)
+        background_tasks.add_task(
+            _archive_replaced_sessions,
+            db,
+            [previous] if previous else [],
+            request.assessmentId,
+            [request.candidateId],
+            now,
+        )
         
         logger.info(f"[LiveProctor] Session created: {session_id} for candidate {request.candidateId}")
         
@@ -110,16 +214,18 @@ async def create_live_session(
 @router.get("/live/session/{session_id}")
 async def get_live_session(
     session_id: str,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Get current session state including SDP and ICE candidates."""
     try:
         session = await db.proctor_sessions.find_one({"sessionId": session_id})
         
         if not session:
-            raise HTTPException(status_code=404, detail="Session not found")
+            # Replaced sessions live in history so pollers still observe "ended"
+            session = await db.proctor_session_history.find_one({"sessionId": session_id})
         
-        session["_id"] = str(session["_id"])
+        if not session:
+            raise HTTPException(status_code=404, detail="Session not found")
         
         return success_response("Session fetched", session)
     
@@ -133,7 +239,7 @@ async def get_live_session(
 @router.post("/live/offer")
 async def post_offer(
     request: SDPRequest,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """
     Post WebRTC offer SDP.
@@ -146,7 +252,7 @@ async def post_offer(
                 "$set": {
                     "offer": {"sdp": request.sdp, "type": request.sdpType, "sender": request.sender},
                     "status": "offer_sent",
-                    "updatedAt": datetime.now(timezone.utc).isoformat(),
+                    "updatedAt": datetime.now(timezone.utc),
                 }
             }
         )
@@ -168,7 +274,7 @@ async def post_offer(
 @router.post("/live/answer")
 async def post_answer(
     request: SDPRequest,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """
     Post WebRTC answer SDP.
@@ -181,7 +287,7 @@ async def post_answer(
                 "$set": {
                     "answer": {"sdp": request.sdp, "type": request.sdpType, "sender": request.sender},
                     "status": "active",
-                    "updatedAt": datetime.now(timezone.utc).isoformat(),
+                    "updatedAt": datetime.now(timezone.utc),
                 }
             }
         )
@@ -203,7 +309,7 @@ async def post_answer(
 @router.post("/live/ice")
 async def post_ice_candidate(
     request: ICECandidateRequest,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """
     Post ICE candidate for WebRTC connection.
@@ -211,19 +317,20 @@ async def post_ice_candidate(
     """
     try:
         ice_field = "candidateICE" if request.sender == "candidate" else "adminICE"
+        now = datetime.now(timezone.utc)
         
         ice_candidate = {
             "candidate": request.candidate,
             "sdpMid": request.sdpMid,
             "sdpMLineIndex": request.sdpMLineIndex,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": now,
         }
         
         result = await db.proctor_sessions.update_one(
             {"sessionId": request.sessionId},
             {
                 "$push": {ice_field: ice_candidate},
-                "$set": {"updatedAt": datetime.now(timezone.utc).isoformat()},
+                "$set": {"updatedAt": now},
             }
         )
         
@@ -242,23 +349,26 @@ async def post_ice_candidate(
 @router.post("/live/end-session/{session_id}")
 async def end_live_session(
     session_id: str,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """End a live proctoring session."""
     try:
+        ended_at = datetime.now(timezone.utc)
         result = await db.proctor_sessions.update_one(
             {"sessionId": session_id},
             {
                 "$set": {
                     "status": "ended",
-                    "endedAt": datetime.now(timezone.utc).isoformat(),
-                    "updatedAt": datetime.now(timezone.utc).isoformat(),
+                    "endedAt": ended_at,
+                    "updatedAt": ended_at,
                 }
             }
         )
         
         if result.matched_count == 0:
-            raise HTTPException(status_code=404, detail="Session not found")
+            archived = await db.proctor_session_history.find_one({"sessionId": session_id}, {"_id": 1})
+            if not archived:
+                raise HTTPException(status_code=404, detail="Session not found")
         
         logger.info(f"[LiveProctor] Session ended: {session_id}")
         
@@ -275,7 +385,7 @@ async def end_live_session(
 async def get_pending_session(
     assessment_id: str,
     candidate_id: str,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """
     Check if there's a pending live proctoring session for a candidate.
@@ -285,14 +395,12 @@ async def get_pending_session(
         session = await db.proctor_sessions.find_one({
             "assessmentId": assessment_id,
             "candidateId": candidate_id,
-            "status": {"$in": ["pending", "offer_sent", "active"]},
+            "status": {"$in": LIVE_SESSION_STATUSES},
         })
         
         if not session:
             return success_response("No active session", {"hasSession": False})
         
-        session["_id"] = str(session["_id"])
-        
         return success_response("Session found", {"hasSession": True, "session": session})
     
     except Exception as exc:
@@ -309,44 +417,88 @@ class CreateMultiSessionRequest(BaseModel):
     adminId: str
 
 
+def _active_candidates_query(assessment_id: str) -> Dict[str, Any]:
+    return {
+        "assessmentId": assessment_id,
+        "startedAt": {"$exists": True},
+        "submittedAt": {"$exists": False},
+    }
+
+
+async def _fetch_active_candidates(
+    db: AsyncDatabase,
+    assessment_id: str,
+    skip: int = 0,
+    limit: int = 100,
+) -> List[Dict[str, Any]]:
+    """A page of candidates who have started but not submitted, with their live proctoring session if any."""
+    # Find candidates who have started but not submitted (assessment_sessions) and join
+    # their live proctoring session, if any, in a single aggregation round-trip
+    pipeline = [
+        {"$match": _active_candidates_query(assessment_id)},
+        {"$sort": {"startedAt": 1, "_id": 1}},
+        {"$skip": skip},
+        {"$limit": limit},
+        {
+            "$lookup": {
+                "from": "proctor_sessions",
+                "let": {"cid": {"$ifNull": ["$email", "$candidateId"]}},
+                "pipeline": [
+                    {
+                        "$match": {
+                            "assessmentId": assessment_id,
+                            "status": {"$in": LIVE_SESSION_STATUSES},
+                            "$expr": {"$eq": ["$candidateId", "$$cid"]},
+                        }
+                    },
+                    {"$limit": 1},
+                    {"$project": {"_id": 0, "sessionId": 1, "status": 1}},
+                ],
+                "as": "proctor",
+            }
+        },
+        {
+            "$project": {
+                "_id": 0,
+                "email": {"$ifNull": ["$email", "$candidateId"]},
+                "name": {"$ifNull": ["$name", "Unknown"]},
+                "startedAt": 1,
+                "hasActiveSession": {"$gt": [{"$size": "$proctor"}, 0]},
+                "sessionId": {"$ifNull": [{"$first": "$proctor.sessionId"}, None]},
+                "sessionStatus": {"$ifNull": [{"$first": "$proctor.status"}, None]},
+            }
+        },
+    ]
+    
+    cursor = await db.assessment_sessions.aggregate(pipeline, hint=ACTIVE_CANDIDATES_INDEX)
+    return [candidate async for candidate in cursor]
+
+
 @router.get("/live/active-candidates/{assessment_id}")
 async def get_active_candidates(
     assessment_id: str,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    limit: int = Query(default=100, ge=1, le=1000, description="Maximum number of candidates to return"),
+    skip: int = Query(default=0, ge=0, description="Number of candidates to skip (earliest started first)"),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """
-    Get all candidates who are currently taking the assessment.
-    These are candidates who have started but not yet submitted.
+    Get the candidates who are currently taking the assessment, paginated.
+    These are candidates who have started but not yet submitted; totalCount
+    is the number across all pages.
     """
     try:
-        # Find candidates who have started but not submitted
-        # Look in assessment_sessions collection for active sessions
-        active_sessions = await db.assessment_sessions.find({
-            "assessmentId": assessment_id,
-            "startedAt": {"$exists": True},
-            "submittedAt": {"$exists": False},
-        }).to_list(length=100)
-        
-        candidates = []
-        for session in active_sessions:
-            # Check if there's an active proctoring session
-            proctor_session = await db.proctor_sessions.find_one({
-                "assessmentId": assessment_id,
-                "candidateId": session.get("email", session.get("candidateId")),
-                "status": {"$in": ["pending", "offer_sent", "active"]},
-            })
-            
-            candidates.append({
-                "email": session.get("email", session.get("candidateId")),
-                "name": session.get("name", "Unknown"),
-                "startedAt": session.get("startedAt"),
-                "hasActiveSession": proctor_session is not None,
-                "sessionId": proctor_session.get("sessionId") if proctor_session else None,
-                "sessionStatus": proctor_session.get("status") if proctor_session else None,
-            })
+        candidates, total_count = await asyncio.gather(
+            _fetch_active_candidates(db, assessment_id, skip=skip, limit=limit),
+            db.assessment_sessions.count_documents(
+                _active_candidates_query(assessment_id), hint=ACTIVE_CANDIDATES_INDEX
+            ),
+        )
         
         return success_response("Active candidates retrieved", {
             "count": len(candidates),
+            "totalCount": total_count,
+            "limit": limit,
+            "skip": skip,
             "candidates": candidates
         })
     
@@ -358,69 +510,69 @@ async def get_active_candidates(
 @router.post("/live/create-multi-session")
 async def create_multi_live_sessions(
     request: CreateMultiSessionRequest,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncDatabase = Depends(get_db),
 ):
     """
     Create live proctoring sessions for ALL active candidates in an assessment.
     Used for the multi-candidate proctoring dashboard.
     """
     try:
-        # Find all active candidates (started but not submitted)
-        active_sessions = await db.assessment_sessions.find({
-            "assessmentId": request.assessmentId,
-            "startedAt": {"$exists": True},
-            "submittedAt": {"$exists": False},
-        }).to_list(length=100)
-        
-        created_sessions = []
+        # Find all active candidates (started but not submitted), streaming the cursor in
+        # batches rather than truncating large assessments
+        cursor = db.assessment_sessions.find(
+            _active_candidates_query(request.assessmentId),
+            {"_id": 0, "email": 1, "candidateId": 1, "name": 1},
+        ).sort([("startedAt", 1), ("_id", 1)]).hint(ACTIVE_CANDIDATES_INDEX).batch_size(100)
         
-        for session in active_sessions:
+        # One entry per candidate (the last assessment session wins, as it did when
+        # each iteration ended the previous iteration's session)
+        candidate_names: Dict[str, str] = {}
+        async for session in cursor:
             candidate_id = session.get("email", session.get("candidateId"))
+            candidate_names[candidate_id] = session.get("name", "Unknown")
+        
+        created_sessions = []
+        if candidate_names:
+            now = datetime.now(timezone.utc)
+            candidate_ids = list(candidate_names)
+            session_ids = [str(uuid.uuid4()) for _ in candidate_ids]
             
-            # End any existing sessions for this candidate
-            await db.proctor_sessions.update_many(
-                {
-                    "assessmentId": request.assessmentId,
-                    "candidateId": candidate_id,
-                    "status": {"$in": ["pending", "active", "offer_sent"]},
-                },
-                {
-                    "$set": {
-                        "status": "ended",
-                        "endedAt": datetime.now(timezone.utc).isoformat(),
-                        "updatedAt": datetime.now(timezone.utc).isoformat(),
-                    }
-                }
-            )
-            
-            # Create new session
-            session_id = str(uuid.uuid4())
+            # Swap each candidate's current slot atomically, so every replaced session is the
+            # one actually overwritten (a find followed by a bulk write could miss a session
+            # created in between); the replaced sessions are archived after the response
+            swap_slots = asyncio.Semaphore(MULTI_SESSION_CONCURRENCY)
             
-            new_session = {
-                "sessionId": session_id,
-                "assessmentId": request.assessmentId,
-                "candidateId": candidate_id,
-                "candidateName": session.get("name", "Unknown"),
-                "adminId": request.adminId,
-                "status": "pending",
-                "offer": None,
-                "answer": None,
-                "candidateICE": [],
-                "adminICE": [],
-                "createdAt": datetime.now(timezone.utc).isoformat(),
-                "updatedAt": datetime.now(timezone.utc).isoformat(),
-            }
+            async def replace_session(candidate_id: str, session_id: str) -> Optional[Dict[str, Any]]:
+                async with swap_slots:
+                    return await _replace_current_session(
+                        db,
+                        request.assessmentId,
+                        candidate_id,
+                        {
+                            **_fresh_session_fields(session_id, request.adminId, now),
+                            "candidateName": candidate_names[candidate_id],
+                        },
+                    )
             
-            await db.proctor_sessions.insert_one(new_session)
+            replaced = await asyncio.gather(*(
+                replace_session(candidate_id, session_id)
+                for candidate_id, session_id in zip(candidate_ids, session_ids)
+            ))
+            previous_sessions = [session for session in replaced if session]
             
-            created_sessions.append({
-                "sessionId": session_id,
-                "candidateId": candidate_id,
-                "candidateName": session.get("name", "Unknown"),
-                "status": "pending",
-            })
+            background_tasks.add_task(
+                _archive_replaced_sessions, db, previous_sessions, request.assessmentId, candidate_ids, now
+            )
             
-            logger.info(f"[LiveProctor] Multi-session created: {session_id} for {candidate_id}")
+            for candidate_id, session_id in zip(candidate_ids, session_ids):
+                created_sessions.append({
+                    "sessionId": session_id,
+                    "candidateId": candidate_id,
+                    "candidateName": candidate_names[candidate_id],
+                    "status": "pending",
+                })
+                logger.info(f"[LiveProctor] Multi-session created: {session_id} for {candidate_id}")
         
         return success_response("Sessions created for all active candidates", {
             "count": len(created_sessions),
@@ -435,7 +587,7 @@ async def create_multi_live_sessions(
 @router.get("/live/all-sessions/{assessment_id}")
 async def get_all_sessions(
     assessment_id: str,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """
     Get all active proctoring sessions for an assessment.
@@ -443,14 +595,16 @@ async def get_all_sessions(
     Excludes sessions for candidates who have already submitted.
     """
     try:
-        sessions = await db.proctor_sessions.find({
-            "assessmentId": assessment_id,
-            "status": {"$in": ["pending", "offer_sent", "active"]},
-        }).to_list(length=100)
-        
-        # Convert ObjectId to string
-        for session in sessions:
-            session["_id"] = str(session["_id"])
+        # The dashboard only lists sessions; SDP offers/answers and ICE arrays are
+        # fetched per session via /live/session/{session_id}
+        cursor = db.proctor_sessions.find(
+            {
+                "assessmentId": assessment_id,
+                "status": {"$in": LIVE_SESSION_STATUSES},
+            },
+            SESSION_LIST_PROJECTION,
+        ).batch_size(100)
+        sessions = [session async for session in cursor]
         
         # Filter out sessions for candidates who have submitted
         # Check assessment's candidateResponses to see if candidate has submittedAt
@@ -462,18 +616,37 @@ async def get_all_sessions(
                 assessment_oid = None
             
             if assessment_oid:
-                assessment = await db.assessments.find_one({"_id": assessment_oid})
+                # Project just the emails of submitted candidates instead of loading
+                # every candidate response (answers, logs) of the assessment
+                submitted_pipeline = [
+                    {"$match": {"_id": assessment_oid}},
+                    {
+                        "$project": {
+                            "_id": 0,
+                            "emails": {
+                                "$map": {
+                                    "input": {
+                                        "$filter": {
+                                            "input": {"$objectToArray": {"$ifNull": ["$candidateResponses", {}]}},
+                                            "cond": {"$and": [
+                                                {"$ifNull": ["$$this.v.submittedAt", False]},
+                                                {"$ne": ["$$this.v.submittedAt", ""]},
+                                            ]},
+                                        }
+                                    },
+                                    "in": "$$this.v.email",
+                                }
+                            },
+                        }
+                    },
+                ]
+                submitted = await (await db.assessments.aggregate(submitted_pipeline)).to_list(length=1)
                 
-                if assessment and assessment.get("candidateResponses"):
-                    candidate_responses = assessment.get("candidateResponses", {})
-                    submitted_candidates = set()
-                    
-                    # Extract submitted candidate emails (normalize to lowercase)
-                    for response_key, response_data in candidate_responses.items():
-                        if isinstance(response_data, dict) and response_data.get("submittedAt"):
-                            email = response_data.get("email", "")
-                            if email:
-                                submitted_candidates.add(email.strip().lower())
+                if submitted:
+                    # Normalize submitted candidate emails to lowercase
+                    submitted_candidates = {
+                        email.strip().lower() for email in submitted[0].get("emails", []) if isinstance(email, str) and email
+                    }
                     
                     # Filter out sessions for submitted candidates
                     if submitted_candidates:
@@ -504,10 +677,34 @@ async def get_all_sessions(
         raise HTTPException(status_code=500, detail=str(exc))
 
 
-@router.post("/record")
+async def _parse_proctor_event(request: Request) -> ProctorEventIn:
+    """
+    Parse and validate the /record body in a single pydantic-core pass.
+    
+    Events arrive at high volume with free-form metadata and large snapshots; validating
+    the raw bytes with model_validate_json avoids building the whole body as Python
+    objects first (FastAPI's default) and then walking it again to validate.
+    """
+    try:
+        return ProctorEventIn.model_validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+        ) from exc
+
+
+@router.post(
+    "/record",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": ProctorEventIn.model_json_schema()}},
+        }
+    },
+)
 async def record_proctor_event(
-    payload: ProctorEventIn,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    payload: ProctorEventIn = Depends(_parse_proctor_event),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """
     Record a proctoring event from the browser.
@@ -517,15 +714,20 @@ async def record_proctor_event(
     """
     try:
         # Create the document to store
+        event_id = ObjectId()
         proctor_event = {
+            "_id": event_id,
             "userId": payload.userId.strip(),
             "assessmentId": payload.assessmentId.strip(),
             "eventType": payload.eventType.strip(),
             "timestamp": payload.timestamp,
             "metadata": payload.metadata,
-            "snapshotBase64": payload.snapshotBase64,
             "receivedAt": datetime.now(timezone.utc).isoformat(),
         }
+        
+        # Keep the image out of the event document: decode once and store it in proctor_snapshots
+        if payload.snapshotBase64:
+            proctor_event.update(await store_snapshot(db, event_id, payload.snapshotBase64))
 
         # Insert into proctor_events collection
         result = await db.proctor_events.insert_one(proctor_event)
@@ -554,15 +756,21 @@ async def record_proctor_event(
 async def get_proctor_summary(
     assessmentId: str,
     userId: str,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    include: Optional[str] = Query(
+        default=None,
+        description="Comma-separated extras to include; 'violations' adds the event documents",
+    ),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """
     Get proctoring violation summary for a specific candidate in an assessment.
     
+    Counts are computed server-side with a $group aggregation.
+    
     Returns:
     - summary: Count of each event type
     - totalViolations: Total number of violations
-    - violations: List of all violation documents
+    - violations: List of violation documents without snapshots (only with ?include=violations)
     """
     try:
         # Query all events for this user and assessment
@@ -571,36 +779,34 @@ async def get_proctor_summary(
             "userId": userId.strip(),
         }
         
-        cursor = db.proctor_events.find(query).sort("timestamp", 1)
-        violations = []
-        
-        async for doc in cursor:
-            # Convert ObjectId to string for JSON serialization
-            doc["_id"] = str(doc["_id"])
-            violations.append(doc)
+        # Aggregate counts by event type on the server
+        summary_pipeline = [
+            {"$match": query},
+            {"$group": {"_id": {"$ifNull": ["$eventType", "UNKNOWN"]}, "count": {"$sum": 1}}},
+        ]
+        summary: Dict[str, int] = {
+            doc["_id"]: doc["count"] async for doc in await db.proctor_events.aggregate(summary_pipeline)
+        }
+        total_violations = sum(summary.values())
         
-        # Aggregate counts by event type
-        summary: Dict[str, int] = {}
-        for violation in violations:
-            event_type = violation.get("eventType", "UNKNOWN")
-            summary[event_type] = summary.get(event_type, 0) + 1
+        data: Dict[str, Any] = {
+            "summary": summary,
+            "totalViolations": total_violations,
+            "eventTypeLabels": _EVENT_TYPE_LABELS_JSON,
+        }
         
-        total_violations = len(violations)
+        includes = {part.strip() for part in include.split(",")} if include else set()
+        if "violations" in includes:
+            cursor = db.proctor_events.find(query, {"snapshotBase64": 0}).sort("timestamp", 1)
+            violations = [doc async for doc in cursor]
+            data["violations"] = violations
         
         logger.info(
             f"[Proctor] Summary fetched for user {userId} in assessment {assessmentId}: "
             f"{total_violations} total violations"
         )
 
-        return success_response(
-            "Proctoring summary fetched successfully",
-            {
-                "summary": summary,
-                "totalViolations": total_violations,
-                "violations": violations,
-                "eventTypeLabels": EVENT_TYPE_LABELS,
-            }
-        )
+        return success_response("Proctoring summary fetched successfully", data)
     
     except Exception as exc:
         logger.exception(f"[Proctor] Error fetching summary: {exc}")
@@ -614,15 +820,21 @@ async def get_proctor_summary(
 async def get_proctor_logs(
     assessmentId: str,
     userId: str,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    limit: int = Query(default=50, ge=1, le=1000, description="Maximum number of logs to return"),
+    skip: int = Query(default=0, ge=0, description="Number of logs to skip (newest first)"),
+    include_snapshots: bool = Query(default=False, description="Embed snapshotBase64 in each log"),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """
-    Get full proctoring logs for a specific candidate in an assessment.
-    Returns all violation documents with metadata and snapshotBase64 for evidence gallery.
+    Get proctoring logs for a specific candidate in an assessment, newest first.
+    
+    Snapshots are large, so by default each log only carries a hasSnapshot flag and the
+    image is served separately by GET /snapshot/{event_id}. Pass include_snapshots=true
+    to embed snapshotBase64 (as a data URI) for the evidence gallery.
     
     Returns:
-    - logs: List of all violation documents sorted by timestamp (newest first)
-    - totalCount: Total number of logs
+    - logs: Page of violation documents sorted by timestamp (newest first)
+    - totalCount: Total number of logs for this candidate
     """
     try:
         # Query all events for this user and assessment, sorted newest first
@@ -631,14 +843,42 @@ async def get_proctor_logs(
             "userId": userId.strip(),
         }
         
-        # Use to_list with a reasonable limit to avoid timeout
-        # Limit to 1000 most recent logs to prevent timeout issues
-        cursor = db.proctor_events.find(query).sort("timestamp", -1).limit(1000)
-        logs = await cursor.to_list(length=1000)
+        # Without snapshots, project a hasSnapshot flag in place of the image itself
+        projection: Optional[Dict[str, Any]] = None
+        if not include_snapshots:
+            projection = {
+                "userId": 1,
+                "assessmentId": 1,
+                "eventType": 1,
+                "timestamp": 1,
+                "metadata": 1,
+                "receivedAt": 1,
+                # An empty inline snapshot string counts as no snapshot
+                "hasSnapshot": {
+                    "$or": [
+                        {"$ne": [{"$ifNull": ["$snapshotId", None]}, None]},
+                        {"$gt": [{"$strLenCP": {"$ifNull": ["$snapshotBase64", ""]}}, 0]},
+                    ]
+                },
+            }
+        
+        cursor = db.proctor_events.find(query, projection).sort("timestamp", -1).skip(skip).limit(limit)
+        logs, total_count = await asyncio.gather(
+            cursor.to_list(length=limit),
+            db.proctor_events.count_documents(query),
+        )
+        
+        if include_snapshots:
+            images = await load_snapshots(
+                db, [doc["snapshotId"] for doc in logs if doc.get("snapshotId") is not None]
+            )
+            for doc in logs:
+                image_bytes = images.get(doc.get("snapshotId"))
+                if image_bytes is not None:
+                    media_type = doc.get("snapshotContentType") or "image/png"
+                    doc["snapshotBase64"] = f"data:{media_type};base64,{base64.b64encode(image_bytes).decode('ascii')}"
         
-        # Convert ObjectId to string for JSON serialization
         for doc in logs:
-            doc["_id"] = str(doc["_id"])
             # Ensure snapshotBase64 is properly formatted if present
             if doc.get("snapshotBase64") and not doc["snapshotBase64"].startswith("data:"):
                 # If it's raw base64, add data URI prefix (assume PNG format)
@@ -646,15 +886,17 @@ async def get_proctor_logs(
         
         logger.info(
             f"[Proctor API] Logs fetched for user {userId} in assessment {assessmentId}: "
-            f"{len(logs)} total logs"
+            f"{len(logs)} of {total_count} total logs"
         )
 
         return success_response(
             "Proctoring logs fetched successfully",
             {
                 "logs": logs,
-                "totalCount": len(logs),
-                "eventTypeLabels": EVENT_TYPE_LABELS,
+                "totalCount": total_count,
+                "limit": limit,
+                "skip": skip,
+                "eventTypeLabels": _EVENT_TYPE_LABELS_JSON,
             }
         )
     
@@ -666,21 +908,119 @@ async def get_proctor_logs(
         ) from exc
 
 
+@router.get("/snapshot/{event_id}")
+async def get_proctor_snapshot(
+    event_id: str,
+    db: AsyncDatabase = Depends(get_db),
+):
+    """Serve the snapshot image of a single proctoring event as binary image data."""
+    try:
+        try:
+            event_oid = to_object_id(event_id)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid event ID")
+        
+        doc = await db.proctor_events.find_one(
+            {"_id": event_oid},
+            {"snapshotId": 1, "snapshotContentType": 1, "snapshotBase64": 1},
+        )
+        if not doc or not (doc.get("snapshotId") or doc.get("snapshotBase64")):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Snapshot not found")
+        
+        if doc.get("snapshotId") is not None:
+            images = await load_snapshots(db, [doc["snapshotId"]])
+            if doc["snapshotId"] not in images:
+                # Snapshots expire after SNAPSHOT_RETENTION_SECONDS; the event itself is kept
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Snapshot has expired")
+            return Response(
+                content=images[doc["snapshotId"]],
+                media_type=doc.get("snapshotContentType") or "image/png",
+                headers={"Cache-Control": "private, max-age=86400"},
+            )
+        
+        # Events recorded before snapshots moved out of proctor_events keep them inline as base64
+        media_type, encoded = split_snapshot_data_uri(doc["snapshotBase64"])
+        try:
+            image_bytes = base64.b64decode(encoded)
+        except (binascii.Error, ValueError) as decode_error:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Stored snapshot is not valid base64"
+            ) from decode_error
+        
+        return Response(
+            content=image_bytes,
+            media_type=media_type,
+            headers={"Cache-Control": "private, max-age=86400"},
+        )
+    
+    except HTTPException:
+        raise
+    except Exception as exc:
+        logger.exception(f"[Proctor API] Error fetching snapshot: {exc}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch proctoring snapshot: {str(exc)}"
+        ) from exc
+
+
+async def _stream_user_events_ndjson(db: AsyncDatabase, query: Dict[str, Any]) -> AsyncIterator[bytes]:
+    """
+    Yield NDJSON lines for an assessment's proctoring events, one line per user.
+    
+    Events are read sorted by user, so only the user currently being emitted is held
+    in memory. The first line carries the eventTypeLabels.
+    """
+    yield _EVENT_TYPE_LABELS_NDJSON_LINE
+    
+    current: Optional[Dict[str, Any]] = None
+    try:
+        # (userId desc, timestamp asc) is served by the (assessmentId, userId, timestamp desc) index
+        cursor = db.proctor_events.find(query).sort([("userId", -1), ("timestamp", 1)])
+        async for doc in cursor:
+            user_id = doc.get("userId", "unknown")
+            if current is None or current["userId"] != user_id:
+                if current is not None:
+                    yield orjson.dumps(current, default=str) + b"\n"
+                current = {"userId": user_id, "violations": [], "summary": {}, "totalViolations": 0}
+            
+            current["violations"].append(doc)
+            event_type = doc.get("eventType", "UNKNOWN")
+            current["summary"][event_type] = current["summary"].get(event_type, 0) + 1
+            current["totalViolations"] += 1
+        
+        if current is not None:
+            yield orjson.dumps(current, default=str) + b"\n"
+    except Exception as exc:
+        # Headers are already sent, so report the failure in-band
+        logger.exception(f"[Proctor API] Error streaming events: {exc}")
+        yield orjson.dumps({"error": f"Failed to fetch proctoring events: {str(exc)}"}) + b"\n"
+
+
 @router.get("/assessment/{assessmentId}/all")
 async def get_all_proctor_events_for_assessment(
     assessmentId: str,
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    format: str = Query(
+        default="json",
+        pattern="^(json|ndjson)$",
+        description="'ndjson' streams one line per user instead of building a single JSON document",
+    ),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """
     Get all proctoring events for an assessment, grouped by user.
     
     Returns a dictionary where keys are userIds and values contain
-    their violation summary and details.
+    their violation summary and details. With format=ndjson the same per-user
+    records are streamed as application/x-ndjson, one user per line.
     """
     try:
         # Query all events for this assessment
         query = {"assessmentId": assessmentId.strip()}
         
+        if format == "ndjson":
+            return StreamingResponse(_stream_user_events_ndjson(db, query), media_type="application/x-ndjson")
+        
         cursor = db.proctor_events.find(query).sort("timestamp", 1)
         
         # Group by user
@@ -688,7 +1028,6 @@ async def get_all_proctor_events_for_assessment(
         
         async for doc in cursor:
             user_id = doc.get("userId", "unknown")
-            doc["_id"] = str(doc["_id"])
             
             if user_id not in users_data:
                 users_data[user_id] = {
@@ -711,7 +1050,7 @@ async def get_all_proctor_events_for_assessment(
             "All proctoring events fetched successfully",
             {
                 "users": users_data,
-                "eventTypeLabels": EVENT_TYPE_LABELS,
+                "eventTypeLabels": _EVENT_TYPE_LABELS_JSON,
             }
         )
     
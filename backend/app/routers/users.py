@@ -6,15 +6,21 @@ from typing import Any, Dict
 
 from bson import ObjectId
 from fastapi import APIRouter, Depends, HTTPException, status
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo import ReturnDocument
 
-from ..core.dependencies import get_current_user, require_editor, require_org_admin, require_super_admin
+from ..core.dependencies import (
+    get_current_user,
+    invalidate_cached_user,
+    require_editor,
+    require_org_admin,
+    require_super_admin,
+)
 from ..core.security import get_password_hash, sanitize_text_field
 from ..db.mongo import get_db
 from ..models.constants import USER_ROLES
 from ..schemas.user import UserProfileUpdateRequest, UserRegisterRequest, UserStatusUpdateRequest
-from ..utils.mongo import serialize_document, to_object_id
+from ..utils.mongo import serialize_document, serialized_id_stages, to_object_id
 from ..utils.responses import success_response
 
 logger = logging.getLogger(__name__)
@@ -35,7 +41,7 @@ async def get_me(current_user: Dict[str, Any] = Depends(get_current_user)):
 async def register_user(
     payload: UserRegisterRequest,
     current_user: Dict[str, Any] = Depends(require_org_admin),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     if payload.role not in {"org_admin", "editor", "viewer"}:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid role")
@@ -82,57 +88,79 @@ async def register_user(
 @router.get("/all")
 async def get_all_users(
     current_user: Dict[str, Any] = Depends(require_super_admin),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
-    cursor = db.users.find({}, {"password": 0}).sort("createdAt", -1)
-    users = [serialize_document(doc) async for doc in cursor]
+    cursor = await db.users.aggregate([{"$sort": {"createdAt": -1}}, *serialized_id_stages("password")])
+    users = await cursor.to_list(length=None)
     return success_response("Users fetched successfully", users)
 
 
 @router.get("/org-admins")
 async def get_org_admins(
     current_user: Dict[str, Any] = Depends(require_super_admin),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     """Get all organization admins with their assessment counts and details."""
-    # Get all org_admin users
-    cursor = db.users.find({"role": "org_admin"}, {"password": 0}).sort("createdAt", -1)
-    org_admins = []
+    # Get all org_admin users with their assessments (created by them or belonging to
+    # their organization) joined server-side in a single round-trip. Each join is a
+    # plain equality on an indexed field, so it is answered from the
+    # (createdBy|organization, createdAt, title, status, updatedAt, _id) indexes alone.
+    assessment_list_pipeline = [
+        {"$sort": {"createdAt": -1}},
+        {
+            "$project": {
+                "_id": 0,
+                "id": {"$toString": "$_id"},
+                "title": 1,
+                "status": 1,
+                "createdAt": 1,
+                "updatedAt": 1,
+            }
+        },
+    ]
+    pipeline = [
+        {"$match": {"role": "org_admin"}},
+        {"$sort": {"createdAt": -1}},
+        # organization may be stored as an ObjectId or its string form
+        {
+            "$addFields": {
+                "_orgId": {
+                    "$convert": {"input": "$organization", "to": "objectId", "onError": None, "onNull": None}
+                }
+            }
+        },
+        {
+            "$lookup": {
+                "from": "assessments",
+                "localField": "_id",
+                "foreignField": "createdBy",
+                "pipeline": assessment_list_pipeline,
+                "as": "_createdAssessments",
+            }
+        },
+        {
+            "$lookup": {
+                "from": "assessments",
+                "localField": "_orgId",
+                "foreignField": "organization",
+                # A missing _orgId joins as null; never match organization-less assessments
+                "pipeline": [{"$match": {"organization": {"$ne": None}}}, *assessment_list_pipeline],
+                "as": "_orgAssessments",
+            }
+        },
+        {"$addFields": {"assessments": {"$setUnion": ["$_createdAssessments", "$_orgAssessments"]}}},
+        {"$addFields": {"assessmentCount": {"$size": "$assessments"}}},
+        *serialized_id_stages("password", "_orgId", "_createdAssessments", "_orgAssessments"),
+    ]
     
-    async for doc in cursor:
-        admin_data = serialize_document(doc)
-        admin_id = admin_data.get("id")
-        
-        # Build query for assessments - check both createdBy and organization
-        query_conditions = [{"createdBy": to_object_id(admin_id)}]
-        
-        # If admin has an organization, also search by organization
-        admin_org = admin_data.get("organization")
-        if admin_org:
-            try:
-                # Try to convert to ObjectId if it's a string
-                org_id = to_object_id(admin_org) if isinstance(admin_org, str) else admin_org
-                query_conditions.append({"organization": org_id})
-            except (ValueError, TypeError):
-                # If conversion fails, just use createdBy
-                pass
-        
-        query = {"$or": query_conditions} if len(query_conditions) > 1 else query_conditions[0]
-        
-        # Count assessments
-        assessment_count = await db.assessments.count_documents(query)
-        
-        # Get assessment details
-        assessment_cursor = db.assessments.find(
-            query,
-            {"title": 1, "status": 1, "createdAt": 1, "updatedAt": 1}
-        ).sort("createdAt", -1)
-        
-        assessments = [serialize_document(assess_doc) async for assess_doc in assessment_cursor]
-        
-        admin_data["assessmentCount"] = assessment_count
-        admin_data["assessments"] = assessments
-        org_admins.append(admin_data)
+    org_admins = await (await db.users.aggregate(pipeline)).to_list(length=None)
+    # $setUnion does not keep order; sorting here rather than with $sortArray keeps
+    # this endpoint within the MongoDB 5.0 minimum
+    for admin in org_admins:
+        admin["assessments"].sort(
+            key=lambda assessment: (assessment.get("createdAt") is not None, assessment.get("createdAt")),
+            reverse=True,
+        )
     
     return success_response(
         f"Found {len(org_admins)} organization admin(s)",
@@ -147,13 +175,15 @@ async def get_org_admins(
 async def get_users_by_role(
     role: str,
     current_user: Dict[str, Any] = Depends(require_editor),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     if role not in USER_ROLES:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid role")
 
-    cursor = db.users.find({"role": role}, {"password": 0}).sort("createdAt", -1)
-    users = [serialize_document(doc) async for doc in cursor]
+    cursor = await db.users.aggregate(
+        [{"$match": {"role": role}}, {"$sort": {"createdAt": -1}}, *serialized_id_stages("password")]
+    )
+    users = await cursor.to_list(length=None)
     return success_response(f"Users with role {role} fetched successfully", users)
 
 
@@ -162,7 +192,7 @@ async def update_user_status(
     user_id: str,
     payload: UserStatusUpdateRequest,
     current_user: Dict[str, Any] = Depends(require_super_admin),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     try:
         oid = to_object_id(user_id)
@@ -185,6 +215,7 @@ async def update_user_status(
     )
     if not result:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    invalidate_cached_user(user_id)
 
     return success_response("User status updated successfully", serialize_document(result))
 
@@ -194,7 +225,7 @@ async def update_user_profile(
     user_id: str,
     payload: UserProfileUpdateRequest,
     current_user: Dict[str, Any] = Depends(get_current_user),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     try:
         oid = to_object_id(user_id)
@@ -218,6 +249,7 @@ async def update_user_profile(
     )
     if not result:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    invalidate_cached_user(user_id)
 
     return success_response("Profile updated successfully", serialize_document(result))
 
@@ -226,7 +258,7 @@ async def update_user_profile(
 async def delete_user(
     user_id: str,
     current_user: Dict[str, Any] = Depends(get_current_user),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: AsyncDatabase = Depends(get_db),
 ):
     try:
         oid = to_object_id(user_id)
@@ -239,5 +271,6 @@ async def delete_user(
     result = await db.users.find_one_and_delete({"_id": oid})
     if not result:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    invalidate_cached_user(user_id)
 
     return success_response("User deleted successfully")
@@ -1,29 +1,35 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Annotated, Dict, List, Literal, Optional, Union, get_args
 
-from pydantic import BaseModel, Field
+from pydantic import Field, StringConstraints, TypeAdapter
 
+from .base import RequestModel
 
-QUESTION_TYPES = {"MCQ", "Subjective", "Pseudo Code", "Descriptive", "Aptitude", "Reasoning", "coding"}
-DIFFICULTY_LEVELS = {"Easy", "Medium", "Hard"}
-STATUS_VALUES = {"draft", "ready", "scheduled", "active", "completed"}
 
+QuestionType = Literal["MCQ", "Subjective", "Pseudo Code", "Descriptive", "Aptitude", "Reasoning", "coding"]
+DifficultyLevel = Literal["Easy", "Medium", "Hard"]
+
+QUESTION_TYPES: frozenset[str] = frozenset(get_args(QuestionType))
+DIFFICULTY_LEVELS: frozenset[str] = frozenset(get_args(DifficultyLevel))
+STATUS_VALUES: frozenset[str] = frozenset({"draft", "ready", "scheduled", "active", "completed"})
+
+# Shape-only email check for high-volume candidate endpoints; the pattern is compiled into
+# pydantic-core once, unlike EmailStr which runs email-validator in Python on every request
+FastEmail = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, min_length=3, max_length=255, pattern=r"^[^@\s]+@[^@\s]+$"),
+]
 
-class QuestionConfig(BaseModel):
-    questionNumber: int = Field(..., ge=1)
-    type: str = Field(...)
-    difficulty: str = Field(default="Medium")
 
-    def model_post_init(self, __context: dict[str, object]) -> None:
-        if self.type not in QUESTION_TYPES:
-            raise ValueError("Invalid question type")
-        if self.difficulty not in DIFFICULTY_LEVELS:
-            raise ValueError("Invalid difficulty level")
+class QuestionConfig(RequestModel):
+    questionNumber: int = Field(..., ge=1)
+    type: QuestionType = Field(...)
+    difficulty: DifficultyLevel = Field(default="Medium")
 
 
-class Question(BaseModel):
+class Question(RequestModel):
     questionText: str
     type: str
     difficulty: str
@@ -39,7 +45,11 @@ class Question(BaseModel):
     updatedAt: Optional[datetime] = None
 
 
-class TopicUpdate(BaseModel):
+# Dumps a whole question list in one pydantic-core call instead of one model_dump per item
+QUESTION_LIST_ADAPTER: TypeAdapter[List[Question]] = TypeAdapter(List[Question])
+
+
+class TopicUpdate(RequestModel):
     topic: str
     numQuestions: Optional[int] = None
     questionTypes: Optional[List[str]] = None
@@ -48,24 +58,20 @@ class TopicUpdate(BaseModel):
     questionConfigs: Optional[List[QuestionConfig]] = None
 
 
-class AptitudeCategoryConfig(BaseModel):
+class AptitudeCategoryConfig(RequestModel):
     enabled: bool = False
-    difficulty: str = Field(default="Medium")
+    difficulty: DifficultyLevel = Field(default="Medium")
     numQuestions: int = Field(default=0, ge=0)
 
-    def model_post_init(self, __context: dict[str, object]) -> None:
-        if self.difficulty not in DIFFICULTY_LEVELS:
-            raise ValueError("Invalid difficulty level")
 
+AptitudeCategory = Literal["quantitative", "logicalReasoning", "verbalAbility", "numericalReasoning"]
 
-class AptitudeConfig(BaseModel):
-    quantitative: Optional[AptitudeCategoryConfig] = None
-    logicalReasoning: Optional[AptitudeCategoryConfig] = None
-    verbalAbility: Optional[AptitudeCategoryConfig] = None
-    numericalReasoning: Optional[AptitudeCategoryConfig] = None
+# Same wire shape as the old four-field model ({"quantitative": {...}, ...}), validated
+# as a single dict instead of four nullable sub-model fields
+AptitudeConfig = Dict[AptitudeCategory, Optional[AptitudeCategoryConfig]]
 
 
-class GenerateTopicsRequest(BaseModel):
+class GenerateTopicsRequest(RequestModel):
     assessmentType: List[str] = Field(..., min_length=1)  # ["aptitude"], ["technical"], or ["aptitude", "technical"]
     # Technical fields (required only if "technical" is in assessmentType)
     jobRole: Optional[str] = None
@@ -76,62 +82,64 @@ class GenerateTopicsRequest(BaseModel):
     aptitudeConfig: Optional[AptitudeConfig] = None
 
 
-class UpdateTopicSettingsRequest(BaseModel):
+class UpdateTopicSettingsRequest(RequestModel):
     assessmentId: str
     updatedTopics: List[TopicUpdate]
 
 
-class AddCustomTopicsRequest(BaseModel):
+class AddCustomTopicsRequest(RequestModel):
     assessmentId: str
-    newTopics: List[TopicUpdate | str]
+    # Plain names are checked first: a str never coerces to TopicUpdate (or vice versa), so
+    # left-to-right avoids smart mode's strict-then-lax double validation of each topic
+    newTopics: List[Annotated[Union[str, TopicUpdate], Field(union_mode="left_to_right")]]
 
 
-class RemoveCustomTopicsRequest(BaseModel):
+class RemoveCustomTopicsRequest(RequestModel):
     assessmentId: str
     topicsToRemove: List[str]
 
 
-class GenerateQuestionsRequest(BaseModel):
+class GenerateQuestionsRequest(RequestModel):
     assessmentId: str
 
 
-class UpdateQuestionsRequest(BaseModel):
+class UpdateQuestionsRequest(RequestModel):
     assessmentId: str
     topic: str
     updatedQuestions: List[Question]
 
 
-class UpdateSingleQuestionRequest(BaseModel):
+class UpdateSingleQuestionRequest(RequestModel):
     assessmentId: str
     topic: str
     questionIndex: int = Field(..., ge=0)
     updatedQuestion: Question
 
 
-class AddNewQuestionRequest(BaseModel):
+class AddNewQuestionRequest(RequestModel):
     assessmentId: str
     topic: str
     newQuestion: Question
 
 
-class DeleteQuestionRequest(BaseModel):
+class DeleteQuestionRequest(RequestModel):
     assessmentId: str
     topic: str
     questionIndex: int = Field(..., ge=0)
 
 
-class DeleteTopicQuestionsRequest(BaseModel):
+class DeleteTopicQuestionsRequest(RequestModel):
     assessmentId: str
     topic: Optional[str] = None  # If None, deletes questions for all topics
 
 
-class UpdateAssessmentDraftRequest(BaseModel):
+class UpdateAssessmentDraftRequest(RequestModel):
     assessmentId: str
     title: Optional[str] = None
     description: Optional[str] = None
 
 
-class FinalizeAssessmentRequest(BaseModel):
+class FinalizeAssessmentRequest(RequestModel):
     assessmentId: str
     title: Optional[str] = None
     description: Optional[str] = None
@@ -140,10 +148,10 @@ class FinalizeAssessmentRequest(BaseModel):
     passPercentage: Optional[float] = Field(default=None, ge=0, le=100)  # Pass percentage (0-100)
 
 
-class LogAnswerRequest(BaseModel):
+class LogAnswerRequest(RequestModel):
     assessmentId: str = Field(..., min_length=1, max_length=100)
     token: str = Field(..., min_length=1, max_length=200)
-    email: str = Field(..., min_length=1, max_length=255)
+    email: FastEmail
     name: str = Field(..., min_length=1, max_length=200)
     questionIndex: int = Field(..., ge=0)
     answer: str = Field(..., max_length=50000)  # Max 50KB answer text
@@ -151,24 +159,24 @@ class LogAnswerRequest(BaseModel):
 
 
 # New flow schemas
-class GenerateTopicsFromSkillRequest(BaseModel):
+class GenerateTopicsFromSkillRequest(RequestModel):
     skill: str = Field(..., min_length=1)
     experienceMin: str = Field(default="0")
     experienceMax: str = Field(default="10")
 
 
-class RegenerateSingleTopicRequest(BaseModel):
+class RegenerateSingleTopicRequest(RequestModel):
     topic: str = Field(..., min_length=1)
     assessmentId: Optional[str] = None  # If provided, regenerates topic based on assessment skills
 
 
-class GenerateTopicCardsRequest(BaseModel):
+class GenerateTopicCardsRequest(RequestModel):
     jobDesignation: str = Field(..., min_length=1)
     experienceMin: Optional[int] = Field(default=0, ge=0, le=20)
     experienceMax: Optional[int] = Field(default=10, ge=0, le=20)
 
 
-class CreateAssessmentFromJobDesignationRequest(BaseModel):
+class CreateAssessmentFromJobDesignationRequest(RequestModel):
     assessmentId: Optional[str] = Field(default=None, description="Optional: If provided, updates existing assessment instead of creating new one")
     jobDesignation: str = Field(..., min_length=1)
     selectedSkills: List[str] = Field(..., min_length=1)
@@ -176,7 +184,7 @@ class CreateAssessmentFromJobDesignationRequest(BaseModel):
     experienceMax: str = Field(default="10")
 
 
-class TopicConfigRow(BaseModel):
+class TopicConfigRow(RequestModel):
     topic: str
     questionType: str
     difficulty: str = Field(default="Medium")
@@ -189,20 +197,20 @@ class TopicConfigRow(BaseModel):
     language: Optional[str] = None  # For coding questions: selected language ID
 
 
-class GenerateQuestionsFromConfigRequest(BaseModel):
+class GenerateQuestionsFromConfigRequest(RequestModel):
     assessmentId: str
     skill: str
     topics: List[TopicConfigRow]
 
 
-class ScheduleCandidateQuestions(BaseModel):
+class ScheduleCandidateQuestions(RequestModel):
     allowed: bool = True
     maxQuestions: int = 3
     timeLimit: int = 5
     questions: List[dict] = Field(default_factory=list)
 
 
-class ProctoringOptions(BaseModel):
+class ProctoringOptions(RequestModel):
     enabled: bool = False
     webcamRequired: bool = False
     screenRecording: bool = False
@@ -210,7 +218,7 @@ class ProctoringOptions(BaseModel):
     fullScreenMode: bool = False
 
 
-class ScheduleUpdateRequest(BaseModel):
+class ScheduleUpdateRequest(RequestModel):
     startTime: datetime
     endTime: datetime
     duration: int = Field(..., gt=0)
@@ -226,11 +234,11 @@ class ScheduleUpdateRequest(BaseModel):
     isActive: Optional[bool] = False
 
 
-class AssessmentScheduleUpdateRequest(BaseModel):
+class AssessmentScheduleUpdateRequest(RequestModel):
     assessmentId: str
     schedule: ScheduleUpdateRequest
 
 
-class ValidateQuestionTypeRequest(BaseModel):
+class ValidateQuestionTypeRequest(RequestModel):
     topic: str = Field(..., min_length=1)
     questionType: str = Field(..., min_length=1)
@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RequestModel(BaseModel):
+    """Base for inbound request bodies: validated once on the way in, then read-only."""
+
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
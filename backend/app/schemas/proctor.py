@@ -1,37 +1,12 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Annotated, Dict, List, Optional, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, StringConstraints
 
+from .base import RequestModel
 
-# Supported proctoring event types
-PROCTOR_EVENT_TYPES = {
-    "TAB_SWITCH",
-    "FULLSCREEN_EXIT",
-    "FULLSCREEN_ENABLED",
-    "FULLSCREEN_REFUSED",
-    "COPY_RESTRICT",
-    "FOCUS_LOST",
-    "DEVTOOLS_OPEN",
-    "SCREENSHOT_ATTEMPT",
-    "PASTE_ATTEMPT",
-    "RIGHT_CLICK",
-    "IDLE",
-    "GAZE_AWAY",
-    "MULTI_FACE",
-    "SPOOF_DETECTED",
-    "FACE_MISMATCH",
-    "CAMERA_DENIED",
-    "CAMERA_ERROR",
-    "PRECHECK_WARNING",
-    "REFERENCE_PHOTO_CAPTURED",
-    # Live human proctoring events
-    "PROCTOR_SESSION_STARTED",
-    "PROCTOR_SESSION_VIEWING",
-    "PROCTOR_SESSION_ENDED",
-}
 
 # Human-readable labels for event types
 EVENT_TYPE_LABELS: Dict[str, str] = {
@@ -60,13 +35,28 @@ EVENT_TYPE_LABELS: Dict[str, str] = {
     "PROCTOR_SESSION_ENDED": "Human proctor session ended",
 }
 
+# Supported proctoring event types; every supported type has a label, so the labels are the
+# single source of truth. eventType itself stays a free string: unknown types are still
+# recorded (the frontend proxy only warns) so newer clients never lose events.
+PROCTOR_EVENT_TYPES: frozenset[str] = frozenset(EVENT_TYPE_LABELS)
+
+# Browser-side ISO8601 (e.g. Date.toISOString()); checked by pydantic-core's compiled regex.
+# Kept as a string because events are stored and sorted by the original timestamp text.
+IsoTimestamp = Annotated[
+    str,
+    StringConstraints(
+        max_length=40,
+        pattern=r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})?$",
+    ),
+]
 
-class ProctorEventIn(BaseModel):
+
+class ProctorEventIn(RequestModel):
     """Input model for recording a proctoring event."""
     userId: str = Field(..., min_length=1, max_length=255, description="Candidate user ID (email)")
     assessmentId: str = Field(..., min_length=1, max_length=100, description="Assessment ID")
     eventType: str = Field(..., min_length=1, max_length=50, description="Type of proctoring event")
-    timestamp: str = Field(..., description="ISO8601 timestamp when event occurred")
+    timestamp: IsoTimestamp = Field(..., description="ISO8601 timestamp when event occurred")
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional event metadata")
     snapshotBase64: Optional[str] = Field(default=None, description="Base64 encoded screenshot/snapshot")
 
@@ -80,6 +70,7 @@ class ProctorEventOut(BaseModel):
     timestamp: str
     metadata: Optional[Dict[str, Any]] = None
     snapshotBase64: Optional[str] = None
+    snapshotId: Optional[str] = Field(default=None, description="Id of the snapshot image in proctor_snapshots")
     receivedAt: str = Field(..., description="ISO8601 timestamp when event was received by server")
 
     class Config:
@@ -90,7 +81,10 @@ class ProctorSummaryOut(BaseModel):
     """Output model for proctoring summary."""
     summary: Dict[str, int] = Field(..., description="Count of each event type")
     totalViolations: int = Field(..., description="Total number of violations")
-    violations: List[Dict[str, Any]] = Field(..., description="List of all violation documents")
+    violations: Optional[List[Dict[str, Any]]] = Field(
+        default=None,
+        description="Violation documents without snapshots (only when requested with include=violations)"
+    )
     eventTypeLabels: Dict[str, str] = Field(
         default_factory=lambda: EVENT_TYPE_LABELS,
         description="Human-readable labels for event types"
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import EmailStr, Field
 
+from .base import RequestModel
 
-class UserRegisterRequest(BaseModel):
+
+class UserRegisterRequest(RequestModel):
     name: str = Field(..., min_length=1, max_length=255)
     email: EmailStr
     password: str = Field(..., min_length=6, max_length=255)
@@ -13,11 +15,11 @@ class UserRegisterRequest(BaseModel):
     organizationId: Optional[str] = Field(default=None)
 
 
-class UserStatusUpdateRequest(BaseModel):
+class UserStatusUpdateRequest(RequestModel):
     role: Optional[str] = Field(default=None)
 
 
-class UserProfileUpdateRequest(BaseModel):
+class UserProfileUpdateRequest(RequestModel):
     name: Optional[str] = Field(default=None, min_length=1, max_length=255)
     email: Optional[EmailStr] = None
     phone: Optional[str] = Field(default=None, max_length=30)
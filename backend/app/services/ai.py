@@ -3,11 +3,14 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import random
 import re
 from difflib import SequenceMatcher
-from functools import lru_cache
-from typing import Any, Dict, List
+from functools import lru_cache, partial, wraps
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 
+import httpx
+import orjson
 from fastapi import HTTPException
 
 try:
@@ -26,10 +29,21 @@ except ImportError as exc:  # pragma: no cover - optional dependency guard
     raise RuntimeError("The openai package is required. Ensure it is installed.") from exc
 
 from ..core.config import get_settings
+from ..models.role_skills import ROLE_ALIASES, ROLE_SKILLS
 
 logger = logging.getLogger(__name__)
 
-_enrichment_cache: Dict[str, str] = {}
+# Normalized topic -> AI coding-support verdict. Topics recur across assessments, so repeat
+# lookups skip the OpenAI round trip; _single_flight lets concurrent callers share one call.
+_coding_support_cache: Dict[str, bool] = {}
+_CODING_SUPPORT_CACHE_MAX_ENTRIES = 10000
+
+# (function name, arguments) -> running AI call shared by concurrent identical requests
+_calls_in_flight: Dict[Tuple[Any, ...], "asyncio.Task[Any]"] = {}
+
+# Normalized topic -> question type the AI picked for a topic no keyword rule matched
+_question_type_cache: Dict[str, str] = {}
+_QUESTION_TYPE_CACHE_MAX_ENTRIES = 10000
 
 
 @lru_cache(maxsize=1)
@@ -37,50 +51,145 @@ def _get_client() -> AsyncOpenAI:
     settings = get_settings()
     if not settings.openai_api_key:
         raise ValueError("OpenAI API key not configured. Please set OPENAI_API_KEY in your environment variables.")
-    return AsyncOpenAI(api_key=settings.openai_api_key)
+    # One process-wide connection pool; request timeouts stay with the OpenAI client defaults
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.openai_max_connections,
+            max_keepalive_connections=settings.openai_max_keepalive_connections,
+        ),
+        http2=settings.openai_http2,
+    )
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        http_client=http_client,
+        max_retries=settings.openai_max_retries,
+    )
+
+
+# Caps concurrent chat completions so fan-out paths (batched topics, per-question time/score)
+# queue locally instead of bursting past the account's rate limit into 429 retries
+_chat_semaphore = asyncio.Semaphore(get_settings().openai_max_concurrency)
+
+
+# Model for the topic and classification helpers, and for Easy-only question batches
+_DEFAULT_MODEL = get_settings().openai_model
+# Model for question batches with any Medium/Hard question
+_QUESTION_MODEL = get_settings().openai_question_model
+# Model for answer grading and time/score suggestions, kept apart so scores stay comparable
+_GRADING_MODEL = get_settings().openai_grading_model
+
+
+async def _chat_completion(client: AsyncOpenAI, **kwargs: Any) -> Any:
+    async with _chat_semaphore:
+        return await client.chat.completions.create(**kwargs)
+
+
+async def warm_ai_client() -> None:
+    """Open the shared OpenAI connection at startup so the first request skips DNS/TLS setup."""
+    if not get_settings().openai_api_key:
+        return
+    try:
+        # Model lookup is free (no tokens) and goes through the same keep-alive pool
+        await _get_client().with_options(max_retries=0, timeout=5.0).models.retrieve(_DEFAULT_MODEL)
+    except Exception as exc:
+        logger.warning(f"OpenAI connection warm-up failed: {exc}")
+
+
+async def close_ai_client() -> None:
+    """Close the shared OpenAI client's connection pool, if it was ever created."""
+    if _get_client.cache_info().currsize:
+        await _get_client().close()
+        _get_client.cache_clear()
+
+
+_T = TypeVar("_T")
+
+
+def _single_flight(func: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+    """Let concurrent calls with identical arguments share one OpenAI round trip."""
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> _T:
+        key = (
+            func.__name__,
+            *(tuple(arg) if isinstance(arg, list) else arg for arg in args),
+            *sorted((name, tuple(value) if isinstance(value, list) else value) for name, value in kwargs.items()),
+        )
+        task = _calls_in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(func(*args, **kwargs))
+            _calls_in_flight[key] = task
+            task.add_done_callback(partial(_drop_call, key))
+        # shield: a cancelled caller must not cancel the call other callers are waiting on;
+        # each caller gets its own copy of a shared list result
+        result = await asyncio.shield(task)
+        return list(result) if isinstance(result, list) else result
+
+    return wrapper
+
+
+def _drop_call(key: Tuple[Any, ...], task: "asyncio.Task[Any]") -> None:
+    _calls_in_flight.pop(key, None)
+    if not task.cancelled():
+        task.exception()  # Mark retrieved when every waiter was cancelled
+
+
+def _substring_pattern(keywords: tuple[str, ...], flags: int = 0) -> re.Pattern[str]:
+    """Match if any keyword occurs anywhere in the text (same as any(kw in text))."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords), flags)
+
+
+# Paragraph requirements by difficulty level; shared read-only by every prompt that uses them
+_PARAGRAPH_REQUIREMENTS: Dict[str, Dict[str, str]] = {
+    "Easy": {
+        "min_paragraphs": "1",
+        "max_paragraphs": "1",
+        "description": "within 1 paragraph (short and easy)",
+        "length_note": "Keep it concise - exactly 1 paragraph, short and straightforward."
+    },
+    "Medium": {
+        "min_paragraphs": "2",
+        "max_paragraphs": "2",
+        "description": "above 1 paragraph and within 2 paragraphs",
+        "length_note": "Should be more than 1 paragraph but exactly 2 paragraphs total - provide moderate detail."
+    },
+    "Hard": {
+        "min_paragraphs": "3",
+        "max_paragraphs": "3",
+        "description": "above 2 paragraphs and within 3 paragraphs",
+        "length_note": "Should be more than 2 paragraphs but exactly 3 paragraphs total - provide comprehensive detail and complexity."
+    }
+}
 
 
 def _get_paragraph_requirements(difficulty: str) -> Dict[str, str]:
     """Get paragraph requirements based on difficulty level."""
-    requirements = {
-        "Easy": {
-            "min_paragraphs": "1",
-            "max_paragraphs": "1",
-            "description": "within 1 paragraph (short and easy)",
-            "length_note": "Keep it concise - exactly 1 paragraph, short and straightforward."
-        },
-        "Medium": {
-            "min_paragraphs": "2",
-            "max_paragraphs": "2",
-            "description": "above 1 paragraph and within 2 paragraphs",
-            "length_note": "Should be more than 1 paragraph but exactly 2 paragraphs total - provide moderate detail."
-        },
-        "Hard": {
-            "min_paragraphs": "3",
-            "max_paragraphs": "3",
-            "description": "above 2 paragraphs and within 3 paragraphs",
-            "length_note": "Should be more than 2 paragraphs but exactly 3 paragraphs total - provide comprehensive detail and complexity."
-        }
-    }
-    return requirements.get(difficulty, requirements["Medium"])
+    return _PARAGRAPH_REQUIREMENTS.get(difficulty, _PARAGRAPH_REQUIREMENTS["Medium"])
 
 
-async def generate_topics_from_input(job_role: str, experience: str, skills: List[str], num_topics: int) -> List[str]:
-    prompt = f"""
+_TOPICS_FROM_INPUT_PROMPT = """
 You are an AI assistant that generates technical assessment topics.
 Based on:
 - Job Role: {job_role}
 - Experience Range: {experience}
-- Key Skills: {', '.join(skills)}
+- Key Skills: {skills}
 
 Generate exactly {num_topics} concise, relevant technical topics.
 Output only a simple list (no explanation).
 """
 
+
+@_single_flight
+async def generate_topics_from_input(job_role: str, experience: str, skills: List[str], num_topics: int) -> List[str]:
+    prompt = _TOPICS_FROM_INPUT_PROMPT.format(
+        job_role=job_role, experience=experience, skills=", ".join(skills), num_topics=num_topics
+    )
+
     client = _get_client()
     try:
-        response = await client.chat.completions.create(
-            model="gpt-3.5-turbo",
+        response = await _chat_completion(
+            client,
+            model=_DEFAULT_MODEL,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.7,
         )
@@ -93,6 +202,112 @@ Output only a simple list (no explanation).
     return topics[:num_topics]
 
 
+# Fixed system message for topic-card generation; identical on every call so it forms a
+# stable prompt prefix (eligible for OpenAI's automatic prompt caching on models that support it)
+_TOPIC_CARDS_SYSTEM_PROMPT = """You are an expert technical recruiter who understands job roles, required technologies, and how experience levels affect technology choices.
+CRITICAL RULES:
+1. Generate ONLY technologies that are DIRECTLY relevant to the specific job designation
+2. DO NOT include unrelated technologies (e.g., don't include Python/HTML/CSS for a Java Developer role)
+3. Focus on role-specific technologies, frameworks, and tools
+4. For entry-level: Include role-specific fundamentals, not general programming skills
+5. Match technologies to the exact job role, not general programming
+Respond with a JSON object containing only the technology names."""
+
+
+# Words that mark an explanation or description line rather than a technology name
+_TOPIC_CARD_SKIP_RE = _substring_pattern(
+    ("example", "include", "such as", "like", "typically", "usually", "common", "focus on", "consider"),
+    flags=re.IGNORECASE,
+)
+
+
+def _is_topic_card_name(name: str) -> bool:
+    """Filter out non-technology entries (explanations, descriptions, etc.)."""
+    if not name or len(name) >= 50:  # Technology names should be short
+        return False
+    # Skip lines that look like explanations or descriptions
+    return _TOPIC_CARD_SKIP_RE.search(name) is None
+
+
+def _parse_topic_card_lines(text: str) -> List[str]:
+    """Parse a plain-text, one-name-per-line card response - handles various list formats."""
+    cards = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        
+        # Remove common prefixes and formatting
+        line = line.strip("- •*")
+        # Remove numbering (e.g., "1. Python" -> "Python")
+        if ". " in line and (line[0].isdigit() or line.startswith("(")):
+            line = line.split(". ", 1)[-1]
+        # Remove any remaining numbering patterns
+        line = line.lstrip("0123456789. )")
+        line = line.strip()
+        
+        if _is_topic_card_name(line):
+            cards.append(line)
+    return cards
+
+
+# Checked in order: APIError is the base class of the other three
+_OPENAI_ERROR_KINDS = tuple(
+    (error_cls, kind)
+    for error_cls, kind in (
+        (RateLimitError, "rate_limit"),
+        (AuthenticationError, "auth"),
+        (APIConnectionError, "connection"),
+        (APIError, "api"),
+    )
+    if error_cls is not None
+)
+# Fallback for openai versions without typed exceptions, matched against
+# "<class name> <lower-cased message>"
+_OPENAI_ERROR_TEXT_PATTERNS = (
+    ("rate_limit", _substring_pattern(("RateLimitError", "rate limit", "429", "quota"))),
+    ("auth", _substring_pattern(("AuthenticationError", "api key", "authentication", "401"))),
+    ("connection", _substring_pattern(("APIConnectionError", "connection", "timeout"))),
+)
+
+
+def _classify_openai_error(exc: Exception) -> Optional[str]:
+    """Return "rate_limit", "auth", "connection" or "api" for OpenAI errors, else None."""
+    for error_cls, kind in _OPENAI_ERROR_KINDS:
+        if isinstance(exc, error_cls):
+            return kind
+    if _OPENAI_ERROR_KINDS:
+        return None
+    text = f"{exc.__class__.__name__} {str(exc).lower()}"
+    for kind, pattern in _OPENAI_ERROR_TEXT_PATTERNS:
+        if pattern.search(text):
+            return kind
+    return None
+
+
+# Window into a role's progression list for each experience level (7 of 12 entries)
+_ROLE_PROGRESSION_START = {
+    "entry-level/junior": 0,
+    "mid-level": 2,
+    "senior-level": 4,
+    "expert/lead-level": 5,
+}
+_ROLE_PROGRESSION_WINDOW = 7
+_ROLE_SENIORITY_PREFIX_RE = re.compile(r"^(?:(?:senior|sr\.?|junior|jr\.?|lead|principal|staff)\s+)+")
+
+
+def _static_topic_cards(job_designation: str, experience_level: str) -> Optional[List[str]]:
+    """Return bundled cards for a common designation, or None to fall back to the AI."""
+    role = _ROLE_SENIORITY_PREFIX_RE.sub("", " ".join(job_designation.lower().split()))
+    skills = ROLE_SKILLS.get(ROLE_ALIASES.get(role, role))
+    if skills is None:
+        return None
+    core, progression = skills
+    start = _ROLE_PROGRESSION_START[experience_level]
+    return [*core, *progression[start:start + _ROLE_PROGRESSION_WINDOW]]
+
+
+@_single_flight
 async def generate_topic_cards_from_job_designation(
     job_designation: str, 
     experience_min: int = 0, 
@@ -109,6 +324,11 @@ async def generate_topic_cards_from_job_designation(
     else:
         experience_level = "expert/lead-level"
     
+    # Common designations are answered from the bundled table without an AI call
+    static_cards = _static_topic_cards(job_designation, experience_level)
+    if static_cards is not None:
+        return static_cards
+    
     # Determine specific experience-based guidance
     experience_guidance = ""
     if experience_level == "entry-level/junior":
@@ -150,7 +370,7 @@ OUTPUT FORMAT:
 - Generate exactly 8-12 technology names
 - Each technology should be a single word or short phrase (max 2-3 words)
 - Use standard, widely-recognized technology names
-- Output ONLY the technology names, one per line
+- Respond with ONLY a JSON object of the form {{"technologies": ["Name 1", "Name 2", ...]}}
 - No explanations, numbering, or descriptions
 - No duplicates
 - ALL technologies must be directly relevant to "{job_designation}"
@@ -165,121 +385,51 @@ Generate technologies now:"""
         raise HTTPException(status_code=500, detail="OpenAI API key not configured. Please contact the administrator.") from exc
     
     try:
-        response = await client.chat.completions.create(
-            model="gpt-3.5-turbo",
+        response = await _chat_completion(
+            client,
+            model=_DEFAULT_MODEL,
             messages=[
-                {
-                    "role": "system",
-                    "content": """You are an expert technical recruiter who understands job roles, required technologies, and how experience levels affect technology choices. 
-                    CRITICAL RULES:
-                    1. Generate ONLY technologies that are DIRECTLY relevant to the specific job designation
-                    2. DO NOT include unrelated technologies (e.g., don't include Python/HTML/CSS for a Java Developer role)
-                    3. Focus on role-specific technologies, frameworks, and tools
-                    4. For entry-level: Include role-specific fundamentals, not general programming skills
-                    5. Match technologies to the exact job role, not general programming
-                    Generate only technology names, one per line."""
-                },
+                {"role": "system", "content": _TOPIC_CARDS_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.5,  # Lower temperature for more consistent, focused results
+            max_tokens=400,  # 8-12 short names in a JSON object
+            response_format={"type": "json_object"},
         )
     except Exception as exc:
-        # Check if this is a RateLimitError (quota/rate limit)
-        is_rate_limit = False
-        if RateLimitError is not None:
-            is_rate_limit = isinstance(exc, RateLimitError)
-        else:
-            # Fallback: check error message or class name
-            error_class_name = exc.__class__.__name__
-            error_msg = str(exc)
-            is_rate_limit = (
-                'RateLimitError' in error_class_name or
-                'rate limit' in error_msg.lower() or
-                '429' in error_msg or
-                'quota' in error_msg.lower()
-            )
+        error_kind = _classify_openai_error(exc)
+        error_msg = str(exc)
         
-        if is_rate_limit:
+        if error_kind == "rate_limit":
             # Handle quota/rate limit errors specifically
-            error_msg = str(exc)
-            error_type = None
-            error_code = None
-            
-            # Try to extract error details from the exception
-            try:
-                if hasattr(exc, 'response') and exc.response:
-                    error_body = exc.response.get('error', {}) if isinstance(exc.response, dict) else {}
-                    error_type = error_body.get('type', '')
-                    error_code = error_body.get('code', '')
-            except Exception:
-                pass
-            
-            # Check for quota errors in error message or error details
-            if (error_type == 'insufficient_quota' or 
-                error_code == 'insufficient_quota' or 
-                'quota' in error_msg.lower() or 
-                'insufficient_quota' in error_msg.lower()):
+            if getattr(exc, "code", None) == "insufficient_quota" or "quota" in error_msg.lower():
                 logger.error(f"OpenAI API quota exceeded: {exc}")
                 raise HTTPException(
                     status_code=503,
                     detail="OpenAI API quota exceeded. Please check your OpenAI account billing and plan. The service is temporarily unavailable."
                 ) from exc
-            else:
-                logger.error(f"OpenAI API rate limit error: {exc}")
-                raise HTTPException(
-                    status_code=503,
-                    detail="OpenAI API rate limit exceeded. Please try again in a few moments."
-                ) from exc
-        
-        # Check if this is an AuthenticationError
-        is_auth_error = False
-        if AuthenticationError is not None:
-            is_auth_error = isinstance(exc, AuthenticationError)
-        else:
-            error_msg = str(exc)
-            error_class_name = exc.__class__.__name__
-            is_auth_error = (
-                'AuthenticationError' in error_class_name or
-                'api key' in error_msg.lower() or
-                'authentication' in error_msg.lower() or
-                '401' in error_msg
-            )
+            logger.error(f"OpenAI API rate limit error: {exc}")
+            raise HTTPException(
+                status_code=503,
+                detail="OpenAI API rate limit exceeded. Please try again in a few moments."
+            ) from exc
         
-        if is_auth_error:
+        if error_kind == "auth":
             logger.error(f"OpenAI API authentication failed: {exc}")
             raise HTTPException(
                 status_code=500,
                 detail="OpenAI API authentication failed. Please check API key configuration."
             ) from exc
         
-        # Check if this is an APIConnectionError
-        is_conn_error = False
-        if APIConnectionError is not None:
-            is_conn_error = isinstance(exc, APIConnectionError)
-        else:
-            error_msg = str(exc)
-            error_class_name = exc.__class__.__name__
-            is_conn_error = (
-                'APIConnectionError' in error_class_name or
-                'connection' in error_msg.lower() or
-                'timeout' in error_msg.lower()
-            )
-        
-        if is_conn_error:
+        if error_kind == "connection":
             logger.error(f"OpenAI API connection error: {exc}")
             raise HTTPException(
                 status_code=503,
                 detail="Failed to connect to OpenAI API. Please try again later."
             ) from exc
         
-        # Check if this is a general APIError
-        is_api_error = False
-        if APIError is not None:
-            is_api_error = isinstance(exc, APIError)
-        
-        if is_api_error:
+        if error_kind == "api":
             logger.error(f"OpenAI API error: {exc}", exc_info=True)
-            error_msg = str(exc)
             raise HTTPException(
                 status_code=500,
                 detail=f"OpenAI API error: {error_msg}"
@@ -287,7 +437,6 @@ Generate technologies now:"""
         
         # If we get here, it's an unexpected error
         logger.error(f"Unexpected error calling OpenAI API: {exc}", exc_info=True)
-        error_msg = str(exc)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate topic cards: {error_msg}"
@@ -298,28 +447,15 @@ Generate technologies now:"""
         logger.warning("OpenAI API returned empty response")
         raise HTTPException(status_code=500, detail="OpenAI API returned an empty response. Please try again.")
     
-    # Parse the response - handle various formats and filter out non-technology entries
-    cards = []
-    for line in text.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        
-        # Remove common prefixes and formatting
-        line = line.strip("- •*")
-        # Remove numbering (e.g., "1. Python" -> "Python")
-        if ". " in line and (line[0].isdigit() or line.startswith("(")):
-            line = line.split(". ", 1)[-1]
-        # Remove any remaining numbering patterns
-        line = line.lstrip("0123456789. )")
-        line = line.strip()
-        
-        # Filter out non-technology entries (explanations, descriptions, etc.)
-        if line and len(line) < 50:  # Technology names should be short
-            # Skip lines that look like explanations or descriptions
-            skip_keywords = ["example", "include", "such as", "like", "typically", "usually", "common", "focus on", "consider"]
-            if not any(keyword in line.lower() for keyword in skip_keywords):
-                cards.append(line)
+    # Parse the JSON response in one pass; fall back to line parsing if the model ignored the format
+    try:
+        names = json.loads(text)["technologies"]
+        if not isinstance(names, list):
+            raise TypeError("technologies is not a list")
+        cards = [name.strip() for name in names if isinstance(name, str) and _is_topic_card_name(name.strip())]
+    except (ValueError, KeyError, TypeError):
+        logger.warning("Topic card response was not the expected JSON object, parsing it line by line")
+        cards = _parse_topic_card_lines(text)
     
     # Remove duplicates while preserving order, and filter out empty strings
     unique_cards = []
@@ -340,6 +476,98 @@ Generate technologies now:"""
     return unique_cards[:12]  # Limit to 12 cards
 
 
+# Keyword lists for determine_topic_coding_support. Each list is matched as plain substrings,
+# compiled once into a single regex alternation so a topic is scanned in one pass per list.
+
+# Judge0-supported languages (must be executable by Judge0)
+_JUDGE0_LANGUAGES = (
+    "c", "c++", "cpp", "java", "python", "javascript", "typescript", "php", "ruby",
+    "swift", "go", "kotlin", "rust", "sql", "csharp", "c#", "vb.net", "vbnet",
+    "bash", "lua", "perl", "r", "haskell", "prolog", "ocaml", "scala", "groovy",
+    "f#", "fsharp", "scheme", "assembly", "pascal", "fortran", "cobol", "erlang",
+    "elixir", "clojure", "lisp", "node.js", "nodejs"
+)
+
+# Topics that support executable coding (can be validated by Judge0)
+_EXECUTABLE_CODING_KEYWORDS = (
+    "data structures", "algorithms", "dsa", "competitive programming", "problem solving",
+    "array", "linked list", "tree", "graph", "dynamic programming", "dp", "sorting", "searching",
+    "recursion", "backtracking", "greedy", "binary search", "hash", "stack", "queue",
+    "heap", "trie", "graph algorithms", "string algorithms", "number theory",
+    "oop", "object oriented", "object-oriented", "programming", "coding", "code",
+    "sql", "queries", "database queries", "scripting", "automation",
+    "inheritance", "polymorphism", "encapsulation", "abstraction", "classes", "objects",
+    "object oriented programming", "object-oriented programming"
+)
+
+# Topics that do NOT support Judge0 execution (STRICT list)
+_NON_EXECUTABLE_KEYWORDS = (
+    # Framework/library concepts (not executable standalone)
+    "react", "angular", "vue", "django", "flask", "express", "spring", "laravel",
+    "framework", "library", "npm", "package", "dependency",
+    # UI/UX and design
+    "ui/ux", "ui ux", "user interface", "user experience", "design", "graphic design",
+    "frontend design", "web design", "responsive design", "css", "html", "styling",
+    # Theory and concepts
+    "theory", "concept", "principles", "fundamentals", "basics", "overview",
+    "architecture", "design pattern", "methodology", "best practices",
+    # Non-executable domains
+    "hr", "human resources", "soft skills", "communication", "aptitude", "reasoning",
+    "verbal", "quantitative", "logical reasoning", "numerical reasoning",
+    # GUI and application development (not executable by Judge0)
+    "swing", "gui", "graphical user interface", "application development",
+    "full application", "file io", "file i/o", "local files", "file system",
+    "operating system theory", "os theory", "dbms theory", "database theory",
+    "computer networks theory", "cn theory", "network theory",
+    # DevOps and infrastructure (not executable code)
+    "devops", "docker", "kubernetes", "ci/cd", "deployment", "infrastructure",
+    "aws", "cloud", "azure", "gcp", "terraform", "ansible",
+    # Testing frameworks (not executable standalone)
+    "jest", "mocha", "junit", "pytest", "testing framework",
+    # Version control and tools
+    "git", "github", "gitlab", "version control"
+)
+
+# Markers that make a language mention theory-only unless the topic is about writing code
+_THEORY_ONLY_MARKERS = (
+    "theory only", "theory-only", "pure theory", "concepts only",
+    "framework", "library", "ui", "ux", "design"
+)
+
+
+_JUDGE0_LANGUAGE_RE = _substring_pattern(_JUDGE0_LANGUAGES)
+_EXECUTABLE_CODING_RE = _substring_pattern(_EXECUTABLE_CODING_KEYWORDS)
+_NON_EXECUTABLE_RE = _substring_pattern(_NON_EXECUTABLE_KEYWORDS)
+_THEORY_ONLY_RE = _substring_pattern(_THEORY_ONLY_MARKERS)
+_WRITES_CODE_RE = _substring_pattern(("programming", "coding", "code"))
+_EXECUTION_CONTEXT_RE = _substring_pattern(("programming", "coding", "code", "algorithm", "dsa"))
+
+
+def _keyword_coding_support(topic_lower: str) -> Optional[bool]:
+    """Classify a normalized topic from keyword lists alone; None when it needs the AI check."""
+    mentions_language = _JUDGE0_LANGUAGE_RE.search(topic_lower) is not None
+    
+    # STRICT CHECK: If topic contains non-executable keywords, return False immediately
+    # (unless it explicitly mentions a Judge0 language for execution,
+    # e.g., "Python programming" or "Java coding" - these support execution)
+    if _NON_EXECUTABLE_RE.search(topic_lower):
+        if not (mentions_language and _EXECUTION_CONTEXT_RE.search(topic_lower)):
+            return False
+    
+    # Check for Judge0 language names with execution context
+    if mentions_language:
+        # Double-check: if it's explicitly theory-only or non-executable, only allow it
+        # when it's about programming/execution
+        if not _THEORY_ONLY_RE.search(topic_lower) or _WRITES_CODE_RE.search(topic_lower):
+            return True
+    
+    # Check for executable coding keywords (only if no non-executable keywords found)
+    if _EXECUTABLE_CODING_RE.search(topic_lower):
+        return True
+    
+    return None
+
+
 async def determine_topic_coding_support(topic: str) -> bool:
     """
     Determine if a topic supports coding based on Judge0 capabilities.
@@ -352,99 +580,47 @@ async def determine_topic_coding_support(topic: str) -> bool:
     Returns False for theory-only topics, design topics, frameworks, or topics that
     don't involve executable code that Judge0 can validate.
     """
-    # Judge0-supported languages (must be executable by Judge0)
-    judge0_languages = [
-        "c", "c++", "cpp", "java", "python", "javascript", "typescript", "php", "ruby",
-        "swift", "go", "kotlin", "rust", "sql", "csharp", "c#", "vb.net", "vbnet",
-        "bash", "lua", "perl", "r", "haskell", "prolog", "ocaml", "scala", "groovy",
-        "f#", "fsharp", "scheme", "assembly", "pascal", "fortran", "cobol", "erlang",
-        "elixir", "clojure", "lisp", "node.js", "nodejs"
-    ]
-    
-    # Topics that support executable coding (can be validated by Judge0)
-    executable_coding_keywords = [
-        "data structures", "algorithms", "dsa", "competitive programming", "problem solving",
-        "array", "linked list", "tree", "graph", "dynamic programming", "dp", "sorting", "searching",
-        "recursion", "backtracking", "greedy", "binary search", "hash", "stack", "queue",
-        "heap", "trie", "graph algorithms", "string algorithms", "number theory",
-        "oop", "object oriented", "object-oriented", "programming", "coding", "code",
-        "sql", "queries", "database queries", "scripting", "automation",
-        "inheritance", "polymorphism", "encapsulation", "abstraction", "classes", "objects",
-        "object oriented programming", "object-oriented programming"
-    ]
-    
-    # Topics that do NOT support Judge0 execution (STRICT list)
-    non_executable_keywords = [
-        # Framework/library concepts (not executable standalone)
-        "react", "angular", "vue", "django", "flask", "express", "spring", "laravel",
-        "framework", "library", "npm", "package", "dependency",
-        # UI/UX and design
-        "ui/ux", "ui ux", "user interface", "user experience", "design", "graphic design",
-        "frontend design", "web design", "responsive design", "css", "html", "styling",
-        # Theory and concepts
-        "theory", "concept", "principles", "fundamentals", "basics", "overview",
-        "architecture", "design pattern", "methodology", "best practices",
-        # Non-executable domains
-        "hr", "human resources", "soft skills", "communication", "aptitude", "reasoning",
-        "verbal", "quantitative", "logical reasoning", "numerical reasoning",
-        # GUI and application development (not executable by Judge0)
-        "swing", "gui", "graphical user interface", "application development",
-        "full application", "file io", "file i/o", "local files", "file system",
-        "operating system theory", "os theory", "dbms theory", "database theory",
-        "computer networks theory", "cn theory", "network theory",
-        # DevOps and infrastructure (not executable code)
-        "devops", "docker", "kubernetes", "ci/cd", "deployment", "infrastructure",
-        "aws", "cloud", "azure", "gcp", "terraform", "ansible",
-        # Testing frameworks (not executable standalone)
-        "jest", "mocha", "junit", "pytest", "testing framework",
-        # Version control and tools
-        "git", "github", "gitlab", "version control"
-    ]
-    
-    topic_lower = topic.lower().strip()
-    
-    # STRICT CHECK: If topic contains non-executable keywords, return False immediately
-    # (unless it explicitly mentions a Judge0 language for execution)
-    for non_kw in non_executable_keywords:
-        if non_kw in topic_lower:
-            # Exception: if topic explicitly mentions a Judge0 language for coding/execution
-            # e.g., "Python programming" or "Java coding" - these support execution
-            has_executable_lang = any(
-                lang in topic_lower and (
-                    "programming" in topic_lower or 
-                    "coding" in topic_lower or 
-                    "code" in topic_lower or
-                    "algorithm" in topic_lower or
-                    "dsa" in topic_lower
-                )
-                for lang in judge0_languages
-            )
-            if not has_executable_lang:
-                return False
-    
-    # Check for Judge0 language names with execution context
-    for lang in judge0_languages:
-        if lang in topic_lower:
-            # Double-check: if it's explicitly theory-only or non-executable, skip
-            if any(non_kw in topic_lower for non_kw in [
-                "theory only", "theory-only", "pure theory", "concepts only",
-                "framework", "library", "ui", "ux", "design"
-            ]):
-                # But allow if it's about programming/execution
-                if "programming" in topic_lower or "coding" in topic_lower or "code" in topic_lower:
-                    return True
-                continue
-            return True
-    
-    # Check for executable coding keywords (only if no non-executable keywords found)
-    for keyword in executable_coding_keywords:
-        if keyword in topic_lower:
-            return True
+    return await _coding_support(topic, topic.lower().strip())
+
+
+async def _coding_support(topic: str, topic_lower: str) -> bool:
+    """determine_topic_coding_support for callers that already normalized the topic."""
+    verdict = _keyword_coding_support(topic_lower)
+    if verdict is not None:
+        return verdict
     
     # Use AI for strict validation (fallback for ambiguous cases)
+    cached = _coding_support_cache.get(topic_lower)
+    if cached is not None:
+        return cached
+
     try:
-        client = _get_client()
-        prompt = f"""Determine if the topic "{topic}" supports coding questions that can be EXECUTED and VALIDATED by Judge0.
+        return await _classify_and_cache_coding_support(topic_lower)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.warning(f"Failed to determine coding support for topic '{topic}' using AI, defaulting to False: {e}")
+        return False
+
+
+@_single_flight
+async def _classify_and_cache_coding_support(topic_key: str) -> bool:
+    """Classify a normalized topic with AI; failures are not cached so the topic is retried next time."""
+    result = await _classify_coding_support_with_ai(topic_key)
+    _store_coding_support_result(topic_key, result)
+    return result
+
+
+def _store_coding_support_result(topic_key: str, result: bool) -> None:
+    if len(_coding_support_cache) >= _CODING_SUPPORT_CACHE_MAX_ENTRIES:
+        _coding_support_cache.clear()
+    _coding_support_cache[topic_key] = result
+
+
+async def _classify_coding_support_with_ai(topic: str) -> bool:
+    """Ask the model whether a topic supports Judge0-executable coding questions."""
+    client = _get_client()
+    prompt = f"""Determine if the topic "{topic}" supports coding questions that can be EXECUTED and VALIDATED by Judge0.
 
 Judge0 can execute code in: C, C++, Java, Python, JavaScript, TypeScript, PHP, Ruby, Swift, Go, Kotlin, Rust, C#, SQL, Bash, Lua, Perl, R, Haskell, Prolog, OCaml, Scala, Groovy, F#, Scheme, Assembly, etc.
 
@@ -472,33 +648,109 @@ Topics that do NOT support coding (NOT executable by Judge0):
 
 Respond with ONLY "true" or "false" (no explanation, no quotes, just the word)."""
 
-        response = await client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert at classifying technical topics for code execution. Be STRICT - only return 'true' if code can be executed by Judge0. Respond with only 'true' or 'false'."
-                },
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.2,  # Lower temperature for stricter validation
-            max_tokens=10
-        )
-        
-        result = response.choices[0].message.content.strip().lower()
-        return result == "true"
-    except Exception as e:
-        logger.warning(f"Failed to determine coding support for topic '{topic}' using AI, defaulting to False: {e}")
-        return False
+    response = await _chat_completion(
+        client,
+        model=_DEFAULT_MODEL,
+        messages=[
+            {
+                "role": "system",
+                "content": "You are an expert at classifying technical topics for code execution. Be STRICT - only return 'true' if code can be executed by Judge0. Respond with only 'true' or 'false'."
+            },
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0,  # Deterministic so repeat topics get the same verdict
+        seed=0,
+        max_tokens=5,
+    )
+    
+    result = response.choices[0].message.content.strip().lower()
+    return result == "true"
 
 
-async def generate_topics_from_selected_skills(skills: List[str], experience_min: str, experience_max: str) -> List[str]:
-    """Generate topics from multiple selected skills/technologies."""
-    if not skills:
-        return []
+# Ambiguous topics classified per prompt by determine_topic_coding_support_many
+_CODING_SUPPORT_BATCH_SIZE = 30
+
+
+async def determine_topic_coding_support_many(topics: List[str]) -> List[bool]:
+    """
+    Determine coding support for several topics, in input order.
     
-    skills_list = ", ".join(skills)
-    prompt = f"""
+    Topics settled by the keyword lists or the per-topic cache are answered locally; the
+    remaining ambiguous topics are classified together, up to _CODING_SUPPORT_BATCH_SIZE
+    per AI call, instead of one call per topic. A batch whose answer cannot be parsed
+    falls back to determine_topic_coding_support for each of its topics.
+    """
+    keys = [topic.lower().strip() for topic in topics]
+    verdicts: Dict[str, bool] = {}
+    ambiguous: Dict[str, str] = {}  # normalized key -> first spelling seen, sent to the model
+    for topic, key in zip(topics, keys):
+        if key in verdicts or key in ambiguous:
+            continue
+        verdict = _keyword_coding_support(key)
+        if verdict is None:
+            verdict = _coding_support_cache.get(key)
+        if verdict is None:
+            ambiguous[key] = topic
+        else:
+            verdicts[key] = verdict
+    
+    pending = list(ambiguous.items())
+    for start in range(0, len(pending), _CODING_SUPPORT_BATCH_SIZE):
+        batch = pending[start:start + _CODING_SUPPORT_BATCH_SIZE]
+        try:
+            results = await _classify_coding_support_batch_with_ai([topic for _, topic in batch])
+        except Exception as e:
+            logger.warning(f"Batch coding-support check failed for {len(batch)} topics, checking one by one: {e}")
+            results = await asyncio.gather(*(_coding_support(topic, key) for key, topic in batch))
+        else:
+            for (key, _), result in zip(batch, results):
+                _store_coding_support_result(key, result)
+        for (key, _), result in zip(batch, results):
+            verdicts[key] = result
+    
+    return [verdicts[key] for key in keys]
+
+
+async def _classify_coding_support_batch_with_ai(topics: List[str]) -> List[bool]:
+    """Classify several topics in one AI call; raises ValueError if the answer doesn't line up."""
+    client = _get_client()
+    numbered = "\n".join(f"{i}. {topic}" for i, topic in enumerate(topics, start=1))
+    prompt = f"""For each numbered topic below, determine if it supports coding questions that can be EXECUTED and VALIDATED by Judge0.
+
+Judge0 can execute code in: C, C++, Java, Python, JavaScript, TypeScript, PHP, Ruby, Swift, Go, Kotlin, Rust, C#, SQL, Bash, Lua, Perl, R, Haskell, Prolog, OCaml, Scala, Groovy, F#, Scheme, Assembly, etc.
+
+Answer true ONLY for topics that involve writing EXECUTABLE CODE (data structures & algorithms, language programming, OOP with code, SQL queries, scripting).
+Answer false for frameworks/libraries, UI/UX and styling, theory subjects, DevOps/tools, testing frameworks, version control, HR/soft skills/aptitude, GUI or full applications, and architecture/design patterns.
+
+Topics:
+{numbered}
+
+Respond with a JSON object {{"results": [...]}} containing exactly {len(topics)} booleans in the same order as the topics, no prose."""
+
+    response = await _chat_completion(
+        client,
+        model=_DEFAULT_MODEL,
+        messages=[
+            {
+                "role": "system",
+                "content": "You are an expert at classifying technical topics for code execution. Be STRICT - only answer true if code can be executed by Judge0. Respond with JSON only."
+            },
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0,
+        seed=0,
+        max_tokens=20 + 8 * len(topics),
+        response_format={"type": "json_object"},
+    )
+    
+    parsed = json.loads(response.choices[0].message.content)
+    results = parsed.get("results") if isinstance(parsed, dict) else None
+    if not isinstance(results, list) or len(results) != len(topics) or not all(isinstance(r, bool) for r in results):
+        raise ValueError(f"expected {len(topics)} booleans, got {str(parsed)[:200]}")
+    return results
+
+
+_TOPICS_FROM_SELECTED_SKILLS_PROMPT = """
 You are an AI assistant that generates assessment topics.
 Based on:
 - Selected Skills/Technologies: {skills_list}
@@ -511,10 +763,22 @@ Each topic should be a single line, starting with "- " or just the topic name.
 Make sure topics are specific to the selected skills.
 """
 
+
+@_single_flight
+async def generate_topics_from_selected_skills(skills: List[str], experience_min: str, experience_max: str) -> List[str]:
+    """Generate topics from multiple selected skills/technologies."""
+    if not skills:
+        return []
+    
+    prompt = _TOPICS_FROM_SELECTED_SKILLS_PROMPT.format(
+        skills_list=", ".join(skills), experience_min=experience_min, experience_max=experience_max
+    )
+
     client = _get_client()
     try:
-        response = await client.chat.completions.create(
-            model="gpt-3.5-turbo",
+        response = await _chat_completion(
+            client,
+            model=_DEFAULT_MODEL,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.7,
         )
@@ -528,9 +792,7 @@ Make sure topics are specific to the selected skills.
     return [t for t in topics if t.strip()]
 
 
-async def generate_topics_from_skill(skill: str, experience_min: str, experience_max: str) -> List[str]:
-    """Generate topics from a single skill/domain input."""
-    prompt = f"""
+_TOPICS_FROM_SKILL_PROMPT = """
 You are an AI assistant that generates assessment topics.
 Based on:
 - Skill/Domain: {skill}
@@ -541,12 +803,20 @@ Output only a simple list (no explanation, no numbering).
 Each topic should be a single line, starting with "- " or just the topic name.
 """
 
+
+@_single_flight
+async def generate_topics_from_skill(skill: str, experience_min: str, experience_max: str) -> List[str]:
+    """Generate topics from a single skill/domain input."""
+    prompt = _TOPICS_FROM_SKILL_PROMPT.format(skill=skill, experience_min=experience_min, experience_max=experience_max)
+
     client = _get_client()
     try:
-        response = await client.chat.completions.create(
-            model="gpt-3.5-turbo",
+        response = await _chat_completion(
+            client,
+            model=_DEFAULT_MODEL,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.7,
+            max_tokens=200,  # 5-8 short topic lines
         )
     except Exception as exc:  # pragma: no cover - external API
         raise HTTPException(status_code=500, detail="Failed to generate topics") from exc
@@ -586,10 +856,13 @@ Do not include any explanation, just the list.
 
     client = _get_client()
     try:
-        response = await client.chat.completions.create(
-            model="gpt-3.5-turbo",
+        response = await _chat_completion(
+            client,
+            model=_DEFAULT_MODEL,
             messages=[{"role": "user", "content": prompt}],
-            temperature=0.3,  # Lower temperature for more consistent results
+            temperature=0,  # Deterministic classification
+            seed=0,
+            max_tokens=32,  # At most five type names
         )
     except Exception as exc:  # pragma: no cover - external API
         # Fallback to safe defaults if AI fails
@@ -612,6 +885,81 @@ Do not include any explanation, just the list.
     return filtered_types
 
 
+# Keyword tables for get_question_type_for_topic, compiled once at import.
+# Coding-related topics
+_QT_CODING_KEYWORDS = (
+    "algorithm", "data structure", "programming", "coding", "code", 
+    "leetcode", "hackerrank", "problem solving", "competitive programming",
+    "array", "linked list", "tree", "graph", "dynamic programming", "dp",
+    "sorting", "searching", "recursion", "backtracking", "greedy",
+    "python", "java", "javascript", "c++", "c#", "go", "rust", "sql",
+    "oops", "oop", "object oriented", "object-oriented", "design pattern", "system design",
+    "inheritance", "polymorphism", "encapsulation", "abstraction", "classes", "objects"
+)
+
+# Subjective/Descriptive topics (theory/conceptual)
+_QT_THEORY_KEYWORDS = (
+    "theory", "concept", "overview", "introduction", "fundamentals",
+    "architecture", "design", "methodology", "process", "framework",
+    "best practices", "principles", "guidelines", "standards"
+)
+
+# Pseudo Code topics (algorithm design without execution)
+_QT_PSEUDO_CODE_KEYWORDS = (
+    "pseudo code", "pseudocode", "algorithm design", "flowchart",
+    "logic", "step by step", "procedure", "methodology"
+)
+
+# MCQ keywords (factual, definition-based, quick assessment topics)
+_QT_MCQ_KEYWORDS = (
+    "definition", "what is", "basics", "fundamentals", "introduction", "overview",
+    "concept", "principles", "features", "characteristics", "types", "kinds",
+    "components", "parts", "elements", "tools", "technologies", "frameworks",
+    "libraries", "packages", "syntax", "keywords", "operators", "data types",
+    "variables", "functions", "methods", "classes", "modules", "imports",
+    "comparison", "difference", "similarities", "advantages", "disadvantages",
+    "benefits", "limitations", "use cases", "examples", "applications"
+)
+
+# Subjective keywords (explanation, reasoning, understanding-based topics)
+_QT_SUBJECTIVE_KEYWORDS = (
+    "explain", "describe", "how", "why", "when", "where", "discuss",
+    "analyze", "evaluate", "compare", "contrast", "elaborate", "detail",
+    "reasoning", "logic", "approach", "strategy", "method", "process",
+    "workflow", "pipeline", "architecture", "design", "pattern", "best practices",
+    "optimization", "performance", "scalability", "security", "testing",
+    "debugging", "troubleshooting", "implementation", "deployment", "maintenance"
+)
+
+# Expand MCQ keywords to include common tech topic patterns
+_QT_EXPANDED_MCQ_RE = _substring_pattern(_QT_MCQ_KEYWORDS + (
+    "framework", "library", "tool", "technology", "language", "platform",
+    "features", "syntax", "api", "component", "module", "package"
+))
+# Expand Subjective keywords to include common explanation patterns
+_QT_EXPANDED_SUBJECTIVE_RE = _substring_pattern(_QT_SUBJECTIVE_KEYWORDS + (
+    "working", "functionality", "mechanism", "operation", "behavior",
+    "lifecycle", "rendering", "state management", "routing", "authentication"
+))
+_QT_CODING_RE = _substring_pattern(_QT_CODING_KEYWORDS)
+_QT_THEORY_RE = _substring_pattern(_QT_THEORY_KEYWORDS)
+_QT_PSEUDO_CODE_RE = _substring_pattern(_QT_PSEUDO_CODE_KEYWORDS)
+_QT_MCQ_RE = _substring_pattern(_QT_MCQ_KEYWORDS)
+_QT_SUBJECTIVE_RE = _substring_pattern(_QT_SUBJECTIVE_KEYWORDS)
+_QT_EXPLICIT_CODING_RE = _substring_pattern(
+    ("leetcode", "hackerrank", "competitive programming", "code solution", "write code", "implement algorithm")
+)
+_QT_EXECUTION_RE = _substring_pattern(
+    ("implementation", "execute", "run", "compile", "debug", "algorithm", "data structure", "dsa", "problem solving")
+)
+_QT_CODING_BASICS_RE = _substring_pattern(
+    ("basics", "fundamentals", "introduction", "overview", "what is", "definition", "features", "syntax")
+)
+_QT_CODING_CONCEPTS_RE = _substring_pattern(
+    ("how", "why", "explain", "describe", "concept", "understanding", "working")
+)
+
+
 async def get_question_type_for_topic(topic: str) -> str:
     """
     Optimized function to determine the most appropriate question type for a specific topic.
@@ -624,91 +972,38 @@ async def get_question_type_for_topic(topic: str) -> str:
     topic_lower = topic.lower().strip()
     
     # Fast keyword-based matching (no AI call needed)
-    # Coding-related topics
-    coding_keywords = [
-        "algorithm", "data structure", "programming", "coding", "code", 
-        "leetcode", "hackerrank", "problem solving", "competitive programming",
-        "array", "linked list", "tree", "graph", "dynamic programming", "dp",
-        "sorting", "searching", "recursion", "backtracking", "greedy",
-        "python", "java", "javascript", "c++", "c#", "go", "rust", "sql",
-        "oops", "oop", "object oriented", "object-oriented", "design pattern", "system design",
-        "inheritance", "polymorphism", "encapsulation", "abstraction", "classes", "objects"
-    ]
-    
-    # Subjective/Descriptive topics (theory/conceptual)
-    theory_keywords = [
-        "theory", "concept", "overview", "introduction", "fundamentals",
-        "architecture", "design", "methodology", "process", "framework",
-        "best practices", "principles", "guidelines", "standards"
-    ]
-    
-    # Pseudo Code topics (algorithm design without execution)
-    pseudo_code_keywords = [
-        "pseudo code", "pseudocode", "algorithm design", "flowchart",
-        "logic", "step by step", "procedure", "methodology"
-    ]
-    
-    # MCQ keywords (factual, definition-based, quick assessment topics)
-    mcq_keywords = [
-        "definition", "what is", "basics", "fundamentals", "introduction", "overview",
-        "concept", "principles", "features", "characteristics", "types", "kinds",
-        "components", "parts", "elements", "tools", "technologies", "frameworks",
-        "libraries", "packages", "syntax", "keywords", "operators", "data types",
-        "variables", "functions", "methods", "classes", "modules", "imports",
-        "comparison", "difference", "similarities", "advantages", "disadvantages",
-        "benefits", "limitations", "use cases", "examples", "applications"
-    ]
-    
-    # Subjective keywords (explanation, reasoning, understanding-based topics)
-    subjective_keywords = [
-        "explain", "describe", "how", "why", "when", "where", "discuss",
-        "analyze", "evaluate", "compare", "contrast", "elaborate", "detail",
-        "reasoning", "logic", "approach", "strategy", "method", "process",
-        "workflow", "pipeline", "architecture", "design", "pattern", "best practices",
-        "optimization", "performance", "scalability", "security", "testing",
-        "debugging", "troubleshooting", "implementation", "deployment", "maintenance"
-    ]
-    
     # PRIORITY ORDER: Check MCQ and Subjective FIRST before coding/descriptive
     # This ensures more variety in question types instead of always defaulting to coding/descriptive
     
     # 1. Check for MCQ topics first (most common for tech topics)
-    # Expand MCQ keywords to include common tech topic patterns
-    expanded_mcq_indicators = mcq_keywords + [
-        "framework", "library", "tool", "technology", "language", "platform",
-        "features", "syntax", "api", "component", "module", "package"
-    ]
-    if any(keyword in topic_lower for keyword in expanded_mcq_indicators):
+    if _QT_EXPANDED_MCQ_RE.search(topic_lower):
         return "MCQ"
     
     # 2. Check for Subjective topics (explanation-based)
-    # Expand Subjective keywords to include common explanation patterns
-    expanded_subjective_indicators = subjective_keywords + [
-        "working", "functionality", "mechanism", "operation", "behavior",
-        "lifecycle", "rendering", "state management", "routing", "authentication"
-    ]
-    if any(keyword in topic_lower for keyword in expanded_subjective_indicators):
+    if _QT_EXPANDED_SUBJECTIVE_RE.search(topic_lower):
         return "Subjective"
     
     # 3. Check for pseudo code topics (algorithm design)
-    if any(keyword in topic_lower for keyword in pseudo_code_keywords):
+    if _QT_PSEUDO_CODE_RE.search(topic_lower):
         return "Pseudo Code"
     
+    # Resolved at most once per call; the keyword branches and the AI fallback all need it
+    coding_supported: Optional[bool] = None
+    
     # 4. Check for explicit coding execution keywords (very specific - only for actual code execution)
-    explicit_coding_keywords = ["leetcode", "hackerrank", "competitive programming", "code solution", "write code", "implement algorithm"]
-    if any(kw in topic_lower for kw in explicit_coding_keywords):
-        coding_supported = await determine_topic_coding_support(topic)
+    if _QT_EXPLICIT_CODING_RE.search(topic_lower):
+        coding_supported = await _coding_support(topic, topic_lower)
         if coding_supported:
             return "coding"
         # If not supported, continue to other checks
     
     # 5. Check for coding-related topics (but be more selective)
     # Only check coding keywords if topic explicitly mentions execution/implementation
-    execution_keywords = ["implementation", "execute", "run", "compile", "debug", "algorithm", "data structure", "dsa", "problem solving"]
-    has_execution_context = any(kw in topic_lower for kw in execution_keywords)
+    has_coding_keyword = _QT_CODING_RE.search(topic_lower) is not None
     
-    if has_execution_context and any(keyword in topic_lower for keyword in coding_keywords):
-        coding_supported = await determine_topic_coding_support(topic)
+    if has_coding_keyword and _QT_EXECUTION_RE.search(topic_lower):
+        if coding_supported is None:
+            coding_supported = await _coding_support(topic, topic_lower)
         if coding_supported:
             # Only return coding if it's explicitly about writing/running code
             return "coding"
@@ -716,28 +1011,33 @@ async def get_question_type_for_topic(topic: str) -> str:
         return "Subjective"
     
     # 6. For topics with coding keywords but no execution context, prefer MCQ/Subjective
-    if any(keyword in topic_lower for keyword in coding_keywords):
+    if has_coding_keyword:
         # Check if it's more about basics/fundamentals (MCQ) or concepts (Subjective)
-        if any(kw in topic_lower for kw in ["basics", "fundamentals", "introduction", "overview", "what is", "definition", "features", "syntax"]):
+        if _QT_CODING_BASICS_RE.search(topic_lower):
             return "MCQ"
-        if any(kw in topic_lower for kw in ["how", "why", "explain", "describe", "concept", "understanding", "working"]):
+        if _QT_CODING_CONCEPTS_RE.search(topic_lower):
             return "Subjective"
         # Default to MCQ for general tech topics
         return "MCQ"
     
     # 7. Check for theory/conceptual topics (but prioritize MCQ/Subjective)
-    if any(keyword in topic_lower for keyword in theory_keywords):
+    if _QT_THEORY_RE.search(topic_lower):
         # Check if it's more about explanation (Subjective) or factual (MCQ)
-        if any(kw in topic_lower for kw in subjective_keywords):
+        if _QT_SUBJECTIVE_RE.search(topic_lower):
             return "Subjective"
-        if any(kw in topic_lower for kw in mcq_keywords):
+        if _QT_MCQ_RE.search(topic_lower):
             return "MCQ"
         # Only use Descriptive if it truly requires comprehensive explanation
         return "Descriptive"
     
     # For ambiguous cases, use AI (but optimized with low temperature and max_tokens)
+    cached = _question_type_cache.get(topic_lower)
+    if cached is not None:
+        return cached
+    
     # First check if topic supports coding before allowing AI to return "coding"
-    coding_supported = await determine_topic_coding_support(topic)
+    if coding_supported is None:
+        coding_supported = await _coding_support(topic, topic_lower)
     
     try:
         client = _get_client()
@@ -790,8 +1090,9 @@ IMPORTANT: Prefer "MCQ" for factual/definition topics and "Subjective" for expla
 Respond with ONLY one word: the question type name (e.g., "MCQ", "Subjective", "Pseudo Code", "Descriptive", or "coding").
 No explanation, just the type name."""
 
-        response = await client.chat.completions.create(
-            model="gpt-3.5-turbo",
+        response = await _chat_completion(
+            client,
+            model=_DEFAULT_MODEL,
             messages=[
                 {
                     "role": "system",
@@ -799,7 +1100,8 @@ No explanation, just the type name."""
                 },
                 {"role": "user", "content": prompt}
             ],
-            temperature=0.2,  # Very low temperature for consistency
+            temperature=0,  # Deterministic classification
+            seed=0,
             max_tokens=15,  # Limit response length for speed
         )
         
@@ -812,7 +1114,10 @@ No explanation, just the type name."""
             # If AI returned "coding" but topic doesn't support coding, change to safe default
             if result == "coding" and not coding_supported:
                 logger.warning(f"AI returned 'coding' for topic '{topic}' but topic doesn't support coding. Changing to 'Subjective'.")
-                return "Subjective"
+                result = "Subjective"
+            if len(_question_type_cache) >= _QUESTION_TYPE_CACHE_MAX_ENTRIES:
+                _question_type_cache.clear()
+            _question_type_cache[topic_lower] = result
             return result
     except Exception as e:
         logger.warning(f"Failed to determine question type for topic '{topic}' using AI, defaulting to MCQ: {e}")
@@ -821,40 +1126,68 @@ No explanation, just the type name."""
     return "MCQ"
 
 
+# Technical/coding skills that support all types including Pseudo Code
+_TECHNICAL_SKILL_RE = _substring_pattern((
+    "programming", "code", "coding", "developer", "software", "algorithm", 
+    "data structure", "python", "java", "javascript", "c++", "c#", "react", 
+    "node", "backend", "frontend", "fullstack", "database", "sql", "api",
+    "framework", "library", "git", "docker", "kubernetes", "aws", "cloud"
+))
+
+# Non-technical skills that don't need Pseudo Code
+_NON_TECHNICAL_SKILL_RE = _substring_pattern((
+    "softskill", "soft skill", "communication", "leadership", "management",
+    "teamwork", "presentation", "negotiation", "sales", "marketing", "hr",
+    "human resources", "training", "coaching", "mentoring"
+))
+
+
 async def get_relevant_question_types(skill: str) -> List[str]:
     """Determine relevant question types based on skill/domain (legacy function for backward compatibility)."""
-    # Technical/coding skills that support all types including Pseudo Code
-    technical_keywords = [
-        "programming", "code", "coding", "developer", "software", "algorithm", 
-        "data structure", "python", "java", "javascript", "c++", "c#", "react", 
-        "node", "backend", "frontend", "fullstack", "database", "sql", "api",
-        "framework", "library", "git", "docker", "kubernetes", "aws", "cloud"
-    ]
-    
-    # Non-technical skills that don't need Pseudo Code
-    non_technical_keywords = [
-        "softskill", "soft skill", "communication", "leadership", "management",
-        "teamwork", "presentation", "negotiation", "sales", "marketing", "hr",
-        "human resources", "training", "coaching", "mentoring"
-    ]
-    
     skill_lower = skill.lower()
     
-    # Check if it's a technical skill
-    is_technical = any(keyword in skill_lower for keyword in technical_keywords)
-    
-    # Check if it's explicitly non-technical
-    is_non_technical = any(keyword in skill_lower for keyword in non_technical_keywords)
-    
-    # Default question types for technical skills
-    all_types = ["MCQ", "Subjective", "Pseudo Code", "Descriptive", "coding"]
-    
     # If it's clearly non-technical, exclude Pseudo Code and coding
-    if is_non_technical and not is_technical:
+    if _NON_TECHNICAL_SKILL_RE.search(skill_lower) and not _TECHNICAL_SKILL_RE.search(skill_lower):
         return ["MCQ", "Subjective", "Descriptive"]
     
     # If it's technical or unclear, include all types including coding
-    return all_types
+    return ["MCQ", "Subjective", "Pseudo Code", "Descriptive", "coding"]
+
+
+# Map Judge0 language IDs to language names for DSA generator
+_LANGUAGE_ID_TO_NAME = {
+    "50": "c",
+    "54": "cpp",
+    "62": "java",
+    "71": "python",
+    "70": "python2",
+    "63": "javascript",
+    "74": "typescript",
+    "68": "php",
+    "72": "ruby",
+    "83": "swift",
+    "60": "go",
+    "78": "kotlin",
+    "73": "rust",
+    "82": "sql",
+    "51": "csharp",
+    "84": "vbnet"
+}
+
+# Map difficulty format (Easy/Medium/Hard to easy/medium/hard)
+_DSA_DIFFICULTIES = {
+    "Easy": "easy",
+    "Medium": "medium",
+    "Hard": "hard"
+}
+
+
+@lru_cache(maxsize=1)
+def _get_dsa_question_generator() -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """Import the DSA generator on first use (lazy import to avoid circular dependencies)."""
+    from ..dsa.services.ai_generator import generate_question
+
+    return generate_question
 
 
 async def generate_coding_question_for_topic(topic: str, difficulty: str, language_id: str) -> Dict[str, Any]:
@@ -866,57 +1199,29 @@ async def generate_coding_question_for_topic(topic: str, difficulty: str, langua
     if not language_id:
         raise ValueError("Language ID is required for coding questions")
     
-    # Map Judge0 language IDs to language names for DSA generator
-    language_id_to_name = {
-        "50": "c",
-        "54": "cpp",
-        "62": "java",
-        "71": "python",
-        "70": "python2",
-        "63": "javascript",
-        "74": "typescript",
-        "68": "php",
-        "72": "ruby",
-        "83": "swift",
-        "60": "go",
-        "78": "kotlin",
-        "73": "rust",
-        "82": "sql",
-        "51": "csharp",
-        "84": "vbnet"
-    }
-    
-    # Map difficulty format (Easy/Medium/Hard to easy/medium/hard)
-    difficulty_map = {
-        "Easy": "easy",
-        "Medium": "medium",
-        "Hard": "hard"
-    }
-    difficulty_lower = difficulty_map.get(difficulty, "medium")
+    difficulty_lower = _DSA_DIFFICULTIES.get(difficulty, "medium")
     
     # Get language name from ID
-    language_name = language_id_to_name.get(language_id)
+    language_name = _LANGUAGE_ID_TO_NAME.get(language_id)
     if not language_name:
         raise ValueError(f"Invalid language ID: {language_id}")
     
-    # Import DSA generator (lazy import to avoid circular dependencies)
-    # Use absolute import to avoid issues
     try:
-        import importlib
-        dsa_module = importlib.import_module("app.dsa.services.ai_generator")
-        generate_dsa_question = dsa_module.generate_question
+        generate_dsa_question = _get_dsa_question_generator()
     except ImportError as e:
         logger.error(f"Failed to import DSA generator: {e}")
         raise ValueError(f"Failed to import DSA question generator: {e}") from e
     
     try:
-        # Generate question using DSA generator
-        question_data = await generate_dsa_question(
-            difficulty=difficulty_lower,
-            topic=topic,
-            concepts=None,
-            languages=[language_name]
-        )
+        # Generate question using DSA generator. It calls OpenAI through its own sync client
+        # in a worker thread, so take a _chat_semaphore slot here to stay under the shared cap
+        async with _chat_semaphore:
+            question_data = await generate_dsa_question(
+                difficulty=difficulty_lower,
+                topic=topic,
+                concepts=None,
+                languages=[language_name]
+            )
         
         # Validate that we got valid data
         if not question_data or not isinstance(question_data, dict):
@@ -979,91 +1284,25 @@ async def generate_coding_question_for_topic(topic: str, difficulty: str, langua
         raise Exception(f"Failed to generate coding question: {str(e)}") from e
 
 
-async def generate_questions_for_topic(topic: str, config: Dict[str, Any], coding_supported: bool = True) -> List[Dict[str, Any]]:
-    num_questions = config.get("numQuestions")
-    if not topic or not num_questions or num_questions <= 0:
-        return []
-    
-    # Check if this is a coding question type
-    question_type = config.get("Q1type", "Subjective")
-    if question_type == "coding":
-        # Validate that topic supports coding
-        if not coding_supported:
-            logger.warning(f"Coding question requested for topic '{topic}' which does not support coding. Skipping.")
-            return []
-        # Generate coding questions using DSA-style generation
-        difficulty = config.get("Q1difficulty", "Medium")
-        language_id = config.get("language")  # No default - must be specified
-        
-        # Language must be specified for coding questions
-        if not language_id:
-            logger.warning(f"Language not specified for coding question on topic: {topic}. Skipping generation.")
-            return []
-        
-        questions = []
-        for i in range(num_questions):
-            try:
-                coding_question = await generate_coding_question_for_topic(topic, difficulty, language_id)
-                questions.append(coding_question)
-            except ValueError as e:
-                # Language validation error - skip this question
-                logger.warning(f"Invalid language for coding question {i+1} on topic {topic}: {e}")
-                continue
-            except Exception as e:
-                logger.error(f"Error generating coding question {i+1}: {e}")
-                # Add fallback question only if we have a valid language_id
-                if language_id:
-                    questions.append({
-                        "questionText": f"Write a program to solve a problem related to {topic}.",
-                        "type": "coding",
-                        "difficulty": difficulty,
-                        "judge0_enabled": True,
-                        "language": language_id,
-                    })
-        return questions
-
-    question_config = []
-    for i in range(1, num_questions + 1):
-        q_type = config.get(f"Q{i}type", "Subjective")
-        difficulty = config.get(f"Q{i}difficulty", "Easy")
-        question_config.append({"type": q_type, "difficulty": difficulty})
-
-    # Build detailed configuration list with paragraph requirements
-    config_list_parts = []
-    for idx, qc in enumerate(question_config):
-        para_req = _get_paragraph_requirements(qc["difficulty"])
-        config_list_parts.append(
-            f"{idx + 1}. {qc['type']} ({qc['difficulty']}) - {para_req['description']}"
-        )
-    config_list = "; ".join(config_list_parts)
-
-    # Build paragraph requirements description for the prompt
-    para_requirements_text = "\n".join([
-        f"- {difficulty}: {_get_paragraph_requirements(difficulty)['description']}"
-        for difficulty in ["Easy", "Medium", "Hard"]
-    ])
-
-    # Determine if this is an aptitude topic based on topic name
-    aptitude_topics = ["Quantitative", "Logical Reasoning", "Verbal Ability", "Numerical Reasoning"]
-    is_aptitude = any(apt_topic.lower() in topic.lower() for apt_topic in aptitude_topics)
-    
-    # Check if all questions are MCQ (indicates aptitude)
-    all_mcq = all(config.get(f"Q{i}type", "") == "MCQ" for i in range(1, num_questions + 1))
-    is_aptitude = is_aptitude or all_mcq
-    
-    question_type_label = "aptitude" if is_aptitude else "technical"
-    
-    prompt = f"""
-You are an expert assessment writer with years of experience creating high-quality technical and aptitude assessments. 
-Generate {num_questions} high-quality {question_type_label} questions for the topic "{topic}".
+# Paragraph requirements description for the question-generation prompt
+_PARAGRAPH_REQUIREMENTS_TEXT = "\n".join(
+    f"- {difficulty}: {_PARAGRAPH_REQUIREMENTS[difficulty]['description']}"
+    for difficulty in ("Easy", "Medium", "Hard")
+)
+_APTITUDE_TOPIC_RE = _substring_pattern(
+    ("Quantitative", "Logical Reasoning", "Verbal Ability", "Numerical Reasoning"), flags=re.IGNORECASE
+)
+# Last-resort extraction of flat question objects from a malformed response
+_QUESTION_OBJECT_RE = re.compile(r'\{[^{}]*"questionText"[^{}]*\}', re.DOTALL)
 
-CRITICAL REQUIREMENTS - READ CAREFULLY:
 
-QUESTION CONFIGURATION:
-{config_list}
+# Static instructions for generate_questions_for_topic, sent as the system message so the
+# long shared prefix is byte-identical on every call and eligible for OpenAI prompt caching;
+# the per-topic request goes in the user message
+_QUESTION_GENERATION_SYSTEM_PROMPT = f"""You are an expert assessment writer with years of experience creating high-quality technical and aptitude assessments. Always output valid JSON arrays. Never include markdown code blocks or explanations outside the JSON.
 
 PARAGRAPH REQUIREMENTS BY DIFFICULTY (STRICT - MUST FOLLOW):
-{para_requirements_text}
+{_PARAGRAPH_REQUIREMENTS_TEXT}
 
 QUALITY STANDARDS (MANDATORY):
 1. **Question Authenticity**: 
@@ -1134,7 +1373,7 @@ Reasoning Questions:
 - Should require critical thinking
 
 OUTPUT FORMAT:
-You MUST output a valid JSON array containing exactly {num_questions} question objects.
+You MUST output a valid JSON array containing exactly the requested number of question objects.
 Each question object must be complete with all required fields based on its type.
 
 EXAMPLE STRUCTURE (DO NOT COPY, USE AS REFERENCE):
@@ -1155,7 +1394,7 @@ EXAMPLE STRUCTURE (DO NOT COPY, USE AS REFERENCE):
 ]
 
 CRITICAL REMINDERS:
-- Generate EXACTLY {num_questions} questions
+- Generate EXACTLY the requested number of questions
 - Follow paragraph requirements STRICTLY (1 for Easy, 2 for Medium, 3 for Hard)
 - Ensure all required fields are present based on question type
 - Make questions high-quality, realistic, and professionally relevant
@@ -1163,6 +1402,94 @@ CRITICAL REMINDERS:
 - Output ONLY valid JSON - no markdown, no explanations, just the JSON array
 """
 
+
+async def _generate_coding_questions(topic: str, config: Dict[str, Any], num_questions: int) -> List[Dict[str, Any]]:
+    """Generate a topic's coding questions with the DSA generator (one call per question)."""
+    # Generate coding questions using DSA-style generation
+    difficulty = config.get("Q1difficulty", "Medium")
+    language_id = config.get("language")  # No default - must be specified
+    
+    # Language must be specified for coding questions
+    if not language_id:
+        logger.warning(f"Language not specified for coding question on topic: {topic}. Skipping generation.")
+        return []
+    
+    # Questions are independent, so generate them concurrently; each DSA call holds a
+    # _chat_semaphore slot (see generate_coding_question_for_topic)
+    results = await asyncio.gather(
+        *(generate_coding_question_for_topic(topic, difficulty, language_id) for _ in range(num_questions)),
+        return_exceptions=True,
+    )
+    questions = []
+    for i, result in enumerate(results):
+        if not isinstance(result, BaseException):
+            questions.append(result)
+        elif isinstance(result, ValueError):
+            # Language validation error - skip this question
+            logger.warning(f"Invalid language for coding question {i+1} on topic {topic}: {result}")
+        elif not isinstance(result, Exception):
+            raise result
+        else:
+            logger.error(f"Error generating coding question {i+1}: {result}")
+            # Add fallback question only if we have a valid language_id
+            if language_id:
+                questions.append({
+                    "questionText": f"Write a program to solve a problem related to {topic}.",
+                    "type": "coding",
+                    "difficulty": difficulty,
+                    "judge0_enabled": True,
+                    "language": language_id,
+                })
+    return questions
+
+
+async def generate_questions_for_topic(topic: str, config: Dict[str, Any], coding_supported: bool = True) -> List[Dict[str, Any]]:
+    num_questions = config.get("numQuestions")
+    if not topic or not num_questions or num_questions <= 0:
+        return []
+    
+    # Check if this is a coding question type
+    if config.get("Q1type", "Subjective") == "coding":
+        # Validate that topic supports coding
+        if not coding_supported:
+            logger.warning(f"Coding question requested for topic '{topic}' which does not support coding. Skipping.")
+            return []
+        return await _generate_coding_questions(topic, config, num_questions)
+
+    question_config = []
+    for i in range(1, num_questions + 1):
+        q_type = config.get(f"Q{i}type", "Subjective")
+        difficulty = config.get(f"Q{i}difficulty", "Easy")
+        question_config.append({"type": q_type, "difficulty": difficulty})
+
+    # Build detailed configuration list with paragraph requirements
+    config_list = "; ".join(
+        f"{idx}. {qc['type']} ({qc['difficulty']}) - {_get_paragraph_requirements(qc['difficulty'])['description']}"
+        for idx, qc in enumerate(question_config, 1)
+    )
+
+    # Determine if this is an aptitude topic based on topic name
+    is_aptitude = _APTITUDE_TOPIC_RE.search(topic) is not None
+    
+    # Check if all questions are MCQ (indicates aptitude)
+    is_aptitude = is_aptitude or all(qc["type"] == "MCQ" for qc in question_config)
+    
+    question_type_label = "aptitude" if is_aptitude else "technical"
+    
+    prompt = f"""Generate {num_questions} high-quality {question_type_label} questions for the topic "{topic}".
+
+QUESTION CONFIGURATION:
+{config_list}
+
+Output exactly {num_questions} question objects in a single JSON array.
+"""
+
+    # Easy-only batches don't need the larger model
+    if all(qc["difficulty"] == "Easy" for qc in question_config):
+        model = _DEFAULT_MODEL
+    else:
+        model = _QUESTION_MODEL
+    
     client = _get_client()
     max_retries = 3
     last_error = None
@@ -1184,11 +1511,11 @@ CRITICAL REMINDERS:
                 total_tokens += max_tokens_per_question.get(qc["difficulty"], 1000)
             total_tokens += 1000  # Buffer for JSON structure and formatting
             
-            # Use gpt-4o-mini for better quality, with higher token limit
-            response = await client.chat.completions.create(
-                model="gpt-4o",
+            response = await _chat_completion(
+                client,
+                model=model,
                 messages=[
-                    {"role": "system", "content": "You are an expert assessment writer. Always output valid JSON arrays. Never include markdown code blocks or explanations outside the JSON."},
+                    {"role": "system", "content": _QUESTION_GENERATION_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.7,
@@ -1197,50 +1524,48 @@ CRITICAL REMINDERS:
             break  # Success, exit retry loop
         except Exception as exc:  # pragma: no cover - external API
             last_error = exc
-            if attempt < max_retries - 1:
-                # Wait before retry (exponential backoff)
-                await asyncio.sleep(2 ** attempt)
+            # The SDK has already retried 429/5xx/timeouts honoring Retry-After; other
+            # 4xx errors (bad request, auth, permissions) fail the same way every time
+            status_code = getattr(exc, "status_code", None)
+            retryable = status_code is None or status_code == 429 or status_code >= 500
+            if retryable and attempt < max_retries - 1:
+                # Wait before retry (exponential backoff, jittered so concurrent topics don't retry in lockstep)
+                await asyncio.sleep(2 ** attempt + random.uniform(0, 1))
                 continue
             else:
-                raise HTTPException(status_code=500, detail=f"Failed to generate questions after {max_retries} attempts: {str(exc)}") from exc
+                raise HTTPException(status_code=500, detail=f"Failed to generate questions after {attempt + 1} attempts: {str(exc)}") from exc
 
     raw = response.choices[0].message.content.strip() if response.choices else ""
     
     # Clean up markdown code blocks if present
-    if raw.startswith("```json"):
-        raw = raw[7:]  # Remove ```json
-    elif raw.startswith("```"):
-        raw = raw[3:]  # Remove ```
-    if raw.endswith("```"):
-        raw = raw[:-3]  # Remove trailing ```
-    raw = raw.strip()
+    raw = raw.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
 
     parsed: Any = None
     questions: List[Dict[str, Any]] = []
     
-    # Try parsing as JSON
+    # Try parsing as JSON (orjson: the multi-question payload is the largest response we parse)
     try:
-        parsed = json.loads(raw)
-    except json.JSONDecodeError:
+        parsed = orjson.loads(raw)
+    except orjson.JSONDecodeError:
         # Try to extract JSON array from text
         if "[" in raw and "]" in raw:
             start_idx = raw.find("[")
             end_idx = raw.rfind("]") + 1
             try:
-                parsed = json.loads(raw[start_idx:end_idx])
-            except json.JSONDecodeError:
+                parsed = orjson.loads(raw[start_idx:end_idx])
+            except orjson.JSONDecodeError:
                 pass
     
     # Parse the result
     if parsed is None:
         # Last resort: try to find and parse individual question objects
-        json_objects = re.findall(r'\{[^{}]*"questionText"[^{}]*\}', raw, re.DOTALL)
+        json_objects = _QUESTION_OBJECT_RE.findall(raw)
         for obj_str in json_objects:
             try:
-                obj = json.loads(obj_str)
+                obj = orjson.loads(obj_str)
                 if isinstance(obj, dict) and obj.get("questionText"):
                     questions.append(obj)
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 continue
     elif isinstance(parsed, list):
         questions = [q for q in parsed if isinstance(q, dict) and q.get("questionText")]
@@ -1257,14 +1582,9 @@ CRITICAL REMINDERS:
                     questions.extend([q for q in v if isinstance(q, dict) and q.get("questionText")])
                     break
 
-    # Validate and clean questions
+    # Validate and clean questions (extraction above only keeps dicts with questionText)
     validated_questions = []
     for q in questions:
-        if not isinstance(q, dict):
-            continue
-        if not q.get("questionText"):
-            continue
-        
         # Ensure required fields based on type
         q_type = q.get("type", "").strip()
         q["type"] = q_type
@@ -1272,17 +1592,14 @@ CRITICAL REMINDERS:
         
         # Validate MCQ questions have options and correctAnswer
         if q_type == "MCQ":
-            if not q.get("options") or not isinstance(q.get("options"), list) or len(q.get("options", [])) < 2:
+            options = q.get("options")
+            if not isinstance(options, list) or len(options) < 2:
                 continue  # Skip invalid MCQ
             if not q.get("correctAnswer"):
-                # Try to infer from options
-                if q.get("options"):
-                    q["correctAnswer"] = "A"  # Default to first option
-                else:
-                    continue
+                q["correctAnswer"] = "A"  # Default to first option
         
         # Validate Subjective/Descriptive have idealAnswer
-        if q_type in ["Subjective", "Descriptive"]:
+        if q_type in ("Subjective", "Descriptive"):
             if not q.get("idealAnswer"):
                 q["idealAnswer"] = "Answer not provided."
         
@@ -1334,8 +1651,9 @@ Respond ONLY with a JSON object in this exact format:
 
     client = _get_client()
     try:
-        response = await client.chat.completions.create(
-            model="gpt-3.5-turbo",
+        response = await _chat_completion(
+            client,
+            model=_GRADING_MODEL,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3,
         )
@@ -1407,8 +1725,15 @@ async def evaluate_answer_with_ai(
         
         # Check if answer is identical or very similar to question
         if question_normalized and answer_normalized:
-            # Use SequenceMatcher for accurate similarity calculation
-            similarity = SequenceMatcher(None, question_normalized, answer_normalized).ratio()
+            # Use SequenceMatcher for accurate similarity calculation. real_quick_ratio/quick_ratio
+            # are cheap upper bounds on ratio(), so the quadratic ratio() only runs when the
+            # answer could still reach the lowest (60%) threshold below; a long genuine answer
+            # fails the length-based bound immediately.
+            matcher = SequenceMatcher(None, question_normalized, answer_normalized)
+            if matcher.real_quick_ratio() >= 0.60 and matcher.quick_ratio() >= 0.60:
+                similarity = matcher.ratio()
+            else:
+                similarity = 0.0
             
             # Check 1: Exact match or very high similarity (80%+)
             if similarity >= 0.80:
@@ -1505,8 +1830,9 @@ Respond ONLY with the JSON object, no additional text.
 
     client = _get_client()
     try:
-        response = await client.chat.completions.create(
-            model="gpt-3.5-turbo",
+        response = await _chat_completion(
+            client,
+            model=_GRADING_MODEL,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3,
         )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import datetime
+import hashlib
+from datetime import datetime, timezone
 from typing import Any, Dict, Iterable, List, Optional
 
 from bson import ObjectId
@@ -17,10 +18,31 @@ def to_object_id(value: str | ObjectId | None) -> Optional[ObjectId]:
         raise ValueError("Invalid ObjectId string") from exc
 
 
+def build_candidate_key(email: str, name: str) -> str:
+    """Key for a candidate's entry in an assessment's answerLogs/candidateResponses maps.
+
+    The email is lowercased and stripped and the name stripped first, so any spelling
+    of the same candidate maps to one key. Emails contain "." (a MongoDB path separator)
+    and names may contain "$", so the normalized pair is hashed into a fixed-size hex
+    key that is safe to use in dotted update paths.
+    """
+    email, name = email.strip().lower(), name.strip()
+    return hashlib.blake2b(f"{email}\x00{name}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+def legacy_candidate_key(email: str, name: str) -> str:
+    """Pre-hash ``email_name`` candidate key, still present on older assessment documents."""
+    return f"{email.strip().lower()}_{name.strip()}"
+
+
 def _convert_object_ids(value: Any) -> Any:
     if isinstance(value, ObjectId):
         return str(value)
     if isinstance(value, datetime):
+        # PyMongo returns naive UTC datetimes; tag them so the string matches what
+        # ORJSONResponse (OPT_NAIVE_UTC) emits for datetimes it serializes itself
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
         return value.isoformat()
     if isinstance(value, list):
         return [_convert_object_ids(item) for item in value]
@@ -34,6 +56,19 @@ def convert_object_ids(value: Any) -> Any:
     return _convert_object_ids(value)
 
 
+def serialized_id_stages(*hidden_fields: str) -> List[Dict[str, Any]]:
+    """Aggregation stages that shape documents like serialize_document, server-side.
+
+    _id is exposed as a string ``id`` and hidden_fields are dropped; remaining
+    ObjectIds and datetimes are encoded by ORJSONResponse, so list endpoints can
+    return documents straight from the cursor without a per-document Python pass.
+    """
+    return [
+        {"$set": {"id": {"$toString": "$_id"}}},
+        {"$unset": ["_id", *hidden_fields]},
+    ]
+
+
 def serialize_document(document: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     if document is None:
         return None
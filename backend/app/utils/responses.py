@@ -2,12 +2,35 @@ from __future__ import annotations
 
 from typing import Any
 
+import orjson
+from bson import ObjectId
 from fastapi.responses import JSONResponse
 
 
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson; ObjectIds are encoded as strings.
+
+    BSON dates come back from Mongo as naive UTC datetimes, so they are
+    rendered with an explicit +00:00 offset.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC,
+        )
+
+
 def success_response(message: str, data: Any = None, status_code: int = 200) -> JSONResponse:
-    return JSONResponse(status_code=status_code, content={"success": True, "message": message, "data": data})
+    return ORJSONResponse(status_code=status_code, content={"success": True, "message": message, "data": data})
 
 
 def error_response(message: str, status_code: int = 400, data: Any = None) -> JSONResponse:
-    return JSONResponse(status_code=status_code, content={"success": False, "message": message, "data": data})
+    return ORJSONResponse(status_code=status_code, content={"success": False, "message": message, "data": data})
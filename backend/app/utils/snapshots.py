@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import Binary, ObjectId
+from pymongo.asynchronous.database import AsyncDatabase
+
+logger = logging.getLogger(__name__)
+
+# Snapshot images live outside proctor_events so the event collection stays small;
+# one document per event ({_id: snapshotId, data, contentType, createdAt}) expired by TTL
+SNAPSHOT_COLLECTION = "proctor_snapshots"
+SNAPSHOT_RETENTION_SECONDS = 90 * 24 * 60 * 60
+
+
+def split_snapshot_data_uri(snapshot: str) -> Tuple[str, str]:
+    """Split a snapshot into (media type, raw base64); bare base64 is assumed PNG."""
+    if snapshot.startswith("data:") and "," in snapshot:
+        header, encoded = snapshot.split(",", 1)
+        media_type = header[len("data:"):].split(";", 1)[0] or "image/png"
+        return media_type, encoded
+    return "image/png", snapshot
+
+
+async def store_snapshot(
+    db: AsyncDatabase,
+    event_id: ObjectId,
+    snapshot: str,
+    created_at: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """
+    Decode a base64 snapshot once and store the bytes in the snapshot collection.
+
+    Returns the fields to set on the proctor event: snapshotId/snapshotContentType, or
+    snapshotBase64 unchanged if the payload is not valid base64 (so the event is never lost).
+    created_at drives the TTL expiry and defaults to now.
+    """
+    media_type, encoded = split_snapshot_data_uri(snapshot)
+    try:
+        snapshot_bytes = base64.b64decode(encoded)
+    except (binascii.Error, ValueError) as decode_error:
+        logger.warning(f"[Proctor] Snapshot for event {event_id} is not valid base64, storing inline: {decode_error}")
+        return {"snapshotBase64": snapshot}
+
+    await db[SNAPSHOT_COLLECTION].replace_one(
+        {"_id": event_id},
+        {
+            "data": Binary(snapshot_bytes),
+            "contentType": media_type,
+            "createdAt": created_at or datetime.now(timezone.utc),
+        },
+        upsert=True,
+    )
+    return {"snapshotId": event_id, "snapshotContentType": media_type}
+
+
+async def load_snapshots(db: AsyncDatabase, snapshot_ids: List[Any]) -> Dict[Any, bytes]:
+    """Fetch snapshot bytes by snapshotId in one query. Expired or missing snapshots are left out."""
+    if not snapshot_ids:
+        return {}
+    images: Dict[Any, bytes] = {}
+    async for doc in db[SNAPSHOT_COLLECTION].find({"_id": {"$in": snapshot_ids}}, {"data": 1}):
+        images[doc["_id"]] = bytes(doc["data"])
+    return images
@@ -25,9 +25,14 @@ export interface ProctorLog {
   timestamp: string;
   metadata?: Record<string, unknown>;
   snapshotBase64?: string;
+  hasSnapshot?: boolean;
   receivedAt?: string;
 }
 
+// Snapshot images are not included in the logs; load each one by event id when shown
+export const proctorSnapshotUrl = (eventId: string): string =>
+  `/api/proctor/snapshot/${encodeURIComponent(eventId)}`;
+
 export interface ProctorSummary {
   summary: Record<string, number>;
   totalViolations: number;
@@ -151,7 +156,7 @@ export function useProctorPolling({
 
       // Fetch logs
       const logsResponse = await axios.get(
-        `/api/proctor/logs?assessmentId=${encodeURIComponent(assessmentId)}&userId=${encodeURIComponent(userId)}`
+        `/api/proctor/logs?assessmentId=${encodeURIComponent(assessmentId)}&userId=${encodeURIComponent(userId)}&limit=1000`
       );
 
       if (!isMountedRef.current) return;
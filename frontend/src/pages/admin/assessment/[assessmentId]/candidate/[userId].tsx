@@ -6,7 +6,7 @@ import { requireAuth } from "../../../../../lib/auth";
 import Link from "next/link";
 import axios from "axios";
 import ProctorSummaryCard from "../../../../../components/admin/ProctorSummaryCard";
-import { useProctorPolling, EVENT_TYPE_LABELS, type ProctorLog } from "../../../../../hooks/useProctorPolling";
+import { useProctorPolling, EVENT_TYPE_LABELS, proctorSnapshotUrl, type ProctorLog } from "../../../../../hooks/useProctorPolling";
 
 interface CandidateData {
   email: string;
@@ -304,7 +304,7 @@ export default function CandidateProctorPage() {
     );
   }
 
-  const snapshotsWithImages = proctorLogs.filter((v) => v.snapshotBase64) || [];
+  const snapshotsWithImages = proctorLogs.filter((v) => v.hasSnapshot) || [];
 
   return (
     <div style={{ backgroundColor: "#f1f5f9", minHeight: "100vh", padding: "2rem" }}>
@@ -697,7 +697,7 @@ export default function CandidateProctorPage() {
                   >
                     {eventTypeLabels[log.eventType] || log.eventType}
                   </span>
-                  {log.snapshotBase64 && (
+                  {log.hasSnapshot && (
                     <button
                       type="button"
                       onClick={() => setSelectedSnapshot(log)}
@@ -1116,7 +1116,8 @@ export default function CandidateProctorPage() {
                     </div>
                     <div style={{ padding: "0.5rem" }}>
                       <img
-                        src={log.snapshotBase64}
+                        src={proctorSnapshotUrl(log._id)}
+                        loading="lazy"
                         alt={`Snapshot for ${log.eventType}`}
                         style={{
                           width: "100%",
@@ -1199,9 +1200,9 @@ export default function CandidateProctorPage() {
                 ×
               </button>
             </div>
-            {selectedSnapshot.snapshotBase64 && (
+            {selectedSnapshot.hasSnapshot && (
               <img
-                src={selectedSnapshot.snapshotBase64}
+                src={proctorSnapshotUrl(selectedSnapshot._id)}
                 alt={`Full snapshot for ${selectedSnapshot.eventType}`}
                 style={{
                   maxWidth: "100%",
@@ -16,7 +16,7 @@ export default async function handler(
   }
 
   try {
-    const { assessmentId, userId } = req.query;
+    const { assessmentId, userId, limit, skip, include_snapshots } = req.query;
 
     // Validate required fields
     if (!assessmentId || !userId) {
@@ -32,10 +32,19 @@ export default async function handler(
 
     console.log(`[Proctor API] Fetching logs for assessment=${assessmentIdStr}, user=${userIdStr}`);
 
+    // Forward optional pagination / snapshot flags to the backend
+    const params: Record<string, string> = {};
+    if (limit) params.limit = Array.isArray(limit) ? limit[0] : limit;
+    if (skip) params.skip = Array.isArray(skip) ? skip[0] : skip;
+    if (include_snapshots) {
+      params.include_snapshots = Array.isArray(include_snapshots) ? include_snapshots[0] : include_snapshots;
+    }
+
     // Call backend FastAPI
     const backendResponse = await axios.get(
       `${BACKEND_URL}/api/proctor/logs/${encodeURIComponent(assessmentIdStr)}/${encodeURIComponent(userIdStr)}`,
       {
+        params,
         headers: {
           "Content-Type": "application/json",
         },
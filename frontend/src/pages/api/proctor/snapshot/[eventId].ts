@@ -0,0 +1,49 @@
+import type { NextApiRequest, NextApiResponse } from "next";
+import axios from "axios";
+
+const BACKEND_URL = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000";
+
+export default async function handler(
+  req: NextApiRequest,
+  res: NextApiResponse
+) {
+  // Only accept GET requests
+  if (req.method !== "GET") {
+    return res.status(405).json({ 
+      success: false, 
+      message: "Method not allowed" 
+    });
+  }
+
+  try {
+    const { eventId } = req.query;
+    const eventIdStr = Array.isArray(eventId) ? eventId[0] : eventId;
+
+    if (!eventIdStr) {
+      return res.status(400).json({
+        success: false,
+        message: "Missing required path parameter: eventId",
+      });
+    }
+
+    // Call backend FastAPI; the snapshot comes back as raw image bytes
+    const backendResponse = await axios.get(
+      `${BACKEND_URL}/api/proctor/snapshot/${encodeURIComponent(eventIdStr)}`,
+      {
+        responseType: "arraybuffer",
+        timeout: 30000, // 30 second timeout
+      }
+    );
+
+    res.setHeader("Content-Type", backendResponse.headers["content-type"] || "image/png");
+    res.setHeader("Cache-Control", backendResponse.headers["cache-control"] || "private, max-age=86400");
+    return res.status(200).send(Buffer.from(backendResponse.data));
+  } catch (error: any) {
+    console.error("[Proctor API] Error fetching snapshot:", error.message);
+
+    return res.status(error.response?.status || 500).json({
+      success: false,
+      message: error.message || "Failed to fetch proctoring snapshot",
+    });
+  }
+}
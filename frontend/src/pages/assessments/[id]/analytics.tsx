@@ -10,6 +10,7 @@ import axios from 'axios'
 import { ArrowLeft, AlertTriangle, Clock, Video } from 'lucide-react'
 import { MultiProctorGrid } from '@/components/proctor/MultiProctorGrid'
 import { useMultiLiveProctorAdmin } from '@/hooks/useMultiLiveProctorAdmin'
+import { proctorSnapshotUrl } from '@/hooks/useProctorPolling'
 
 interface AnswerLog {
   answer: string
@@ -175,7 +176,7 @@ export default function AnalyticsPage() {
     
     setLoadingProctorLogs(true)
     try {
-      const response = await fetch(`/api/proctor/logs?assessmentId=${encodeURIComponent(assessmentId)}&userId=${encodeURIComponent(email)}`)
+      const response = await fetch(`/api/proctor/logs?assessmentId=${encodeURIComponent(assessmentId)}&userId=${encodeURIComponent(email)}&limit=1000`)
       const data = await response.json()
       
       if (data.success && data.data) {
@@ -785,11 +786,12 @@ export default function AnalyticsPage() {
                             </div>
                           )}
 
-                          {log.snapshotBase64 && (
+                          {log.hasSnapshot && (
                             <div style={{ marginTop: "0.75rem" }}>
                               <div style={{ fontSize: "0.75rem", color: "#64748b", marginBottom: "0.5rem" }}>Evidence Snapshot:</div>
                               <img
-                                src={log.snapshotBase64.startsWith("data:") ? log.snapshotBase64 : `data:image/png;base64,${log.snapshotBase64}`}
+                                src={proctorSnapshotUrl(log._id)}
+                                loading="lazy"
                                 alt="Violation snapshot"
                                 style={{ maxWidth: "100%", height: "auto", borderRadius: "0.375rem", border: "1px solid #e2e8f0", maxHeight: "200px" }}
                                 onError={(e) => {
@@ -8,6 +8,7 @@ import { Button } from '../../../../components/dsa/ui/button'
 import dsaApi from '../../../../lib/dsa/api'
 import { ArrowLeft, Lightbulb, CheckCircle2, TrendingUp, AlertTriangle, Eye, Clock, Video } from 'lucide-react'
 import { HumanProctorPanel } from '@/components/proctor/HumanProctorPanel'
+import { proctorSnapshotUrl } from '@/hooks/useProctorPolling'
 
 interface AIFeedback {
   overall_score?: number
@@ -120,7 +121,7 @@ export default function AnalyticsPage() {
     setLoadingProctorLogs(true)
     try {
       // Use testId as assessmentId (as per how proctor events are recorded)
-      const response = await fetch(`/api/proctor/logs?assessmentId=${encodeURIComponent(testId)}&userId=${encodeURIComponent(userId)}`)
+      const response = await fetch(`/api/proctor/logs?assessmentId=${encodeURIComponent(testId)}&userId=${encodeURIComponent(userId)}&limit=1000`)
       const data = await response.json()
       
       if (data.success && data.data) {
@@ -527,11 +528,12 @@ export default function AnalyticsPage() {
                               </div>
                             )}
 
-                            {log.snapshotBase64 && (
+                            {log.hasSnapshot && (
                               <div className="mt-3">
                                 <div className="text-xs text-muted-foreground mb-2">Evidence Snapshot:</div>
                                 <img
-                                  src={log.snapshotBase64.startsWith("data:") ? log.snapshotBase64 : `data:image/png;base64,${log.snapshotBase64}`}
+                                  src={proctorSnapshotUrl(log._id)}
+                                  loading="lazy"
                                   alt="Violation snapshot"
                                   className="max-w-full h-auto rounded border border-slate-700"
                                   style={{ maxHeight: '200px' }}